@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import time
+from collections import OrderedDict
+from typing import Hashable, Tuple
+
+from ..Objects import OSMChangeset
+from ..Objects import OSMNote
+from ..Objects import OSMUser
+
+
+class OSMMemoryCache:
+    """
+    In memory cache of fetched objects, with a maximum size (least recently used objects are evicted first) and a
+    time to live depending on each object type.
+    Closed changesets can't be modified anymore, so they are kept until evicted, unless they include their discussion
+    which can still be commented.
+    """
+
+    def __init__(
+            self,
+            max_size: int = 10000,
+            user_ttl: float = 3600,
+            open_note_ttl: float = 60,
+            closed_note_ttl: float = 3600,
+            open_changeset_ttl: float = 60,
+            discussion_ttl: float = 600
+    ) -> None:
+        """
+        :param max_size: Maximum number of objects stored
+        :param user_ttl: Number of seconds an OSMUser is kept
+        :param open_note_ttl: Number of seconds an open OSMNote is kept
+        :param closed_note_ttl: Number of seconds a closed OSMNote is kept (it can still be reopened)
+        :param open_changeset_ttl: Number of seconds an open OSMChangeset is kept
+        :param discussion_ttl: Number of seconds a closed OSMChangeset including its discussion is kept (it can still be
+        commented)
+        """
+
+        self.max_size: int = max_size
+
+        self.user_ttl: float = user_ttl
+        self.open_note_ttl: float = open_note_ttl
+        self.closed_note_ttl: float = closed_note_ttl
+        self.open_changeset_ttl: float = open_changeset_ttl
+        self.discussion_ttl: float = discussion_ttl
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+        # key -> (expiration monotonic time or None if it never expires, value)
+        self._entries: OrderedDict[Hashable, Tuple[float | None, object]] = OrderedDict()
+
+    def get(self, key: Hashable) -> object | None:
+        """
+        Get a cached object
+
+        :param key: The key the object was stored under
+        :return: The object, or None if it isn't cached or expired
+        """
+
+        entry = self._entries.get(key)
+
+        if entry is None or (entry[0] is not None and entry[0] <= time.monotonic()):
+            if entry is not None:
+                del self._entries[key]
+
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return entry[1]
+
+    def put(self, key: Hashable, value: OSMUser | OSMNote | OSMChangeset, include_discussion: bool = False) -> None:
+        """
+        Store an object, with a time to live depending on its type
+
+        :param key: The key to store the object under
+        :param value: The object to store
+        :param include_discussion: True if value is a changeset fetched with its discussion
+        :return: None
+        """
+
+        ttl = self.get_ttl(value, include_discussion)
+
+        if ttl is not None and ttl <= 0:
+            return
+
+        self._entries[key] = (None if ttl is None else time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get_ttl(self, value: OSMUser | OSMNote | OSMChangeset, include_discussion: bool = False) -> float | None:
+        """
+        Get the time to live of an object
+
+        :param value: The object
+        :param include_discussion: True if value is a changeset fetched with its discussion
+        :return: Its time to live in seconds, or None if it never expires
+        """
+
+        if isinstance(value, OSMChangeset):
+            if value.is_open:
+                return self.open_changeset_ttl
+
+            return self.discussion_ttl if include_discussion else None
+
+        if isinstance(value, OSMNote):
+            return self.open_note_ttl if value.status == "open" else self.closed_note_ttl
+
+        return self.user_ttl
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove an object from cache
+
+        :param key: The key the object was stored under
+        :return: None
+        """
+
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove every object from cache
+        :return: None
+        """
+
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """
+        :return: Number of objects stored, expired ones included
+        """
+
+        return len(self._entries)
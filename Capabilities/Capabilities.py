@@ -2,6 +2,9 @@
 # Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
 
 import json
+import os
+import tempfile
+import time
 from typing import Dict, List
 
 from .ChangesetCapabilites import ChangesetCapabilities
@@ -18,6 +21,9 @@ class OSMCapabilities:
         self.area: float = 0
         self.timeout: int = 0
 
+        # time.time() at which values were fetched from API, 0 if they never were
+        self.fetched_at: float = 0
+
         self.changesets: ChangesetCapabilities = ChangesetCapabilities()
         self.notes: NoteCapabilities = NoteCapabilities()
         self.status: StatusCapabilities = StatusCapabilities()
@@ -61,6 +67,99 @@ class OSMCapabilities:
         self.status.api = json_values["api"]["status"]["api"]
         self.status.gpx = json_values["api"]["status"]["gpx"]
 
+        self.fetched_at = time.time()
+
+    def update_from_dict(self, values: Dict[str, float | int | Dict[str, str | int]]) -> None:
+        """
+        Update every value from a dict generated by self.to_dict
+        :param values: The dict containing all values
+        :return: None
+        """
+
+        self.area = values["area"]
+        self.timeout = values["timeout"]
+
+        self.changesets.maximum_elements = values["changesets"]["maximum_elements"]
+        self.changesets.maximum_query_limit = values["changesets"]["maximum_query_limit"]
+        self.changesets.default_query_limit = values["changesets"]["default_query_limit"]
+
+        self.notes.area = values["notes"]["area"]
+        self.notes.maximum_query_limit = values["notes"]["maximum_query_limit"]
+        self.notes.default_query_limit = values["notes"]["default_query_limit"]
+
+        self.status.database = values["status"]["database"]
+        self.status.api = values["status"]["api"]
+        self.status.gpx = values["status"]["gpx"]
+
+    def is_loaded(self) -> bool:
+        """
+        Tell if values were fetched from API (directly or through a saved file)
+        :return: Boolean
+        """
+
+        return self.fetched_at > 0
+
+    def is_stale(self, ttl: float) -> bool:
+        """
+        Tell if values are older than ttl
+        :param ttl: Number of seconds values are considered fresh
+        :return: Boolean
+        """
+
+        return time.time() - self.fetched_at > ttl
+
+    def save(self, path: str) -> None:
+        """
+        Save values in a json file, to be loaded later with self.load
+        The file is written next to it first then moved over it, so other processes never read it half written
+
+        :param path: Path of the file
+        :return: None
+
+        :except OSError: If the file couldn't be written
+        """
+
+        directory, name = os.path.split(os.path.abspath(path))
+        descriptor, temporary_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": self.fetched_at, "capabilities": self.to_dict()}, f)
+
+            os.replace(temporary_path, path)
+
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def load(self, path: str) -> bool:
+        """
+        Load values from a json file saved by self.save
+
+        :param path: Path of the file
+        :return: True if values were loaded, False if the file doesn't exist or is invalid
+        """
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            fetched_at = data["fetched_at"]
+
+            if isinstance(fetched_at, bool) or not isinstance(fetched_at, (int, float)):
+                return False
+
+            # Checked on a copy first, so an incomplete file doesn't leave values half updated
+            OSMCapabilities().update_from_dict(data["capabilities"])
+
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        self.update_from_dict(data["capabilities"])
+        self.fetched_at = fetched_at
+
+        return True
+
     def __str__(self) -> str:
         """
         Return values as a json string
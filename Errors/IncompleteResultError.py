@@ -0,0 +1,25 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from typing import Generic, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+
+class OSMIncompleteResultError(Exception, Generic[_T]):
+    """
+    Raised by methods merging several requests when some of them couldn't be fetched completely, instead of returning
+    a partial result looking complete. The partial result is kept in this exception
+    """
+
+    def __init__(self, message: str, result: _T, failed: Tuple[object, ...]) -> None:
+        """
+        :param message: Description of what is missing
+        :param result: What the method would have returned, without what is missing
+        :param failed: What couldn't be fetched completely, e.g. bounding boxes of tiles
+        """
+
+        super().__init__(message)
+
+        self.result: _T = result
+        self.failed: Tuple[object, ...] = failed
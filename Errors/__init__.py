@@ -0,0 +1,4 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from .IncompleteResultError import OSMIncompleteResultError
@@ -0,0 +1,277 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import asyncio
+import json
+import os
+import re
+import sys
+import tempfile
+import zlib
+from datetime import datetime
+from itertools import islice
+from typing import AsyncIterator, Optional, Tuple
+from xml.etree.ElementTree import ParseError
+
+from ..Network import OSMTransport
+from ..Network.ChangesetStream import iter_changesets_xml
+from ..Objects import OSMChangeset
+
+# Fractional seconds of state files have up to 9 digits, more than datetime supports
+_LAST_RUN_REGEX = re.compile(r"^(\d{4}-\d{2}-\d{2})[ T](\d{2}:\d{2}:\d{2})(?:\.(\d+))?\s*(Z|[+-]\d{2}:?\d{2})?$")
+
+
+class OSMChangesetReplication:
+    """
+    This class is used to consume the changeset replication feed, an incremental stream of every changeset opened,
+    updated or closed on OSM, published as sequence numbered files
+    For more information: https://wiki.openstreetmap.org/wiki/Planet.osm/diffs#Changeset_replication
+    """
+
+    def __init__(
+            self,
+            transport: OSMTransport,
+            base_url: str = "https://planet.openstreetmap.org/replication/changesets",
+            sequence: Optional[int] = None,
+            state_path: Optional[str] = None,
+            max_concurrency: int = 4,
+            lazy_objects: bool = False
+    ) -> None:
+        """
+        :param transport: The transport used to perform requests, e.g. py_osm.transport
+        :param base_url: Base url of the replication feed, without trailing slash. Can be set to a local mirror
+        :param sequence: Sequence number of the last file consumed. If None, it is loaded from state_path, and if
+        there isn't any, consuming starts from the latest published file
+        :param state_path: Json file where the sequence number is saved after each consumed file, and loaded from when
+        creating this object. If None, it is never saved
+        :param max_concurrency: Maximum number of files fetched at the same time
+        :param lazy_objects: If True, OSMChangeset attributes costly to build are only built when first accessed
+
+        :except ValueError: If max_concurrency isn't positive
+        """
+
+        if max_concurrency <= 0:
+            raise ValueError("Invalid max_concurrency: must be a positive integer")
+
+        self.transport: OSMTransport = transport
+        self.base_url: str = base_url
+        self.state_path: str | None = state_path
+        self.max_concurrency: int = max_concurrency
+        self.lazy_objects: bool = lazy_objects
+
+        self.sequence: int | None = sequence
+
+        if sequence is None and state_path is not None:
+            self.load(state_path)
+
+    def save(self, path: str) -> None:
+        """
+        Save the sequence number in a json file, to be loaded later with self.load
+        The file is written next to it first then moved over it, so it is never left half written
+
+        :param path: Path of the file
+        :return: None
+
+        :except OSError: If the file couldn't be written
+        """
+
+        directory, name = os.path.split(os.path.abspath(path))
+        descriptor, temporary_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as f:
+                json.dump({"sequence": self.sequence}, f)
+
+            os.replace(temporary_path, path)
+
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def load(self, path: str) -> bool:
+        """
+        Load the sequence number from a json file saved by self.save
+
+        :param path: Path of the file
+        :return: True if it was loaded, False if the file doesn't exist or is invalid
+        """
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                sequence = json.load(f)["sequence"]
+
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        if sequence is not None and (isinstance(sequence, bool) or not isinstance(sequence, int)):
+            return False
+
+        self.sequence = sequence
+
+        return True
+
+    def get_url(self, sequence: int) -> str:
+        """
+        :param sequence: A sequence number
+        :return: The url of the file having this sequence number, e.g. base_url/005/821/234.osm.gz for 5821234
+        """
+
+        digits = f"{sequence:09d}"
+
+        return f"{self.base_url}/{digits[:-6]}/{digits[-6:-3]}/{digits[-3:]}.osm.gz"
+
+    async def fetch_state(self) -> Tuple[int, datetime | None] | None:
+        """
+        Fetch the state of the feed
+
+        :return: A tuple (sequence number, last_run) of the latest published file, last_run being None if it is
+        missing. None if any issue happened
+        """
+
+        resp = await self.transport.get(f"{self.base_url}/state.yaml")
+
+        if resp.status != 200:
+            sys.stderr.write(f"WARNING: Couldn't fetch changeset replication state: {resp.status} {resp.text()}\n")
+            return None
+
+        values = {}
+
+        for line in resp.text().splitlines():
+            key, separator, value = line.partition(":")
+
+            if separator:
+                values[key.strip()] = value.strip()
+
+        try:
+            sequence = int(values["sequence"])
+
+        except (KeyError, ValueError):
+            sys.stderr.write(f"WARNING: Couldn't fetch changeset replication state: data invalid\n")
+            return None
+
+        return sequence, self._parse_last_run(values.get("last_run", ""))
+
+    @staticmethod
+    def _parse_last_run(value: str) -> datetime | None:
+        """
+        :param value: The last_run value of a state file, e.g. 2024-05-01 10:00:01.123456789 +00:00
+        :return: The corresponding datetime, or None if invalid
+        """
+
+        match = _LAST_RUN_REGEX.match(value)
+
+        if match is None:
+            return None
+
+        date, time, fraction, offset = match.groups()
+
+        if fraction:
+            time += "." + fraction[:6].ljust(6, "0")
+
+        try:
+            return datetime.fromisoformat(f"{date}T{time}{offset or "Z"}")
+
+        except ValueError:
+            return None
+
+    async def fetch_sequence(self, sequence: int) -> Tuple[OSMChangeset, ...] | None:
+        """
+        Fetch changesets of one file, parsed as they are received
+
+        :param sequence: The sequence number of the file
+        :return: A tuple containing every changeset of the file, or None if any issue happened
+        """
+
+        async with self.transport.stream(self.get_url(sequence)) as resp:
+            if resp.status != 200:
+                resp = await resp.read()
+                sys.stderr.write(
+                    f"WARNING: Couldn't fetch changeset replication file {sequence}: {resp.status} {resp.text()}\n"
+                )
+                return None
+
+            try:
+                return tuple([i async for i in iter_changesets_xml(resp.iter_chunks(), lazy=self.lazy_objects)])
+
+            except (ParseError, zlib.error) as e:
+                sys.stderr.write(f"WARNING: Couldn't parse changeset replication file {sequence}: {e}\n")
+                return None
+
+    async def iter_changesets(self) -> AsyncIterator[OSMChangeset]:
+        """
+        Iterate over changesets of every file published since the last one consumed, then stop
+        Files are fetched concurrently, but changesets are yielded in the order files were published. A changeset is
+        yielded again each time it is updated (e.g. when it is closed)
+        self.sequence is moved forward once every changeset of a file was yielded, and saved to self.state_path. If a
+        file couldn't be fetched, iteration stops before it so it is fetched again next time
+
+        :return: An asynchronous iterator over new or updated changesets
+        """
+
+        state = await self.fetch_state()
+
+        if state is None:
+            return
+
+        latest = state[0]
+
+        if self.sequence is None:
+            # Nothing consumed yet: start from now
+            self._move_to(latest)
+            return
+
+        sequences = iter(range(self.sequence + 1, latest + 1))
+        pending = [asyncio.ensure_future(self.fetch_sequence(i)) for i in islice(sequences, self.max_concurrency)]
+
+        try:
+            while pending:
+                changesets = await pending.pop(0)
+
+                if changesets is None:
+                    return
+
+                pending.extend([asyncio.ensure_future(self.fetch_sequence(i)) for i in islice(sequences, 1)])
+
+                for i in changesets:
+                    yield i
+
+                self._move_to(self.sequence + 1)
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def watch(self, interval: float = 60) -> AsyncIterator[OSMChangeset]:
+        """
+        Iterate forever over new or updated changesets, checking for new files every interval seconds
+        The changeset replication feed is published about every minute
+
+        :param interval: Number of seconds between 2 checks
+        :return: An asynchronous iterator over new or updated changesets
+        """
+
+        while True:
+            async for i in self.iter_changesets():
+                yield i
+
+            await asyncio.sleep(interval)
+
+    def _move_to(self, sequence: int) -> None:
+        """
+        Set the sequence number of the last file consumed, and save it if self.state_path is set
+        :param sequence: The sequence number
+        :return: None
+        """
+
+        self.sequence = sequence
+
+        if self.state_path is not None:
+            self.save(self.state_path)
+
+    def __str__(self) -> str:
+        """
+        :return: A string corresponding to this object
+        """
+
+        return f"<OSMChangesetReplication object: {self.base_url}, sequence={self.sequence}>"
+
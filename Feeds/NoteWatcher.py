@@ -0,0 +1,323 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import asyncio
+import sys
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from ..Enums import OSMOrder
+from ..Enums import OSMSort
+from ..Objects import OSMBoundingBox
+from ..Objects import OSMNote
+from ..Objects import OSMNoteEvent
+from ..Objects import OSMNoteEventType
+from ..Objects import OSMTimeDelta
+from ..PyOsm import PyOSM
+
+type _fingerprint = Tuple[str, int, datetime]
+
+_EVENT_TYPES = {i.value: i for i in OSMNoteEventType}
+
+# Event emitted when a note status changed without any comment explaining it being returned
+_STATUS_EVENT_TYPES = {
+    "open": OSMNoteEventType.REOPENED,
+    "closed": OSMNoteEventType.CLOSED,
+    "hidden": OSMNoteEventType.HIDDEN
+}
+
+
+class _WatchedRegion:
+    """
+    Criteria and state of a region watched by OSMNoteWatcher
+    """
+
+    __slots__ = ("name", "bbox", "query", "user_name", "user_id", "mark", "fingerprints")
+
+    def __init__(
+            self,
+            name: str,
+            bbox: OSMBoundingBox | None,
+            query: str | None,
+            user_name: str | None,
+            user_id: int | None,
+            mark: datetime | None
+    ) -> None:
+        self.name: str = name
+        self.bbox: OSMBoundingBox | None = bbox
+        self.query: str | None = query
+        self.user_name: str | None = user_name
+        self.user_id: int | None = user_id
+
+        # Notes updated before this datetime were already handled
+        self.mark: datetime | None = mark
+
+        # (status, comments count, last update) of notes last updated at or after mark
+        self.fingerprints: Dict[int, _fingerprint] = {}
+
+
+class OSMNoteWatcher:
+    """
+    This class is used to find what happened to notes of some regions since the last time they were checked
+    """
+
+    def __init__(
+            self,
+            py_osm: PyOSM,
+            max_concurrency: int = 4,
+            max_notes: int = 1000,
+            page_size: Optional[int] = None
+    ) -> None:
+        """
+        :param py_osm: The PyOSM instance used to perform requests
+        :param max_concurrency: Maximum number of regions checked at the same time
+        :param max_notes: Maximum number of notes fetched per region on each check. Notes left are fetched on next check
+        :param page_size: Number of notes requested per request. Default is
+        py_osm.capabilities.notes.maximum_query_limit
+
+        :except ValueError: If any parameter isn't positive
+        """
+
+        if max_concurrency <= 0:
+            raise ValueError("Invalid max_concurrency: must be a positive integer")
+
+        if max_notes <= 0:
+            raise ValueError("Invalid max_notes: must be a positive integer")
+
+        if page_size is not None and page_size <= 0:
+            raise ValueError("Invalid page_size: must be a positive integer")
+
+        self.py_osm: PyOSM = py_osm
+        self.max_concurrency: int = max_concurrency
+        self.max_notes: int = max_notes
+        self.page_size: int | None = page_size
+
+        self._regions: Dict[str, _WatchedRegion] = {}
+
+    def add_region(
+            self,
+            name: str,
+            bbox: Optional[OSMBoundingBox] = None,
+            query: Optional[str] = None,
+            user_name: Optional[str] = None,
+            user_id: Optional[int] = None,
+            since: Optional[datetime] = None
+    ) -> None:
+        """
+        Start watching notes matching some criteria. Criteria are the same as in py_osm.fetch_notes_by_search
+
+        :param name: Name of this region, given to its events
+        :param bbox: Area to watch. Must be under py_osm.capabilities.notes.area square degrees, else checking it raises
+        a ValueError
+        :param query: Text search query, matching either note text or comments
+        :param user_name: Watch notes which the given user interacted with
+        :param user_id: Same than user_name but with user ID
+        :param since: Events which happened since this datetime are returned by the first check. If None, the first
+        check only starts watching from now
+        :return: None
+
+        :except ValueError: If a region with this name is already watched or if bbox is invalid
+        """
+
+        if name in self._regions.keys():
+            raise ValueError(f"A region named {name} is already watched")
+
+        if bbox is not None and not bbox.check_data():
+            raise ValueError("Bounding box invalid: for more information, check Documentation/OSMBoundingBox.md")
+
+        if since is not None and since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        self._regions[name] = _WatchedRegion(name, bbox, query, user_name, user_id, since)
+
+    def remove_region(self, name: str) -> bool:
+        """
+        Stop watching a region
+        :param name: Name of the region
+        :return: True if it was watched
+        """
+
+        return self._regions.pop(name, None) is not None
+
+    def get_regions(self) -> Tuple[str, ...]:
+        """
+        :return: Names of every watched region
+        """
+
+        return tuple(self._regions.keys())
+
+    def get_mark(self, name: str) -> datetime | None:
+        """
+        :param name: Name of a watched region
+        :return: The datetime notes of this region were checked up to, or None if they weren't checked yet
+
+        :except KeyError: If this region isn't watched
+        """
+
+        return self._regions[name].mark
+
+    async def poll(self) -> Tuple[OSMNoteEvent, ...]:
+        """
+        Check every watched region once, fetching only notes updated since their last check
+
+        :return: A tuple containing what happened since the last check, sorted by date
+        """
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def poll_region(region: _WatchedRegion) -> List[OSMNoteEvent]:
+            async with semaphore:
+                return await self._poll_region(region)
+
+        events = []
+        for i in await asyncio.gather(*[poll_region(i) for i in tuple(self._regions.values())]):
+            events.extend(i)
+
+        events.sort(key=lambda event: event.date)
+
+        return tuple(events)
+
+    async def watch(self, interval: float = 60) -> AsyncIterator[OSMNoteEvent]:
+        """
+        Check every watched region forever, waiting interval seconds between 2 checks
+
+        :param interval: Number of seconds between 2 checks
+        :return: An asynchronous iterator over what happened
+        """
+
+        while True:
+            for i in await self.poll():
+                yield i
+
+            await asyncio.sleep(interval)
+
+    async def _poll_region(self, region: _WatchedRegion) -> List[OSMNoteEvent]:
+        """
+        Check a region once and move its mark forward
+        :param region: The region
+        :return: What happened since its last check
+        """
+
+        if region.mark is None:
+            # API dates are rounded to the second
+            region.mark = datetime.now(timezone.utc).replace(microsecond=0)
+            return []
+
+        mark = region.mark
+        newest = mark
+        events = []
+
+        await self.py_osm.ensure_capabilities()
+
+        maximum_limit = self.py_osm.capabilities.notes.maximum_query_limit
+        limit = min(self.page_size, maximum_limit) if self.page_size is not None else maximum_limit
+
+        cursor = mark
+
+        # Notes already checked by this call, as notes at pages boundaries are returned twice
+        checked = set()
+
+        while len(checked) < self.max_notes:
+            page = await self.py_osm.fetch_notes_by_search(
+                limit=limit,
+                closed=-1,
+                query=region.query,
+                user_name=region.user_name,
+                user_id=region.user_id,
+                bbox=region.bbox,
+                during=OSMTimeDelta(before=cursor),
+                sort=OSMSort.UPDATED_AT,
+                order=OSMOrder.OLDEST
+            )
+
+            for note in page:
+                if note.id in checked:
+                    continue
+
+                checked.add(note.id)
+
+                events.extend(self._compare(region, note, mark))
+                newest = max(newest, region.fingerprints[note.id][2])
+
+                if len(checked) >= self.max_notes:
+                    break
+
+            if len(page) < limit or len(checked) >= self.max_notes:
+                break
+
+            # API dates are rounded to the second, so notes updated at the last datetime are requested again
+            last = max([region.fingerprints[i.id][2] for i in page])
+
+            if last > cursor:
+                cursor = last
+                continue
+
+            # Every note of this page was updated during the same second, some of them may not be returned yet
+            if limit < maximum_limit:
+                limit = min(limit * 2, maximum_limit)
+                continue
+
+            # The mark isn't moved past this second, so notes left are requested again on next check
+            sys.stderr.write(f"WARNING: More than {limit} notes updated on {cursor.isoformat()} in region "
+                             f"{region.name}, some of them couldn't be checked yet\n")
+            break
+
+        region.mark = newest
+
+        # Changes of notes last updated before the mark are all found by their comments after it
+        region.fingerprints = {key: value for key, value in region.fingerprints.items() if value[2] >= newest}
+
+        return events
+
+    @staticmethod
+    def _compare(region: _WatchedRegion, note: OSMNote, mark: datetime) -> List[OSMNoteEvent]:
+        """
+        Compare a note to its stored fingerprint, and store its new one
+        :param region: The region the note was found in
+        :param note: The fetched note
+        :param mark: The mark of the region before this check
+        :return: What happened to this note since its fingerprint was stored
+        """
+
+        comments = note.comments
+        fingerprint = (
+            note.status,
+            len(comments),
+            (comments[-1].date if comments else note.date_created).replace(tzinfo=timezone.utc)
+        )
+
+        previous = region.fingerprints.get(note.id)
+        region.fingerprints[note.id] = fingerprint
+
+        if previous == fingerprint:
+            return []
+
+        if previous is None:
+            new_comments = [i for i in comments if i.date.replace(tzinfo=timezone.utc) >= mark]
+
+        elif len(comments) >= previous[1]:
+            new_comments = comments[previous[1]:]
+
+        else:
+            # Some comments were hidden
+            new_comments = [i for i in comments if i.date.replace(tzinfo=timezone.utc) > previous[2]]
+
+        events = [
+            OSMNoteEvent(_EVENT_TYPES[i.action], note, i, i.date.replace(tzinfo=timezone.utc), region.name)
+            for i in new_comments if i.action in _EVENT_TYPES.keys()
+        ]
+
+        if previous is not None and previous[0] != note.status and note.status in _STATUS_EVENT_TYPES.keys():
+            status_event = _STATUS_EVENT_TYPES[note.status]
+
+            if not any([i.type == status_event for i in events]):
+                events.append(OSMNoteEvent(status_event, note, None, fingerprint[2], region.name))
+
+        return events
+
+    def __str__(self) -> str:
+        """
+        :return: A string corresponding to this object
+        """
+
+        return f"<OSMNoteWatcher object: {len(self._regions)} regions>"
@@ -0,0 +1,349 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import bisect
+import math
+from typing import Iterable, Sequence, Tuple
+
+from . import Columns
+from .ChangesetFrame import OSMChangesetFrame
+from ..Objects import OSMBoundingBox
+from ..Objects import OSMChangeset
+from ..Objects import OSMNote
+
+numpy = Columns.numpy
+
+
+class OSMBoundingBoxArray:
+    """
+    Many bounding boxes stored in 4 float columns (left, bottom, right, top)
+    Missing bounding boxes are stored as NaN and never match any test
+    Tests are vectorized operations if NumPy is installed
+    """
+
+    __slots__ = ("left", "bottom", "right", "top")
+
+    def __init__(self, left: Columns.Column, bottom: Columns.Column, right: Columns.Column,
+                 top: Columns.Column) -> None:
+        """
+        :param left: Column of left values
+        :param bottom: Column of bottom values
+        :param right: Column of right values
+        :param top: Column of top values
+
+        :except ValueError: If columns don't have the same length
+        """
+
+        if not len(left) == len(bottom) == len(right) == len(top):
+            raise ValueError("Every column must have the same length")
+
+        self.left: Columns.Column = left
+        self.bottom: Columns.Column = bottom
+        self.right: Columns.Column = right
+        self.top: Columns.Column = top
+
+    @classmethod
+    def from_boxes(cls, boxes: Iterable[OSMBoundingBox | None]) -> "OSMBoundingBoxArray":
+        """
+        :param boxes: Bounding boxes, None if missing
+        :return: The bounding box array
+        """
+
+        nan_box = (math.nan,) * 4
+        values = [(i.left, i.bottom, i.right, i.top) if i is not None else nan_box for i in boxes]
+
+        return cls(*[Columns.new_column("d", [i[n] for i in values]) for n in range(4)])
+
+    @classmethod
+    def from_changesets(cls, changesets: Iterable[OSMChangeset]) -> "OSMBoundingBoxArray":
+        """
+        :param changesets: Changesets, those without bounding box are stored as NaN
+        :return: The bounding box array of those changesets
+        """
+
+        return cls.from_boxes([i.bounding_box for i in changesets])
+
+    @classmethod
+    def from_frame(cls, frame: OSMChangesetFrame) -> "OSMBoundingBoxArray":
+        """
+        :param frame: A changeset frame, its columns are shared without copy
+        :return: The bounding box array of those changesets
+        """
+
+        return cls(frame.column("min_lon"), frame.column("min_lat"), frame.column("max_lon"), frame.column("max_lat"))
+
+    @classmethod
+    def from_notes(cls, notes: Iterable[OSMNote]) -> "OSMBoundingBoxArray":
+        """
+        :param notes: Notes, each of them is stored as a bounding box of area 0 at its position
+        :return: The bounding box array of those notes
+        """
+
+        coordinates = [i.geometry["coordinates"] for i in notes]
+
+        lon = Columns.new_column("d", [i[0] for i in coordinates])
+        lat = Columns.new_column("d", [i[1] for i in coordinates])
+
+        return cls(lon, lat, lon, lat)
+
+    def __len__(self) -> int:
+        return len(self.left)
+
+    def __getitem__(self, index: int) -> OSMBoundingBox | None:
+        """
+        :param index: Position of a bounding box in this array
+        :return: This bounding box, or None if missing
+        """
+
+        values = [float(i[index]) for i in (self.left, self.bottom, self.right, self.top)]
+
+        if any(math.isnan(i) for i in values):
+            return None
+
+        return OSMBoundingBox(*values)
+
+    def take(self, indices: Sequence[int]) -> "OSMBoundingBoxArray":
+        """
+        :param indices: Positions of bounding boxes to keep, in this order
+        :return: A new array containing those bounding boxes
+        """
+
+        return OSMBoundingBoxArray(*[Columns.take(i, indices) for i in (self.left, self.bottom, self.right, self.top)])
+
+    def get_area(self) -> Columns.Column:
+        """
+        Get the area size of each bounding box in decimal degrees, like OSMBoundingBox.get_area
+        :return: A float column of areas, NaN for missing bounding boxes
+        """
+
+        if numpy is not None:
+            return numpy.abs(self.left - self.right) * numpy.abs(self.top - self.bottom)
+
+        return Columns.new_column("d", [
+            math.fabs(left - right) * math.fabs(top - bottom)
+            for left, bottom, right, top in zip(self.left, self.bottom, self.right, self.top)
+        ])
+
+    def check_data(self) -> Columns.Mask:
+        """
+        Check each bounding box like OSMBoundingBox.check_data
+        :return: A boolean mask of valid bounding boxes
+        """
+
+        if numpy is not None:
+            return ((-180 <= self.left) & (self.left <= self.right) & (self.right <= 180) &
+                    (-90 <= self.bottom) & (self.bottom <= self.top) & (self.top <= 90))
+
+        return [
+            -180 <= left <= right <= 180 and -90 <= bottom <= top <= 90
+            for left, bottom, right, top in zip(self.left, self.bottom, self.right, self.top)
+        ]
+
+    def cross_date_line(self) -> Columns.Mask:
+        """
+        Check each bounding box like OSMBoundingBox.cross_date_line
+        :return: A boolean mask of bounding boxes crossing date line
+        """
+
+        if numpy is not None:
+            return (180 >= self.left) & (self.left > 0) & (0 > self.right) & (self.right >= -180)
+
+        return [180 >= left > 0 > right >= -180 for left, right in zip(self.left, self.right)]
+
+    def intersects(self, bbox: OSMBoundingBox) -> Columns.Mask:
+        """
+        Bounding boxes crossing date line are supported, both in this array and as argument
+        :param bbox: A bounding box
+        :return: A boolean mask of bounding boxes intersecting it (touching counts as intersecting)
+        """
+
+        mask = [False] * len(self) if numpy is None else numpy.zeros(len(self), dtype=bool)
+
+        for part in bbox.split_date_line():
+            mask = Columns.mask_or(mask, self._covers(part.left, part.bottom, part.right, part.top, False))
+
+        return mask
+
+    def contains(self, bbox: OSMBoundingBox) -> Columns.Mask:
+        """
+        :param bbox: A bounding box, not crossing date line
+        :return: A boolean mask of bounding boxes fully containing it
+        """
+
+        return self._covers(bbox.left, bbox.bottom, bbox.right, bbox.top, True)
+
+    def contains_point(self, lon: float, lat: float) -> Columns.Mask:
+        """
+        :param lon: Longitude of the point
+        :param lat: Latitude of the point
+        :return: A boolean mask of bounding boxes containing it (borders included)
+        """
+
+        return self._covers(lon, lat, lon, lat, True)
+
+    def _covers(self, left: float, bottom: float, right: float, top: float, inside: bool) -> Columns.Mask:
+        """
+        :param left: Left of the tested bounding box, not crossing date line
+        :param bottom: Bottom of the tested bounding box
+        :param right: Right of the tested bounding box
+        :param top: Top of the tested bounding box
+        :param inside: If True, test if the bounding box is contained, else if it intersects
+        :return: A boolean mask of bounding boxes meeting the test
+        """
+
+        # A bounding box crossing date line covers [left, 180] and [-180, right], so one of those sides is enough
+        if numpy is not None:
+            if inside:
+                lat_ok = (self.bottom <= bottom) & (self.top >= top)
+                east = self.left <= left
+                west = self.right >= right
+
+            else:
+                lat_ok = (self.bottom <= top) & (self.top >= bottom)
+                east = self.left <= right
+                west = self.right >= left
+
+            return lat_ok & numpy.where(self.cross_date_line(), east | west, east & west)
+
+        result = []
+
+        for box_left, box_bottom, box_right, box_top in zip(self.left, self.bottom, self.right, self.top):
+            if inside:
+                lat_ok = box_bottom <= bottom and box_top >= top
+                east = box_left <= left
+                west = box_right >= right
+
+            else:
+                lat_ok = box_bottom <= top and box_top >= bottom
+                east = box_left <= right
+                west = box_right >= left
+
+            if 180 >= box_left > 0 > box_right >= -180:
+                result.append(lat_ok and (east or west))
+
+            else:
+                result.append(lat_ok and east and west)
+
+        return result
+
+    def union(self) -> OSMBoundingBox | None:
+        """
+        Get the smallest bounding box containing every bounding box of this array, ignoring missing ones
+        Bounding boxes crossing date line must be removed or split first
+        :return: The bounding box, or None if this array doesn't contain any bounding box
+        """
+
+        if numpy is not None:
+            valid = ~(numpy.isnan(self.left) | numpy.isnan(self.bottom) | numpy.isnan(self.right) |
+                      numpy.isnan(self.top))
+
+            if not valid.any():
+                return None
+
+            return OSMBoundingBox(
+                self.left[valid].min().item(),
+                self.bottom[valid].min().item(),
+                self.right[valid].max().item(),
+                self.top[valid].max().item()
+            )
+
+        boxes = [
+            i for i in zip(self.left, self.bottom, self.right, self.top) if not any(math.isnan(j) for j in i)
+        ]
+
+        if not boxes:
+            return None
+
+        return OSMBoundingBox(
+            min(i[0] for i in boxes),
+            min(i[1] for i in boxes),
+            max(i[2] for i in boxes),
+            max(i[3] for i in boxes)
+        )
+
+    def intersection(self, bbox: OSMBoundingBox) -> "OSMBoundingBoxArray":
+        """
+        Clip each bounding box to another one. Bounding boxes crossing date line must be removed or split first
+        :param bbox: A bounding box, not crossing date line
+        :return: A new array of clipped bounding boxes, NaN where they don't intersect
+        """
+
+        if numpy is not None:
+            left = numpy.maximum(self.left, bbox.left)
+            bottom = numpy.maximum(self.bottom, bbox.bottom)
+            right = numpy.minimum(self.right, bbox.right)
+            top = numpy.minimum(self.top, bbox.top)
+
+            empty = (left > right) | (bottom > top)
+
+            return OSMBoundingBoxArray(*[numpy.where(empty, numpy.nan, i) for i in (left, bottom, right, top)])
+
+        boxes = []
+
+        for box_left, box_bottom, box_right, box_top in zip(self.left, self.bottom, self.right, self.top):
+            box = (max(box_left, bbox.left), max(box_bottom, bbox.bottom), min(box_right, bbox.right),
+                   min(box_top, bbox.top))
+
+            # NaN comparisons are always False, so missing bounding boxes stay missing
+            boxes.append(box if box[0] <= box[2] and box[1] <= box[3] else (math.nan,) * 4)
+
+        return OSMBoundingBoxArray(*[Columns.new_column("d", [i[n] for i in boxes]) for n in range(4)])
+
+    def points_inside(self, points: "OSMBoundingBoxArray") -> Tuple[Sequence[int], Sequence[int]]:
+        """
+        Find every (bounding box, point) couple where the point is inside the bounding box, for example notes inside
+        changesets bounding boxes. Points are sorted by longitude once, so each bounding box only checks points in its
+        longitude range instead of every point
+        Bounding boxes crossing date line must be removed or split first
+
+        :param points: Points, as an array of bounding boxes of area 0 (see from_notes). Only left and bottom are used
+        :return: A tuple (bounding box indices, point indices) of the same length
+        """
+
+        if numpy is not None:
+            order = numpy.argsort(points.left, kind="stable")
+            lon = points.left[order]
+            lat = points.bottom[order]
+
+            starts = numpy.searchsorted(lon, self.left, side="left")
+            ends = numpy.searchsorted(lon, self.right, side="right")
+
+            box_indices = []
+            point_indices = []
+
+            for i in numpy.flatnonzero(ends > starts):
+                candidates = numpy.arange(starts[i], ends[i])
+                inside = candidates[(lat[candidates] >= self.bottom[i]) & (lat[candidates] <= self.top[i])]
+
+                box_indices.append(numpy.full(len(inside), i, dtype="int64"))
+                point_indices.append(order[inside])
+
+            if not box_indices:
+                return numpy.zeros(0, dtype="int64"), numpy.zeros(0, dtype="int64")
+
+            return numpy.concatenate(box_indices), numpy.concatenate(point_indices)
+
+        order = sorted([i for i in range(len(points)) if points.left[i] == points.left[i]], key=points.left.__getitem__)
+        lon = [points.left[i] for i in order]
+
+        box_indices = []
+        point_indices = []
+
+        for i, (left, bottom, right, top) in enumerate(zip(self.left, self.bottom, self.right, self.top)):
+            if not left <= right:
+                continue
+
+            for n in range(bisect.bisect_left(lon, left), bisect.bisect_right(lon, right)):
+                if bottom <= points.bottom[order[n]] <= top:
+                    box_indices.append(i)
+                    point_indices.append(order[n])
+
+        return box_indices, point_indices
+
+    def __str__(self) -> str:
+        """
+        Convert this class into a string
+        :return: The generated string
+        """
+
+        return f"<OSMBoundingBoxArray object: length={len(self)}, numpy={Columns.has_numpy()}>"
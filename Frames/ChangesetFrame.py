@@ -0,0 +1,318 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import math
+from datetime import datetime, timezone
+from typing import AsyncIterable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from . import Columns
+from ..Objects import OSMBoundingBox
+from ..Objects import OSMChangeset
+from ..Objects import OSMTimeDelta
+
+type _json_types = None | str | float | int | bool
+type _source = OSMChangeset | Dict[str, _json_types | Dict[str, _json_types]]
+
+# Column name -> typecode. Epochs are in seconds, NaN if not closed. Coordinates are NaN if there is no bounding box
+COLUMNS: Dict[str, str] = {
+    "id": "q",
+    "uid": "q",
+    "created_at": "d",
+    "closed_at": "d",
+    "changes_count": "q",
+    "comments_count": "q",
+    "min_lon": "d",
+    "min_lat": "d",
+    "max_lon": "d",
+    "max_lat": "d",
+}
+
+
+def _epoch(date: datetime) -> float:
+    """
+    :param date: A datetime, read as UTC if naive like in PyOSM requests
+    :return: Its POSIX timestamp
+    """
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return date.timestamp()
+
+
+class OSMChangesetFrame:
+    """
+    Columnar container of changesets, storing their numeric values in typed arrays
+    Filtering, sorting and grouping are vectorized operations if NumPy is installed
+    OSMChangeset objects are only built when accessed
+    """
+
+    __slots__ = ("_columns", "_sources", "lazy")
+
+    def __init__(self, columns: Dict[str, Columns.Column], sources: List[_source], lazy: bool = False) -> None:
+        """
+        You should use from_changesets, from_json or from_stream instead
+        :param columns: Column name -> typed array, each of them having the same length as sources
+        :param sources: The changesets, or json responses they are built from when accessed
+        :param lazy: Passed to OSMChangeset when building changesets from json responses
+        """
+
+        self._columns: Dict[str, Columns.Column] = columns
+        self._sources: List[_source] = sources
+        self.lazy: bool = lazy
+
+    @classmethod
+    def from_changesets(cls, changesets: Iterable[OSMChangeset]) -> "OSMChangesetFrame":
+        """
+        Build a frame from changesets
+        :param changesets: The changesets, for example returned by fetch_changesets_by_search
+        :return: The frame
+        """
+
+        return cls._build(list(changesets))
+
+    @classmethod
+    def from_json(
+            cls,
+            json_responses: Iterable[Dict[str, _json_types | Dict[str, _json_types]]],
+            lazy: bool = False
+    ) -> "OSMChangesetFrame":
+        """
+        Build a frame from json responses returned by API, without building any OSMChangeset
+        :param json_responses: The changesets json responses
+        :param lazy: Passed to OSMChangeset when building changesets from json responses
+        :return: The frame
+        """
+
+        return cls._build(list(json_responses), lazy)
+
+    @classmethod
+    async def from_stream(cls, changesets: AsyncIterable[OSMChangeset]) -> "OSMChangesetFrame":
+        """
+        Build a frame from an asynchronous stream of changesets
+        :param changesets: The stream, for example PyOSM.iter_changesets(...)
+        :return: The frame
+        """
+
+        return cls._build([i async for i in changesets])
+
+    @classmethod
+    def _build(cls, sources: List[_source], lazy: bool = False) -> "OSMChangesetFrame":
+        """
+        :param sources: The changesets or json responses
+        :param lazy: Passed to OSMChangeset when building changesets from json responses
+        :return: The frame
+        """
+
+        rows = [cls._row(i) for i in sources]
+
+        columns = {
+            name: Columns.new_column(typecode, [row[n] for row in rows])
+            for n, (name, typecode) in enumerate(COLUMNS.items())
+        }
+
+        return cls(columns, sources, lazy)
+
+    @staticmethod
+    def _row(source: _source) -> Tuple[int | float, ...]:
+        """
+        :param source: A changeset or json response
+        :return: Its values in COLUMNS order
+        """
+
+        if isinstance(source, OSMChangeset):
+            bbox = source.bounding_box
+            coordinates = (bbox.left, bbox.bottom, bbox.right, bbox.top) if bbox is not None else (math.nan,) * 4
+
+            return (
+                source.id,
+                source.uid,
+                _epoch(source.created_at),
+                _epoch(source.closed_at) if not source.is_open else math.nan,
+                source.changes_count,
+                source.comments_count,
+                *coordinates
+            )
+
+        return (
+            source["id"],
+            source["uid"],
+            _epoch(datetime.fromisoformat(source["created_at"])),
+            _epoch(datetime.fromisoformat(source["closed_at"])) if "closed_at" in source.keys() else math.nan,
+            source["changes_count"],
+            source["comments_count"],
+            source.get("min_lon", math.nan),
+            source.get("min_lat", math.nan),
+            source.get("max_lon", math.nan),
+            source.get("max_lat", math.nan)
+        )
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __getitem__(self, index: int) -> OSMChangeset:
+        """
+        Get a changeset, building it if needed
+        :param index: Its position in this frame
+        :return: The changeset
+        """
+
+        source = self._sources[index]
+
+        if not isinstance(source, OSMChangeset):
+            source = OSMChangeset(source, lazy=self.lazy)
+            self._sources[index] = source
+
+        return source
+
+    def __iter__(self) -> Iterator[OSMChangeset]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def column(self, name: str) -> Columns.Column:
+        """
+        Get a column, as a NumPy array if available, else an array.array
+        :param name: The column name, one of COLUMNS keys
+        :return: The column. Don't modify it, as it can be shared with other frames
+        """
+
+        return self._columns[name]
+
+    def to_changesets(self) -> Tuple[OSMChangeset, ...]:
+        """
+        :return: Every changeset of this frame, building them if needed
+        """
+
+        return tuple(self)
+
+    def take(self, indices: Sequence[int]) -> "OSMChangesetFrame":
+        """
+        :param indices: Positions of changesets to keep, in this order
+        :return: A new frame containing those changesets
+        """
+
+        return OSMChangesetFrame(
+            {name: Columns.take(column, indices) for name, column in self._columns.items()},
+            Columns.take_list(self._sources, indices),
+            self.lazy
+        )
+
+    def filter(self, mask: Columns.Mask) -> "OSMChangesetFrame":
+        """
+        :param mask: A boolean mask, for example frame.column("changes_count") > 100 with NumPy
+        :return: A new frame containing changesets where mask is True
+        """
+
+        if len(mask) != len(self):
+            raise ValueError("mask must have the same length as this frame")
+
+        return self.take(Columns.nonzero(mask))
+
+    def where(
+            self,
+            created: OSMTimeDelta | None = None,
+            closed: OSMTimeDelta | None = None,
+            min_changes: int | None = None,
+            max_changes: int | None = None,
+            min_comments: int | None = None,
+            uid: int | Iterable[int] | None = None,
+            bbox: OSMBoundingBox | None = None
+    ) -> "OSMChangesetFrame":
+        """
+        Filter changesets, every condition must be met. Changesets without a bounding box never match bbox
+        :param created: Creation time range: before is the earliest, after is the latest (optional). Naive datetimes
+        are read as UTC
+        :param closed: Closing time range: before is the earliest, after is the latest (optional). Open changesets
+        never match it
+        :param min_changes: Minimal number of changes
+        :param max_changes: Maximal number of changes
+        :param min_comments: Minimal number of comments
+        :param uid: A user id or an iterable of user ids
+        :param bbox: A bounding box changesets bounding boxes must intersect
+        :return: A new frame containing matching changesets
+
+        :except ValueError: If a time range is invalid
+        """
+
+        mask = Columns.full_mask(len(self))
+
+        for time_delta, name in ((created, "created_at"), (closed, "closed_at")):
+            if time_delta is None:
+                continue
+
+            if not time_delta.check_data_validity(optional_before=False):
+                raise ValueError(f"Time delta for {name} isn't valid")
+
+            mask = Columns.mask_and(mask, Columns.between(
+                self._columns[name],
+                _epoch(time_delta.before),
+                _epoch(time_delta.after) if time_delta.after is not None else None
+            ))
+
+        if min_changes is not None or max_changes is not None:
+            mask = Columns.mask_and(mask, Columns.between(self._columns["changes_count"], min_changes, max_changes))
+
+        if min_comments is not None:
+            mask = Columns.mask_and(mask, Columns.between(self._columns["comments_count"], min_comments))
+
+        if uid is not None:
+            mask = Columns.mask_and(mask, Columns.is_in(self._columns["uid"], (uid,) if isinstance(uid, int) else uid))
+
+        if bbox is not None:
+            parts = bbox.split_date_line()
+
+            # A changeset only has to intersect one of the parts of a bounding box crossing date line
+            bbox_mask = self._intersects(parts[0])
+            for part in parts[1:]:
+                bbox_mask = Columns.mask_or(bbox_mask, self._intersects(part))
+
+            mask = Columns.mask_and(mask, bbox_mask)
+
+        return self.filter(mask)
+
+    def _intersects(self, bbox: OSMBoundingBox) -> Columns.Mask:
+        """
+        :param bbox: A bounding box not crossing date line
+        :return: A mask of changesets whose bounding box intersects it
+        """
+
+        mask = Columns.between(self._columns["max_lon"], low=bbox.left)
+        mask = Columns.mask_and(mask, Columns.between(self._columns["min_lon"], high=bbox.right))
+        mask = Columns.mask_and(mask, Columns.between(self._columns["max_lat"], low=bbox.bottom))
+
+        return Columns.mask_and(mask, Columns.between(self._columns["min_lat"], high=bbox.top))
+
+    def sort_by(self, name: str, descending: bool = False) -> "OSMChangesetFrame":
+        """
+        Sort changesets by a column. Sort is stable and NaN values (open changesets for closed_at) are placed last
+        :param name: The column name, one of COLUMNS keys
+        :param descending: If True, the biggest values are placed first
+        :return: A new sorted frame
+        """
+
+        return self.take(Columns.argsort(self._columns[name], descending))
+
+    def group_by(self, name: str) -> Dict[int | float, "OSMChangesetFrame"]:
+        """
+        Group changesets by value of a column, for example "uid"
+        :param name: The column name, one of COLUMNS keys
+        :return: A dict of value -> frame of changesets having this value, in ascending order of values
+        """
+
+        return {value: self.take(indices) for value, indices in Columns.groups(self._columns[name]).items()}
+
+    def sum(self, name: str) -> int | float:
+        """
+        :param name: The column name, one of COLUMNS keys
+        :return: The sum of this column, ignoring NaN values
+        """
+
+        return Columns.total(self._columns[name])
+
+    def __str__(self) -> str:
+        """
+        Convert this class into a string
+        :return: The generated string
+        """
+
+        return f"<OSMChangesetFrame object: length={len(self)}, numpy={Columns.has_numpy()}>"
@@ -0,0 +1,221 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import math
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# NumPy is optional: columns are NumPy arrays if it is installed, else array.array and operations are done in Python
+try:
+    import numpy
+
+except ImportError:
+    numpy = None
+
+type Column = Sequence[int] | Sequence[float]
+type Mask = Sequence[bool]
+
+_NUMPY_TYPES = {"q": "int64", "d": "float64"}
+
+
+def has_numpy() -> bool:
+    """
+    :return: True if NumPy is installed and used to store columns
+    """
+
+    return numpy is not None
+
+
+def new_column(typecode: str, values: Iterable[int | float]) -> Column:
+    """
+    Build a typed column
+    :param typecode: "q" for 64 bits integers, "d" for 64 bits floats
+    :param values: The values of this column
+    :return: A NumPy array if available, else an array.array
+    """
+
+    if numpy is not None:
+        if not isinstance(values, (list, tuple, array)) and not isinstance(values, numpy.ndarray):
+            values = list(values)
+
+        return numpy.asarray(values, dtype=_NUMPY_TYPES[typecode])
+
+    return array(typecode, values)
+
+
+def take(column: Column, indices: Sequence[int]) -> Column:
+    """
+    :param column: The column to take values from
+    :param indices: The indices of values to take, in this order
+    :return: A new column containing those values
+    """
+
+    if numpy is not None:
+        return column[numpy.asarray(indices, dtype="int64")]
+
+    return array(column.typecode, [column[i] for i in indices])
+
+
+def take_list(values: List[object], indices: Sequence[int]) -> List[object]:
+    """
+    :param values: A list of python objects
+    :param indices: The indices of values to take, in this order
+    :return: A new list containing those values
+    """
+
+    return [values[i] for i in indices]
+
+
+def nonzero(mask: Mask) -> Sequence[int]:
+    """
+    :param mask: A boolean mask
+    :return: The indices where mask is True
+    """
+
+    if numpy is not None:
+        return numpy.flatnonzero(numpy.asarray(mask, dtype=bool))
+
+    return [i for i, value in enumerate(mask) if value]
+
+
+def full_mask(length: int) -> Mask:
+    """
+    :param length: The mask length
+    :return: A boolean mask where every value is True
+    """
+
+    if numpy is not None:
+        return numpy.ones(length, dtype=bool)
+
+    return [True] * length
+
+
+def mask_and(first: Mask, second: Mask) -> Mask:
+    """
+    :return: A boolean mask where both masks are True
+    """
+
+    if numpy is not None:
+        return numpy.logical_and(first, second)
+
+    return [a and b for a, b in zip(first, second)]
+
+
+def mask_or(first: Mask, second: Mask) -> Mask:
+    """
+    :return: A boolean mask where any of those masks is True
+    """
+
+    if numpy is not None:
+        return numpy.logical_or(first, second)
+
+    return [a or b for a, b in zip(first, second)]
+
+
+def between(column: Column, low: int | float | None = None, high: int | float | None = None) -> Mask:
+    """
+    Build a mask of values in range [low, high]. NaN values are never in range
+    :param column: The column to compare
+    :param low: The minimal value, or None to not check it
+    :param high: The maximal value, or None to not check it
+    :return: The boolean mask
+    """
+
+    if numpy is not None:
+        mask = ~numpy.isnan(column) if column.dtype.kind == "f" else numpy.ones(len(column), dtype=bool)
+
+        if low is not None:
+            mask &= column >= low
+
+        if high is not None:
+            mask &= column <= high
+
+        return mask
+
+    low = -math.inf if low is None else low
+    high = math.inf if high is None else high
+
+    # NaN comparisons are always False
+    return [low <= value <= high for value in column]
+
+
+def is_in(column: Column, values: Iterable[int | float]) -> Mask:
+    """
+    :param column: The column to check
+    :param values: The accepted values
+    :return: A boolean mask of values which are in the given ones
+    """
+
+    values = set(values)
+
+    if numpy is not None:
+        return numpy.isin(column, list(values))
+
+    return [value in values for value in column]
+
+
+def argsort(column: Column, descending: bool = False) -> Sequence[int]:
+    """
+    Stable sort of a column. NaN values are placed last
+    :param column: The column to sort
+    :param descending: If True, the biggest values are placed first
+    :return: The indices of values in sorted order
+    """
+
+    if numpy is not None:
+        if not descending:
+            return numpy.argsort(column, kind="stable")
+
+        # Sorting the opposite values keeps equal values in their order, and NaN stays last
+        return numpy.argsort(-column, kind="stable")
+
+    indices = [i for i, value in enumerate(column) if value == value]
+    indices.sort(key=column.__getitem__, reverse=descending)
+
+    return indices + [i for i, value in enumerate(column) if value != value]
+
+
+def groups(column: Column) -> Dict[int | float, Sequence[int]]:
+    """
+    Group the indices of a column by value
+    :param column: The column to group
+    :return: A dict of value -> indices of this value, in ascending order of values
+    """
+
+    if numpy is not None:
+        values, inverse = numpy.unique(column, return_inverse=True)
+        order = numpy.argsort(inverse, kind="stable")
+        bounds = numpy.cumsum(numpy.bincount(inverse, minlength=len(values)))[:-1]
+
+        return {value.item(): indices for value, indices in zip(values, numpy.split(order, bounds))}
+
+    indices: Dict[int | float, List[int]] = {}
+
+    for i, value in enumerate(column):
+        indices.setdefault(value, []).append(i)
+
+    return {value: indices[value] for value in sorted(indices.keys())}
+
+
+def total(column: Column) -> int | float:
+    """
+    :param column: The column to sum, ignoring NaN values
+    :return: The sum of its values
+    """
+
+    if numpy is not None:
+        return numpy.nansum(column).item()
+
+    return sum(value for value in column if value == value)
+
+
+def to_tuple(column: Column) -> Tuple[int | float, ...]:
+    """
+    :param column: A column
+    :return: Its values as python numbers
+    """
+
+    if numpy is not None:
+        return tuple(column.tolist())
+
+    return tuple(column)
@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import bisect
+from typing import Dict, Sequence, Tuple
+
+from . import Columns
+
+numpy = Columns.numpy
+
+# Columns of each element type, in addition to id, tag_offsets, tag_keys and tag_values
+# Offsets columns have one more value than elements: values of element i are in [offsets[i], offsets[i + 1])
+TYPE_COLUMNS: Dict[str, Dict[str, str]] = {
+    "node": {"lat": "d", "lon": "d"},
+    "way": {"node_offsets": "q", "node_refs": "q"},
+    "relation": {"member_offsets": "q", "member_types": "q", "member_refs": "q", "member_roles": "q"},
+}
+
+COMMON_COLUMNS: Dict[str, str] = {"id": "q", "tag_offsets": "q", "tag_keys": "q", "tag_values": "q"}
+
+
+class OSMElementTable:
+    """
+    Columnar storage of every element of one type (nodes, ways or relations)
+    Strings (tag keys and values, member types and roles) are stored as indices in a string table shared by the map data
+    """
+
+    __slots__ = ("type", "strings", "string_ids", "_columns", "_index")
+
+    def __init__(
+            self,
+            element_type: str,
+            strings: Tuple[str, ...],
+            string_ids: Dict[str, int],
+            columns: Dict[str, Columns.Column]
+    ) -> None:
+        """
+        :param element_type: "node", "way" or "relation"
+        :param strings: The string table
+        :param string_ids: String -> its index in the string table
+        :param columns: Column name -> typed array, see COMMON_COLUMNS and TYPE_COLUMNS
+        """
+
+        self.type: str = element_type
+        self.strings: Tuple[str, ...] = strings
+        self.string_ids: Dict[str, int] = string_ids
+
+        self._columns: Dict[str, Columns.Column] = columns
+        self._index: Dict[int, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self._columns["id"])
+
+    def column(self, name: str) -> Columns.Column:
+        """
+        Get a column, as a NumPy array if available, else an array.array
+        :param name: The column name, see COMMON_COLUMNS and TYPE_COLUMNS
+        :return: The column. Don't modify it
+        """
+
+        return self._columns[name]
+
+    def index_of(self, element_id: int) -> int | None:
+        """
+        Get the position of an element. Positions are indexed on first call
+        :param element_id: The element id
+        :return: Its position in this table, or None if it isn't in it
+        """
+
+        if self._index is None:
+            self._index = {element_id: i for i, element_id in enumerate(Columns.to_tuple(self._columns["id"]))}
+
+        return self._index.get(element_id)
+
+    def _range(self, name: str, index: int) -> range:
+        """
+        :param name: An offsets column name
+        :param index: Position of an element
+        :return: The range of its values in the corresponding columns
+        """
+
+        offsets = self._columns[name]
+
+        return range(int(offsets[index]), int(offsets[index + 1]))
+
+    def get_tags(self, index: int) -> Dict[str, str]:
+        """
+        :param index: Position of an element
+        :return: Its tags
+        """
+
+        keys = self._columns["tag_keys"]
+        values = self._columns["tag_values"]
+
+        return {self.strings[keys[i]]: self.strings[values[i]] for i in self._range("tag_offsets", index)}
+
+    def get_nodes(self, index: int) -> Tuple[int, ...]:
+        """
+        Only for ways
+        :param index: Position of a way
+        :return: Ids of its nodes
+        """
+
+        refs = self._columns["node_refs"]
+
+        return tuple([int(refs[i]) for i in self._range("node_offsets", index)])
+
+    def get_members(self, index: int) -> Tuple[Tuple[str, int, str], ...]:
+        """
+        Only for relations
+        :param index: Position of a relation
+        :return: (type, ref, role) of its members
+        """
+
+        types = self._columns["member_types"]
+        refs = self._columns["member_refs"]
+        roles = self._columns["member_roles"]
+
+        return tuple([
+            (self.strings[types[i]], int(refs[i]), self.strings[roles[i]]) for i in self._range("member_offsets", index)
+        ])
+
+    def with_tag(self, key: str, value: str | None = None) -> Sequence[int]:
+        """
+        Find elements having a tag
+        :param key: The tag key
+        :param value: The tag value, or None to accept any value
+        :return: Positions of those elements, in ascending order
+        """
+
+        if key not in self.string_ids.keys() or (value is not None and value not in self.string_ids.keys()):
+            return ()
+
+        key_index = self.string_ids[key]
+        value_index = self.string_ids[value] if value is not None else None
+
+        keys = self._columns["tag_keys"]
+        values = self._columns["tag_values"]
+        offsets = self._columns["tag_offsets"]
+
+        if numpy is not None:
+            mask = keys == key_index
+
+            if value_index is not None:
+                mask &= values == value_index
+
+            # Each tag belongs to the last element whose offset is lower or equal to its position
+            return numpy.searchsorted(offsets, numpy.flatnonzero(mask), side="right") - 1
+
+        return [
+            bisect.bisect_right(offsets, i) - 1 for i in range(len(keys))
+            if keys[i] == key_index and (value_index is None or values[i] == value_index)
+        ]
+
+    def __str__(self) -> str:
+        """
+        Convert this class into a string
+        :return: The generated string
+        """
+
+        return f"<OSMElementTable object: type={self.type}, length={len(self)}>"
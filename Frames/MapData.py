@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from typing import Dict, Tuple
+
+from .ElementTable import OSMElementTable
+
+
+class OSMMapData:
+    """
+    Map data (nodes, ways and relations) stored in typed columns instead of one python object per element
+    Element metadata (version, changeset, user, timestamp) isn't kept
+    """
+
+    __slots__ = ("strings", "string_ids", "nodes", "ways", "relations")
+
+    def __init__(
+            self,
+            strings: Tuple[str, ...],
+            string_ids: Dict[str, int],
+            nodes: OSMElementTable,
+            ways: OSMElementTable,
+            relations: OSMElementTable
+    ) -> None:
+        """
+        You should use OSMMapDataBuilder or PyOSM.fetch_map instead
+        :param strings: The string table shared by every table
+        :param string_ids: String -> its index in the string table
+        :param nodes: The nodes table
+        :param ways: The ways table
+        :param relations: The relations table
+        """
+
+        self.strings: Tuple[str, ...] = strings
+        self.string_ids: Dict[str, int] = string_ids
+
+        self.nodes: OSMElementTable = nodes
+        self.ways: OSMElementTable = ways
+        self.relations: OSMElementTable = relations
+
+    def get_way_coordinates(self, index: int) -> Tuple[Tuple[float, float] | None, ...]:
+        """
+        :param index: Position of a way in the ways table
+        :return: (lon, lat) of each of its nodes, None for nodes which aren't in this map data
+        """
+
+        lats = self.nodes.column("lat")
+        lons = self.nodes.column("lon")
+
+        coordinates = []
+
+        for node_id in self.ways.get_nodes(index):
+            node_index = self.nodes.index_of(node_id)
+            coordinates.append((float(lons[node_index]), float(lats[node_index])) if node_index is not None else None)
+
+        return tuple(coordinates)
+
+    def __str__(self) -> str:
+        """
+        Convert this class into a string
+        :return: The generated string
+        """
+
+        return (f"<OSMMapData object: nodes={len(self.nodes)}, ways={len(self.ways)}, relations={len(self.relations)}, "
+                f"strings={len(self.strings)}>")
+
@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import sys
+from array import array
+from typing import Dict, List, Set
+
+from . import Columns
+from .ElementTable import COMMON_COLUMNS
+from .ElementTable import OSMElementTable
+from .ElementTable import TYPE_COLUMNS
+from .MapData import OSMMapData
+
+type _json_types = None | str | float | int | bool
+
+
+class OSMMapDataBuilder:
+    """
+    Build an OSMMapData by adding elements one by one, as they are received
+    Elements already added (e.g. received in 2 adjacent tiles) are ignored
+    """
+
+    def __init__(self) -> None:
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+
+        self._columns: Dict[str, Dict[str, array]] = {
+            element_type: {
+                name: array(typecode, [0] if name.endswith("_offsets") else [])
+                for name, typecode in (COMMON_COLUMNS | type_columns).items()
+            }
+            for element_type, type_columns in TYPE_COLUMNS.items()
+        }
+
+        self._seen: Dict[str, Set[int]] = {i: set() for i in TYPE_COLUMNS.keys()}
+
+    def _string(self, value: str) -> int:
+        """
+        :param value: A string
+        :return: Its index in the string table, adding it if needed
+        """
+
+        index = self._string_ids.get(value)
+
+        if index is None:
+            index = len(self._strings)
+            value = sys.intern(value)
+
+            self._strings.append(value)
+            self._string_ids[value] = index
+
+        return index
+
+    def add(self, element: Dict[str, _json_types | Dict[str, str] | List[int] | List[Dict[str, _json_types]]]) -> bool:
+        """
+        Add an element
+        :param element: The json response corresponding to an element (e.g. what's in "elements" of /map.json)
+        :return: False if it was ignored, because it was already added or its type is unknown
+
+        :except KeyError: If the element misses a value. Nothing is added, so other elements are left consistent
+        """
+
+        element_type = element.get("type")
+
+        if element_type not in self._seen.keys() or element["id"] in self._seen[element_type]:
+            return False
+
+        # Every value is read before changing any column, so an invalid element doesn't leave them misaligned
+        tags = tuple(element.get("tags", {}).items())
+
+        if element_type == "node":
+            values = (element["lat"], element["lon"])
+
+        elif element_type == "way":
+            values = element["nodes"]
+
+        else:
+            values = tuple([(member["type"], member["ref"], member["role"]) for member in element["members"]])
+
+        self._seen[element_type].add(element["id"])
+        columns = self._columns[element_type]
+
+        columns["id"].append(element["id"])
+
+        for key, value in tags:
+            columns["tag_keys"].append(self._string(key))
+            columns["tag_values"].append(self._string(value))
+
+        columns["tag_offsets"].append(len(columns["tag_keys"]))
+
+        if element_type == "node":
+            columns["lat"].append(values[0])
+            columns["lon"].append(values[1])
+
+        elif element_type == "way":
+            columns["node_refs"].extend(values)
+            columns["node_offsets"].append(len(columns["node_refs"]))
+
+        else:
+            for member_type, ref, role in values:
+                columns["member_types"].append(self._string(member_type))
+                columns["member_refs"].append(ref)
+                columns["member_roles"].append(self._string(role))
+
+            columns["member_offsets"].append(len(columns["member_refs"]))
+
+        return True
+
+    def build(self) -> OSMMapData:
+        """
+        :return: The map data containing every element added
+        """
+
+        strings = tuple(self._strings)
+        string_ids = dict(self._string_ids)
+
+        tables = {
+            element_type: OSMElementTable(element_type, strings, string_ids, {
+                name: Columns.new_column(column.typecode, column) for name, column in columns.items()
+            })
+            for element_type, columns in self._columns.items()
+        }
+
+        return OSMMapData(strings, string_ids, tables["node"], tables["way"], tables["relation"])
@@ -0,0 +1,8 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from .BoundingBoxArray import OSMBoundingBoxArray
+from .ChangesetFrame import OSMChangesetFrame
+from .ElementTable import OSMElementTable
+from .MapData import OSMMapData
+from .MapDataBuilder import OSMMapDataBuilder
@@ -0,0 +1,362 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import heapq
+import math
+from typing import Dict, Iterable, List, Set, Tuple
+
+from ..Objects import OSMBoundingBox
+from ..Objects import OSMChangeset
+from ..Objects import OSMNote
+
+# Approximate length of a latitude degree, in meters
+METERS_PER_DEGREE = 111195
+
+type _cell = Tuple[int, int]
+
+
+class OSMSpatialIndex:
+    """
+    Grid index of already fetched notes and changesets, to answer bounding box and nearest notes queries locally
+    Objects can be added, updated (added again with the same id) and removed at any time
+    """
+
+    def __init__(self, cell_size: float = 1, max_changeset_cells: int = 64) -> None:
+        """
+        :param cell_size: Size of each grid cell in degrees. 360 must be a multiple of it (e.g. 0.1, 0.5, 1, 5)
+        :param max_changeset_cells: Changesets covering more cells than this are not stored in the grid but checked on
+        each query, to avoid storing huge changesets in thousands of cells
+
+        :except ValueError: If cell_size or max_changeset_cells isn't valid
+        """
+
+        if cell_size <= 0 or abs(360 / cell_size - round(360 / cell_size)) > 1e-9:
+            raise ValueError("cell_size must be positive and 360 must be a multiple of it")
+
+        if max_changeset_cells < 1:
+            raise ValueError("max_changeset_cells must be at least 1")
+
+        self.cell_size: float = cell_size
+        self.max_changeset_cells: int = max_changeset_cells
+
+        self._columns: int = round(360 / cell_size)
+        self._rows: int = math.ceil(180 / cell_size)
+
+        self._notes: Dict[int, OSMNote] = {}
+        self._note_positions: Dict[int, Tuple[float, float]] = {}
+        self._note_cells: Dict[_cell, Set[int]] = {}
+
+        self._changesets: Dict[int, OSMChangeset] = {}
+        self._changeset_boxes: Dict[int, Tuple[OSMBoundingBox, ...]] = {}
+        self._changeset_cells: Dict[_cell, Set[int]] = {}
+        self._large_changesets: Set[int] = set()
+
+    def _cell(self, lon: float, lat: float) -> _cell:
+        """
+        :param lon: A longitude
+        :param lat: A latitude
+        :return: The cell containing this point
+        """
+
+        return (
+            min(int((lon + 180) // self.cell_size), self._columns - 1),
+            min(int((lat + 90) // self.cell_size), self._rows - 1)
+        )
+
+    def _cells(self, bbox: OSMBoundingBox) -> Iterable[_cell]:
+        """
+        :param bbox: A bounding box not crossing date line
+        :return: Every cell intersecting it
+        """
+
+        left, bottom = self._cell(bbox.left, bbox.bottom)
+        right, top = self._cell(bbox.right, bbox.top)
+
+        return ((x, y) for x in range(left, right + 1) for y in range(bottom, top + 1))
+
+    def _cells_count(self, bbox: OSMBoundingBox) -> int:
+        """
+        :param bbox: A bounding box not crossing date line
+        :return: The number of cells intersecting it
+        """
+
+        left, bottom = self._cell(bbox.left, bbox.bottom)
+        right, top = self._cell(bbox.right, bbox.top)
+
+        return (right - left + 1) * (top - bottom + 1)
+
+    def add_note(self, note: OSMNote) -> None:
+        """
+        Add a note, replacing the one with the same id if any
+        :param note: The note
+        :return: None
+        """
+
+        self.remove_note(note.id)
+
+        lon, lat = note.geometry["coordinates"]
+
+        self._notes[note.id] = note
+        self._note_positions[note.id] = (lon, lat)
+        self._note_cells.setdefault(self._cell(lon, lat), set()).add(note.id)
+
+    def add_notes(self, notes: Iterable[OSMNote]) -> None:
+        """
+        :param notes: Notes to add, replacing those with the same id
+        :return: None
+        """
+
+        for note in notes:
+            self.add_note(note)
+
+    def remove_note(self, note_id: int) -> bool:
+        """
+        :param note_id: The note id
+        :return: True if it was in this index
+        """
+
+        if note_id not in self._notes.keys():
+            return False
+
+        cell = self._cell(*self._note_positions.pop(note_id))
+        del self._notes[note_id]
+
+        self._note_cells[cell].discard(note_id)
+        if not self._note_cells[cell]:
+            del self._note_cells[cell]
+
+        return True
+
+    def add_changeset(self, changeset: OSMChangeset) -> bool:
+        """
+        Add a changeset, replacing the one with the same id if any
+        :param changeset: The changeset
+        :return: False if it wasn't added because it doesn't have any bounding box
+        """
+
+        self.remove_changeset(changeset.id)
+
+        if changeset.bounding_box is None:
+            return False
+
+        boxes = changeset.bounding_box.split_date_line()
+
+        self._changesets[changeset.id] = changeset
+        self._changeset_boxes[changeset.id] = boxes
+
+        if sum(self._cells_count(i) for i in boxes) > self.max_changeset_cells:
+            self._large_changesets.add(changeset.id)
+
+        else:
+            for box in boxes:
+                for cell in self._cells(box):
+                    self._changeset_cells.setdefault(cell, set()).add(changeset.id)
+
+        return True
+
+    def add_changesets(self, changesets: Iterable[OSMChangeset]) -> None:
+        """
+        :param changesets: Changesets to add, replacing those with the same id. Those without bounding box are ignored
+        :return: None
+        """
+
+        for changeset in changesets:
+            self.add_changeset(changeset)
+
+    def remove_changeset(self, changeset_id: int) -> bool:
+        """
+        :param changeset_id: The changeset id
+        :return: True if it was in this index
+        """
+
+        if changeset_id not in self._changesets.keys():
+            return False
+
+        del self._changesets[changeset_id]
+        boxes = self._changeset_boxes.pop(changeset_id)
+
+        if changeset_id in self._large_changesets:
+            self._large_changesets.discard(changeset_id)
+
+        else:
+            for box in boxes:
+                for cell in self._cells(box):
+                    self._changeset_cells[cell].discard(changeset_id)
+                    if not self._changeset_cells[cell]:
+                        del self._changeset_cells[cell]
+
+        return True
+
+    def query_notes(self, bbox: OSMBoundingBox) -> Tuple[OSMNote, ...]:
+        """
+        :param bbox: A bounding box, it can cross date line
+        :return: Notes inside it (borders included)
+        """
+
+        result: List[OSMNote] = []
+
+        for part in bbox.split_date_line():
+            if self._cells_count(part) > len(self._notes):
+                candidates = self._notes.keys()
+
+            else:
+                candidates = [i for cell in self._cells(part) for i in self._note_cells.get(cell, ())]
+
+            for note_id in candidates:
+                lon, lat = self._note_positions[note_id]
+
+                if part.left <= lon <= part.right and part.bottom <= lat <= part.top:
+                    result.append(self._notes[note_id])
+
+        return tuple(result)
+
+    def query_changesets(self, bbox: OSMBoundingBox) -> Tuple[OSMChangeset, ...]:
+        """
+        :param bbox: A bounding box, it can cross date line
+        :return: Changesets whose bounding box intersects it
+        """
+
+        found: Set[int] = set()
+
+        for part in bbox.split_date_line():
+            if self._cells_count(part) > len(self._changesets):
+                candidates = self._changesets.keys()
+
+            else:
+                candidates = {i for cell in self._cells(part) for i in self._changeset_cells.get(cell, ())}
+                candidates.update(self._large_changesets)
+
+            for changeset_id in candidates:
+                if changeset_id not in found and any(
+                        i.left <= part.right and i.right >= part.left and i.bottom <= part.top and i.top >= part.bottom
+                        for i in self._changeset_boxes[changeset_id]
+                ):
+                    found.add(changeset_id)
+
+        return tuple([self._changesets[i] for i in found])
+
+    def nearest_notes(
+            self,
+            lon: float,
+            lat: float,
+            k: int = 1,
+            max_distance: float | None = None
+    ) -> Tuple[Tuple[float, OSMNote], ...]:
+        """
+        Find the k nearest notes of a point. Distances are approximated with an equirectangular projection, which is
+        accurate for distances up to a few hundred kilometers
+        :param lon: Longitude of the point
+        :param lat: Latitude of the point
+        :param k: Maximal number of notes to return
+        :param max_distance: Maximal distance of returned notes in meters, or None for no limit
+        :return: Tuples (distance in meters, note), nearest first
+
+        :except ValueError: If k isn't a positive value
+        """
+
+        if k < 1:
+            raise ValueError("k must be a positive value")
+
+        scale = math.cos(math.radians(lat))
+        center_x, center_y = self._cell(lon, lat)
+
+        # Max heap (using opposite distances) of the k nearest notes found yet
+        best: List[Tuple[float, int]] = []
+        visited: Set[_cell] = set()
+        seen = 0
+
+        for ring in range(max(self._columns, self._rows) + 1):
+            # Notes in cells not visited yet are at least this far
+            lower_bound = max(0, ring - 1) * self.cell_size * scale * METERS_PER_DEGREE
+
+            if (len(best) == k and -best[0][0] <= lower_bound) or \
+                    (max_distance is not None and lower_bound > max_distance):
+                break
+
+            if seen == len(self._notes):
+                break
+
+            for cell in self._ring(center_x, center_y, ring):
+                if cell in visited:
+                    continue
+
+                visited.add(cell)
+
+                for note_id in self._note_cells.get(cell, ()):
+                    seen += 1
+                    note_lon, note_lat = self._note_positions[note_id]
+                    delta_lon = (note_lon - lon + 180) % 360 - 180
+
+                    distance = math.hypot(delta_lon * scale, note_lat - lat) * METERS_PER_DEGREE
+
+                    if max_distance is not None and distance > max_distance:
+                        continue
+
+                    if len(best) < k:
+                        heapq.heappush(best, (-distance, note_id))
+
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, note_id))
+
+        return tuple([(-distance, self._notes[i]) for distance, i in sorted(best, reverse=True)])
+
+    def _ring(self, center_x: int, center_y: int, ring: int) -> Iterable[_cell]:
+        """
+        :param center_x: Column of the center cell
+        :param center_y: Row of the center cell
+        :param ring: Distance in cells from the center
+        :return: Cells at this distance, wrapping around date line
+        """
+
+        for y in range(max(0, center_y - ring), min(self._rows - 1, center_y + ring) + 1):
+            if abs(y - center_y) == ring:
+                xs = range(center_x - ring, center_x + ring + 1)
+
+            else:
+                xs = (center_x - ring, center_x + ring)
+
+            for x in xs:
+                yield x % self._columns, y
+
+    def get_note(self, note_id: int) -> OSMNote | None:
+        """
+        :param note_id: The note id
+        :return: The note, or None if it isn't in this index
+        """
+
+        return self._notes.get(note_id)
+
+    def get_changeset(self, changeset_id: int) -> OSMChangeset | None:
+        """
+        :param changeset_id: The changeset id
+        :return: The changeset, or None if it isn't in this index
+        """
+
+        return self._changesets.get(changeset_id)
+
+    def clear(self) -> None:
+        """
+        Remove every note and changeset
+        :return: None
+        """
+
+        self._notes.clear()
+        self._note_positions.clear()
+        self._note_cells.clear()
+
+        self._changesets.clear()
+        self._changeset_boxes.clear()
+        self._changeset_cells.clear()
+        self._large_changesets.clear()
+
+    def __len__(self) -> int:
+        return len(self._notes) + len(self._changesets)
+
+    def __str__(self) -> str:
+        """
+        Convert this class into a string
+        :return: The generated string
+        """
+
+        return (f"<OSMSpatialIndex object: notes={len(self._notes)}, changesets={len(self._changesets)}, "
+                f"cell_size={self.cell_size}>")
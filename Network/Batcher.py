@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Set, Tuple, TypeVar
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+class OSMBatcher(Generic[_K, _V]):
+    """
+    Merge single lookups made within a short delay into one bulk lookup, and give its results back to each caller
+    """
+
+    def __init__(
+            self,
+            fetch_batch: Callable[[Tuple[_K, ...]], Awaitable[Dict[_K, _V | None] | None]],
+            delay: float = 0.005,
+            max_batch_size: int = 100
+    ) -> None:
+        """
+        :param fetch_batch: Coroutine fetching several keys at once, returning a dict associating keys to their value,
+        or None if it failed. Missing keys get None
+        :param delay: Number of seconds lookups are collected for after the first one, before being fetched
+        :param max_batch_size: Lookups are fetched as soon as this number of different keys is collected
+
+        :except ValueError: If delay is negative or max_batch_size isn't positive
+        """
+
+        if delay < 0:
+            raise ValueError("Invalid delay: must be a positive number")
+
+        if max_batch_size <= 0:
+            raise ValueError("Invalid max_batch_size: must be a positive integer")
+
+        self.fetch_batch: Callable[[Tuple[_K, ...]], Awaitable[Dict[_K, _V | None] | None]] = fetch_batch
+        self.delay: float = delay
+        self.max_batch_size: int = max_batch_size
+
+        self._pending: Dict[_K, asyncio.Future] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+        # Keeps a reference to running batches so they aren't garbage collected
+        self._running: Set[asyncio.Task] = set()
+
+    async def load(self, key: _K) -> _V | None:
+        """
+        Fetch a key with the next batch. Cancelling a caller doesn't cancel its batch
+
+        :param key: The key to fetch
+        :return: Its value, or None if it is missing or if its batch failed
+
+        :except Exception: Any exception raised by fetch_batch
+        """
+
+        future = self._pending.get(key)
+
+        if future is None:
+            loop = asyncio.get_running_loop()
+
+            future = loop.create_future()
+            self._pending[key] = future
+
+            if len(self._pending) >= self.max_batch_size:
+                self.dispatch()
+
+            elif self._timer is None:
+                self._timer = loop.call_later(self.delay, self.dispatch)
+
+        return await asyncio.shield(future)
+
+    def dispatch(self) -> None:
+        """
+        Fetch lookups collected so far now, without waiting for the delay to end
+        :return: None
+        """
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if len(self._pending) == 0:
+            return
+
+        pending = self._pending
+        self._pending = {}
+
+        task = asyncio.ensure_future(self._run(pending))
+
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, pending: Dict[_K, asyncio.Future]) -> None:
+        """
+        Fetch a batch and give its results to its callers
+        :param pending: Futures of every key of the batch
+        :return: None
+        """
+
+        try:
+            result = await self.fetch_batch(tuple(pending.keys()))
+
+        except asyncio.CancelledError:
+            for future in pending.values():
+                future.cancel()
+
+            raise
+
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+
+            return
+
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(None if result is None else result.get(key))
+
+    def __len__(self) -> int:
+        """
+        :return: Number of keys waiting for their batch to be fetched
+        """
+
+        return len(self._pending)
+
+    def __str__(self) -> str:
+        """
+        :return: A string corresponding to this object
+        """
+
+        return f"<OSMBatcher object: {len(self._pending)} pending, delay={self.delay}, max={self.max_batch_size}>"
@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import time
+from typing import Dict, Optional
+
+from .Response import OSMResponse
+from .ResponseCache import OSMResponseCache
+from .Transport import OSMTransport
+
+
+class OSMCachedTransport(OSMTransport):
+    """
+    Transport storing successful responses in an OSMResponseCache
+    Responses younger than max_age are served directly. Older ones are revalidated using If-None-Match and
+    If-Modified-Since headers, so the body is only downloaded again if it changed
+    """
+
+    def __init__(self, transport: OSMTransport, cache: OSMResponseCache, max_age: float = 0) -> None:
+        """
+        :param transport: The transport actually performing requests
+        :param cache: The cache to store responses in
+        :param max_age: Number of seconds a stored response is served without being revalidated
+        """
+
+        self.transport: OSMTransport = transport
+        self.cache: OSMResponseCache = cache
+        self.max_age: float = max_age
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> OSMResponse:
+        """
+        Serve a stored response or perform a GET request, conditional if a response is stored
+
+        :param url: The url to request
+        :param headers: Additional headers to send
+        :return: The response fully read
+        """
+
+        cached = await self.cache.get(url)
+
+        if cached is not None and time.time() - cached[1] < self.max_age:
+            return cached[0]
+
+        headers = {} if headers is None else dict(headers)
+
+        if cached is not None:
+            etag, last_modified = await self.cache.get_validators(url)
+
+            if etag is not None:
+                headers["If-None-Match"] = etag
+
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
+
+        response = await self.transport.get(url, headers)
+
+        if response.status == 304 and cached is not None:
+            await self.cache.touch(url)
+            return cached[0]
+
+        if response.status == 200:
+            await self.cache.put(response)
+
+        return response
+
+    async def prewarm(self, url: str, connections: int = 1) -> None:
+        """
+        Prewarm the underlying transport
+
+        :param url: An url located on the host to open connections to
+        :param connections: Number of connections to open
+        :return: None
+        """
+
+        await self.transport.prewarm(url, connections)
+
+    async def close(self) -> None:
+        """
+        Close the underlying transport. The cache is left open as it may be shared
+        :return: None
+        """
+
+        await self.transport.close()
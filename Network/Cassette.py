@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import hashlib
+import json
+import os
+
+from .Response import OSMResponse
+
+
+class OSMCassette:
+    """
+    This class represent a directory of recorded responses
+    Each response is stored as 2 files named after the hash of its url:
+    <hash>.json containing url, status and headers and <hash>.body containing the raw body
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: The directory where responses are stored. It's created if it doesn't exist
+        """
+
+        self.path: str = path
+
+        os.makedirs(self.path, exist_ok=True)
+
+    @staticmethod
+    def key(url: str) -> str:
+        """
+        Get the name under which the response of an url is stored
+        :param url: The requested url
+        :return: The key of this url
+        """
+
+        return hashlib.sha256(f"GET {url}".encode("utf-8")).hexdigest()
+
+    def save(self, response: OSMResponse) -> None:
+        """
+        Store a response, replacing any previous response to the same url
+
+        :param response: The response to store
+        :return: None
+        """
+
+        key = self.key(response.url)
+
+        with open(os.path.join(self.path, f"{key}.body"), "wb") as f:
+            f.write(response.body)
+
+        with open(os.path.join(self.path, f"{key}.json"), "w", encoding="utf-8") as f:
+            json.dump({"url": response.url, "status": response.status, "headers": response.headers}, f)
+
+    def load(self, url: str) -> OSMResponse | None:
+        """
+        Load the response stored for an url
+
+        :param url: The requested url
+        :return: The stored response, or None if this url was never recorded
+        """
+
+        key = self.key(url)
+
+        try:
+            with open(os.path.join(self.path, f"{key}.json"), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+
+            with open(os.path.join(self.path, f"{key}.body"), "rb") as f:
+                body = f.read()
+
+        except FileNotFoundError:
+            return None
+
+        return OSMResponse(meta["url"], meta["status"], meta["headers"], body)
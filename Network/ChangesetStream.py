@@ -0,0 +1,162 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import zlib
+from typing import AsyncIterator, Dict, List
+from xml.etree.ElementTree import Element, XMLPullParser
+
+from ..Objects import OSMChangeset
+
+# Chunks are fed to the parser by slices of this size, so a big chunk doesn't build a big tree before being cleared
+_FEED_SIZE = 65536
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Replication files name the number of changes num_changes, while the json API names it changes_count
+_INT_ATTRIBUTES = {
+    "id": "id", "uid": "uid", "num_changes": "changes_count", "changes_count": "changes_count",
+    "comments_count": "comments_count"
+}
+_FLOAT_ATTRIBUTES = ("min_lon", "min_lat", "max_lon", "max_lat")
+
+
+def _changeset_to_json(element: Element) -> Dict[str, object]:
+    """
+    Convert an XML changeset into the json format used by the API, so it can be given to OSMChangeset
+    :param element: A changeset XML element
+    :return: The json equivalent
+    """
+
+    json_changeset: Dict[str, object] = {"uid": -1, "user": "", "changes_count": 0, "comments_count": 0}
+
+    for key, value in element.attrib.items():
+        if key in _INT_ATTRIBUTES.keys():
+            json_changeset[_INT_ATTRIBUTES[key]] = int(value)
+
+        elif key in _FLOAT_ATTRIBUTES:
+            json_changeset[key] = float(value)
+
+        elif key == "open":
+            json_changeset[key] = value == "true"
+
+        else:
+            json_changeset[key] = value
+
+    tags: Dict[str, str] = {}
+    comments: List[Dict[str, object]] = []
+
+    for child in element:
+        if child.tag == "tag":
+            tags[child.attrib["k"]] = child.attrib["v"]
+
+        elif child.tag == "discussion":
+            for comment in child:
+                json_comment: Dict[str, object] = {
+                    "id": int(comment.attrib.get("id", -1)),
+                    "visible": comment.attrib.get("visible", "true") == "true",
+                    "date": comment.attrib["date"],
+                    "text": comment.findtext("text", "")
+                }
+
+                if "uid" in comment.attrib.keys():
+                    json_comment["uid"] = int(comment.attrib["uid"])
+                    json_comment["user"] = comment.attrib["user"]
+
+                comments.append(json_comment)
+
+    if tags:
+        json_changeset["tags"] = tags
+
+    if comments:
+        json_changeset["comments"] = comments
+
+    return json_changeset
+
+
+async def _gunzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Decompress chunks progressively if they are gzipped, or yield them unchanged otherwise
+    :param chunks: Asynchronous iterator over the body chunks
+    :return: An asynchronous iterator over the decompressed chunks
+    """
+
+    decompressor = None
+    header = b""
+
+    async for chunk in chunks:
+        if decompressor is None:
+            # The magic number may be split between 2 chunks
+            header += chunk
+
+            if len(header) < len(_GZIP_MAGIC):
+                continue
+
+            if not header.startswith(_GZIP_MAGIC):
+                yield header
+
+                async for i in chunks:
+                    yield i
+
+                return
+
+            decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            chunk = header
+
+        data = decompressor.decompress(chunk)
+
+        if data:
+            yield data
+
+    if decompressor is None:
+        if header:
+            yield header
+
+        return
+
+    data = decompressor.flush()
+
+    if data:
+        yield data
+
+
+async def iter_changesets_xml(chunks: AsyncIterator[bytes], lazy: bool = False) -> AsyncIterator[OSMChangeset]:
+    """
+    Parse an XML document containing changesets progressively (e.g. a replication diff), each changeset being yielded
+    as soon as it is complete. The document can be gzipped
+    XML elements are removed from the tree once parsed, so memory use doesn't grow with the document size
+    :param chunks: Asynchronous iterator over the document chunks
+    :param lazy: Passed to OSMChangeset
+    :return: An asynchronous iterator over the changesets
+
+    :except xml.etree.ElementTree.ParseError: If the document isn't valid XML
+    :except zlib.error: If the document is corrupted gzip
+    """
+
+    parser = XMLPullParser(events=("start", "end"))
+
+    # Currently open XML elements, the last one being the deepest
+    stack: List[Element] = []
+
+    async for chunk in _gunzip(chunks):
+        for start in range(0, len(chunk), _FEED_SIZE):
+            parser.feed(chunk[start:start + _FEED_SIZE])
+
+            for event, element in parser.read_events():
+                if event == "start":
+                    stack.append(element)
+                    continue
+
+                stack.pop()
+
+                if element.tag != "changeset":
+                    continue
+
+                yield OSMChangeset(_changeset_to_json(element), lazy=lazy)
+
+                # Parsed elements aren't needed anymore
+                element.clear()
+
+                if stack and len(stack[-1]) and stack[-1][-1] is element:
+                    del stack[-1][-1]
+
+    parser.close()
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+import aiohttp
+
+from .Response import OSMResponse
+from .StreamResponse import OSMStreamResponse
+from .Transport import OSMTransport
+
+
+class OSMHTTPTransport(OSMTransport):
+    """
+    Transport performing real HTTP requests through one pooled aiohttp session
+    """
+
+    def __init__(
+            self,
+            connections_limit: int = 100,
+            connections_limit_per_host: int = 10,
+            keepalive_timeout: float = 30,
+            dns_cache_ttl: int = 300
+    ) -> None:
+        """
+        :param connections_limit: Maximum number of simultaneous connections kept by the pool
+        :param connections_limit_per_host: Maximum number of simultaneous connections to the same host
+        :param keepalive_timeout: Number of seconds an idle connection is kept alive for reuse
+        :param dns_cache_ttl: Number of seconds a resolved DNS entry is cached for
+        """
+
+        self._connections_limit: int = connections_limit
+        self._connections_limit_per_host: int = connections_limit_per_host
+        self._keepalive_timeout: float = keepalive_timeout
+        self._dns_cache_ttl: int = dns_cache_ttl
+
+        self._session: aiohttp.ClientSession | None = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled session, creating it if needed
+
+        :return: The opened session
+        """
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._connections_limit,
+                limit_per_host=self._connections_limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self._dns_cache_ttl
+            )
+
+            self._session = aiohttp.ClientSession(connector=connector)
+
+        return self._session
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> OSMResponse:
+        """
+        Perform a GET request
+
+        :param url: The url to request
+        :param headers: Additional headers to send
+        :return: The response fully read
+        """
+
+        session = await self._get_session()
+
+        async with session.get(url, headers=headers) as resp:
+            return OSMResponse(url, resp.status, dict(resp.headers), await resp.read())
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers: Optional[Dict[str, str]] = None) -> AsyncIterator[OSMStreamResponse]:
+        """
+        Perform a GET request whose body chunks are yielded as soon as they are received
+
+        :param url: The url to request
+        :param headers: Additional headers to send
+        :return: The response, whose body can be read until leaving the context
+        """
+
+        session = await self._get_session()
+
+        async with session.get(url, headers=headers) as resp:
+            yield OSMStreamResponse(url, resp.status, dict(resp.headers), resp.content.iter_any())
+
+    async def prewarm(self, url: str, connections: int = 1) -> None:
+        """
+        Open connections in advance so the first calls don't pay TCP and TLS handshakes
+
+        :param url: An url located on the host to open connections to
+        :param connections: Number of connections to open. Capped by connections_limit_per_host
+        :return: None
+        """
+
+        session = await self._get_session()
+
+        async def open_connection() -> None:
+            try:
+                async with session.head(url) as resp:
+                    await resp.read()
+
+            except aiohttp.ClientError as e:
+                sys.stderr.write(f"WARNING: Couldn't prewarm connection to {url}: {e}\n")
+
+        await asyncio.gather(*[open_connection() for _ in range(min(connections, self._connections_limit_per_host))])
+
+    async def close(self) -> None:
+        """
+        Close the pooled session and every connection it holds. A new session will be opened on next call
+
+        :return: None
+        """
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
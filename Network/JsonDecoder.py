@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import json
+from typing import Callable, Tuple
+
+type Decoder = Callable[[bytes], object]
+
+
+def _find_decoder() -> Tuple[str, Decoder]:
+    """
+    Find the fastest installed json decoder reading bytes directly: orjson, then msgspec, then the standard library
+    :return: A tuple (decoder name, decoder)
+    """
+
+    try:
+        import orjson
+
+        return "orjson", orjson.loads
+
+    except ImportError:
+        pass
+
+    try:
+        import msgspec
+
+        return "msgspec", msgspec.json.Decoder().decode
+
+    except ImportError:
+        pass
+
+    return "json", json.loads
+
+
+_DEFAULT_NAME, _DEFAULT_DECODER = _find_decoder()
+
+_decoder_name: str = _DEFAULT_NAME
+_decoder: Decoder = _DEFAULT_DECODER
+
+
+def decode_json(body: bytes) -> object:
+    """
+    Decode a json body with the current decoder
+    :param body: The raw json
+    :return: The decoded json
+    """
+
+    return _decoder(body)
+
+
+def set_json_decoder(decoder: Decoder | None, name: str = "custom") -> None:
+    """
+    Change the decoder used for every response
+    :param decoder: A function decoding json bytes, or None to use the fastest installed one again
+    :param name: Name of this decoder, returned by get_json_decoder_name
+    :return: None
+    """
+
+    global _decoder, _decoder_name
+
+    if decoder is None:
+        _decoder_name, _decoder = _DEFAULT_NAME, _DEFAULT_DECODER
+
+    else:
+        _decoder_name, _decoder = name, decoder
+
+
+def get_json_decoder_name() -> str:
+    """
+    :return: Name of the decoder currently used ("orjson", "msgspec", "json" or a custom name)
+    """
+
+    return _decoder_name
@@ -0,0 +1,235 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import codecs
+import json
+import re
+from typing import AsyncIterator, List
+
+# Characters changing the structure of a json document. Everything else (numbers, literals, spaces) is skipped at once
+_TOKEN = re.compile(r'["{}\[\],:]')
+
+# End of a string, starting after its opening quote
+_STRING_END = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+
+_SPACES = re.compile(r"[ \t\n\r]*")
+
+# Characters continuing a number whose fraction or exponent wasn't received yet
+_NUMBER_CONTINUATION = ".eE"
+
+_DECODER = json.JSONDecoder()
+
+_SEEK, _ARRAY, _DONE = range(3)
+
+
+class _ArrayScanner:
+    """
+    Incremental parser of an array stored under a key of the top level json object
+    The document structure is followed until reaching the array, then each element is decoded at once when complete
+    """
+
+    def __init__(self, key: str) -> None:
+        """
+        :param key: The key of the array in the top level object
+        """
+
+        self.key: str = key
+
+        self.phase: int = _SEEK
+
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer: str = ""
+        self._position: int = 0
+
+        # Used while looking for the key
+        self._depth: int = 0
+        self._expect_key: bool = False
+        self._last_key: str | None = None
+        self._want_array: bool = False
+
+        # Buffer length to reach before trying again to decode an incomplete element, so big elements are decoded in
+        # linear time instead of being tried again at each chunk
+        self._retry_length: int = 0
+
+    def feed(self, chunk: bytes) -> List[object]:
+        """
+        Parse a new chunk of the document
+        :param chunk: The chunk
+        :return: The elements completed by this chunk
+        """
+
+        if self.phase == _DONE:
+            return []
+
+        self._buffer += self._utf8.decode(chunk)
+
+        if self.phase == _SEEK:
+            self._seek()
+
+        elements: List[object] = []
+
+        if self.phase == _ARRAY and len(self._buffer) >= self._retry_length:
+            self._decode_elements(elements)
+
+        self._buffer = self._buffer[self._position:]
+        self._retry_length = max(0, self._retry_length - self._position)
+        self._position = 0
+
+        return elements
+
+    def flush(self) -> List[object]:
+        """
+        Decode every complete element left once the whole document is received
+        :return: The elements not returned yet
+        """
+
+        elements: List[object] = []
+
+        if self.phase == _ARRAY:
+            self._decode_elements(elements)
+
+        return elements
+
+    def finish(self) -> None:
+        """
+        Check the whole document was parsed, once it is received and flushed
+        :return: None
+
+        :except json.JSONDecodeError: If the document ended before the array was closed, e.g. if it was truncated
+        """
+
+        if self.phase != _DONE:
+            raise json.JSONDecodeError("Document truncated before the end of the array", self._buffer, self._position)
+
+    def _seek(self) -> None:
+        """
+        Follow the top level object structure until reaching the wanted array
+        :return: None
+        """
+
+        buffer = self._buffer
+
+        while self.phase == _SEEK:
+            match = _TOKEN.search(buffer, self._position)
+
+            if match is None:
+                self._position = len(buffer)
+                return
+
+            index = match.start()
+            token = buffer[index]
+
+            if token == '"':
+                end = _STRING_END.match(buffer, index + 1)
+
+                if end is None:
+                    # Incomplete string, parsed again from its start with next chunk
+                    self._position = index
+                    return
+
+                self._position = end.end()
+
+                if self._depth == 1:
+                    if self._expect_key:
+                        self._last_key = buffer[index + 1:self._position - 1]
+                        self._expect_key = False
+
+                    else:
+                        self._want_array = False
+
+                continue
+
+            self._position = index + 1
+
+            if token == "[" and self._depth == 1 and self._want_array:
+                self.phase = _ARRAY
+
+            elif token in "{[":
+                self._depth += 1
+                self._expect_key = self._depth == 1 and token == "{"
+                self._want_array = False
+
+            elif token in "}]":
+                self._depth -= 1
+                self._want_array = False
+
+                if self._depth == 0:
+                    self.phase = _DONE
+
+            elif self._depth == 1 and token == ",":
+                self._expect_key = True
+                self._want_array = False
+
+            elif self._depth == 1 and token == ":":
+                self._want_array = self._last_key == self.key
+
+    def _decode_elements(self, elements: List[object]) -> None:
+        """
+        Decode every complete element of the array
+        :param elements: List to add decoded elements to
+        :return: None
+        """
+
+        buffer = self._buffer
+        position = self._position
+
+        while True:
+            position = _SPACES.match(buffer, position).end()
+
+            if position == len(buffer):
+                break
+
+            if buffer[position] == "]":
+                self.phase = _DONE
+                position += 1
+                break
+
+            if buffer[position] == ",":
+                position += 1
+                continue
+
+            try:
+                element, end = _DECODER.raw_decode(buffer, position)
+
+            except json.JSONDecodeError:
+                self._retry_length = 2 * len(buffer)
+                break
+
+            # A number can be cut by the end of a chunk (e.g. "12" of "12.5e3"), it is complete only if followed by
+            # something which can't continue it. An array always ends with "]", so this still holds once the whole
+            # document is received
+            if buffer[end - 1].isdigit() and (end == len(buffer) or buffer[end] in _NUMBER_CONTINUATION):
+                self._retry_length = len(buffer) + 1
+                break
+
+            elements.append(element)
+            position = end
+
+        self._position = position
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes], key: str) -> AsyncIterator[object]:
+    """
+    Decode the elements of an array stored under a key of the top level object of a json document, each of them being
+    yielded as soon as it is received. Other keys are skipped
+    :param chunks: Asynchronous iterator over the document chunks
+    :param key: The key of the array, e.g. "features" or "changesets"
+    :return: An asynchronous iterator over the decoded elements
+
+    :except json.JSONDecodeError: If the document ended before the array was closed, e.g. if it was truncated. Elements
+    received before are still yielded
+    """
+
+    scanner = _ArrayScanner(key)
+
+    async for chunk in chunks:
+        for element in scanner.feed(chunk):
+            yield element
+
+        if scanner.phase == _DONE:
+            return
+
+    for element in scanner.flush():
+        yield element
+
+    scanner.finish()
@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from typing import AsyncIterator, Dict, List
+from xml.etree.ElementTree import Element, XMLPullParser
+
+from ..Objects import OSMChange
+from ..Objects import OSMChangeAction
+from ..Objects import OSMElement
+
+_ACTIONS = {i.value: i for i in OSMChangeAction}
+_ELEMENT_TYPES = ("node", "way", "relation")
+
+# Chunks are fed to the parser by slices of this size, so a big chunk doesn't build a big tree before being cleared
+_FEED_SIZE = 65536
+
+_INT_ATTRIBUTES = ("id", "version", "changeset", "uid")
+_FLOAT_ATTRIBUTES = ("lat", "lon")
+
+
+def _element_to_json(element: Element) -> Dict[str, object]:
+    """
+    Convert an XML element into the json format used by the API, so it can be given to OSMElement
+    :param element: A node, way or relation XML element
+    :return: The json equivalent
+    """
+
+    json_element: Dict[str, object] = {"type": element.tag}
+
+    for key, value in element.attrib.items():
+        if key in _INT_ATTRIBUTES:
+            json_element[key] = int(value)
+
+        elif key in _FLOAT_ATTRIBUTES:
+            json_element[key] = float(value)
+
+        elif key == "visible":
+            json_element[key] = value == "true"
+
+        else:
+            json_element[key] = value
+
+    tags: Dict[str, str] = {}
+    nodes: List[int] = []
+    members: List[Dict[str, object]] = []
+
+    for child in element:
+        if child.tag == "tag":
+            tags[child.attrib["k"]] = child.attrib["v"]
+
+        elif child.tag == "nd":
+            nodes.append(int(child.attrib["ref"]))
+
+        elif child.tag == "member":
+            members.append({"type": child.attrib["type"], "ref": int(child.attrib["ref"]), "role": child.attrib["role"]})
+
+    json_element["tags"] = tags
+
+    if element.tag == "way":
+        json_element["nodes"] = nodes
+
+    elif element.tag == "relation":
+        json_element["members"] = members
+
+    return json_element
+
+
+async def iter_osm_change(chunks: AsyncIterator[bytes]) -> AsyncIterator[OSMChange]:
+    """
+    Parse an osmChange XML document progressively, each change being yielded as soon as its element is complete
+    XML elements are removed from the tree once parsed, so memory use doesn't grow with the document size
+    :param chunks: Asynchronous iterator over the document chunks
+    :return: An asynchronous iterator over the changes
+
+    :except xml.etree.ElementTree.ParseError: If the document isn't valid XML or was truncated
+    """
+
+    parser = XMLPullParser(events=("start", "end"))
+
+    # Currently open XML elements, the last one being the deepest
+    stack: List[Element] = []
+    action: OSMChangeAction | None = None
+
+    async for chunk in chunks:
+        for start in range(0, len(chunk), _FEED_SIZE):
+            parser.feed(chunk[start:start + _FEED_SIZE])
+
+            for event, element in parser.read_events():
+                if event == "start":
+                    stack.append(element)
+
+                    if element.tag in _ACTIONS.keys():
+                        action = _ACTIONS[element.tag]
+
+                    continue
+
+                stack.pop()
+
+                if element.tag in _ELEMENT_TYPES and action is not None:
+                    yield OSMChange(action, OSMElement(_element_to_json(element)))
+
+                elif element.tag in _ACTIONS.keys():
+                    action = None
+
+                else:
+                    continue
+
+                # Parsed elements aren't needed anymore
+                element.clear()
+
+                if stack and len(stack[-1]) and stack[-1][-1] is element:
+                    del stack[-1][-1]
+
+    parser.close()
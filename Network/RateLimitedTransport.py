@@ -0,0 +1,262 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import asyncio
+import random
+import sys
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from .Response import OSMResponse
+from .StreamResponse import OSMStreamResponse
+from .TokenBucket import OSMTokenBucket
+from .Transport import OSMTransport
+
+
+class OSMRateLimitedTransport(OSMTransport):
+    """
+    Transport limiting the rate of requests forwarded to another transport, with one token bucket per host
+    Throttled (429, 509) and failed (5xx, connection errors) requests are retried with jittered exponential backoff,
+    honouring Retry-After. The rate is halved when throttled and slowly raised back on success
+    """
+
+    THROTTLE_STATUSES = (429, 509)
+    RETRY_STATUSES = (429, 500, 502, 503, 504, 509)
+
+    def __init__(
+            self,
+            transport: OSMTransport,
+            requests_per_second: float = 10,
+            max_concurrency: int = 10,
+            max_retries: int = 3,
+            backoff_base: float = 0.5,
+            backoff_max: float = 60,
+            min_requests_per_second: float = 0.1
+    ) -> None:
+        """
+        :param transport: The transport actually performing requests (usually an OSMHTTPTransport)
+        :param requests_per_second: Maximum number of requests sent to a host per second
+        :param max_concurrency: Maximum number of requests in flight to a host
+        :param max_retries: Maximum number of retries of a request. 0 disables retries
+        :param backoff_base: Backoff in seconds before first retry, doubled at each retry
+        :param backoff_max: Maximum backoff in seconds
+        :param min_requests_per_second: Rate under which throttling won't lower a host rate
+        """
+
+        self.transport: OSMTransport = transport
+
+        self.requests_per_second: float = requests_per_second
+        self.max_concurrency: int = max_concurrency
+        self.max_retries: int = max_retries
+        self.backoff_base: float = backoff_base
+        self.backoff_max: float = backoff_max
+        self.min_requests_per_second: float = min_requests_per_second
+
+        self._buckets: Dict[str, OSMTokenBucket] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def get_rate(self, url: str) -> float:
+        """
+        Get the current rate of requests allowed to the host of an url
+
+        :param url: An url located on the host
+        :return: The current number of requests per second
+        """
+
+        host = urlparse(url).netloc
+
+        return self._buckets[host].rate if host in self._buckets.keys() else self.requests_per_second
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> OSMResponse:
+        """
+        Perform a GET request once allowed by the rate limit, retrying it if needed
+
+        :param url: The url to request
+        :param headers: Additional headers to send
+        :return: The last response received
+
+        :except aiohttp.ClientError: If the last retry failed with a connection error
+        :except asyncio.TimeoutError: If the last retry timed out
+        """
+
+        host = self._register_host(url)
+
+        bucket = self._buckets[host]
+        attempt = 0
+
+        while True:
+            await bucket.acquire()
+
+            try:
+                async with self._semaphores[host]:
+                    response = await self.transport.get(url, headers)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_retries:
+                    raise
+
+                sys.stderr.write(f"WARNING: Request to {url} failed ({e!r}), retrying\n")
+                await asyncio.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+
+            self._update_rate(bucket, response.status)
+
+            if response.status not in self.RETRY_STATUSES or attempt >= self.max_retries:
+                return response
+
+            delay = self._retry_after(response)
+
+            if delay is None:
+                delay = self._backoff(attempt)
+
+            else:
+                bucket.pause(delay)
+
+            sys.stderr.write(f"WARNING: Request to {url} returned {response.status}, retrying in {delay:.1f}s\n")
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers: Optional[Dict[str, str]] = None) -> AsyncIterator[OSMStreamResponse]:
+        """
+        Perform a GET request whose body is read progressively, once allowed by the rate limit, retrying it if needed
+        The request counts as in flight until leaving the context
+
+        :param url: The url to request
+        :param headers: Additional headers to send
+        :return: The response, whose body can be read until leaving the context
+
+        :except aiohttp.ClientError: If the last retry failed with a connection error
+        :except asyncio.TimeoutError: If the last retry timed out
+        """
+
+        host = self._register_host(url)
+
+        bucket = self._buckets[host]
+        attempt = 0
+
+        while True:
+            await bucket.acquire()
+            delay = None
+
+            async with AsyncExitStack() as stack:
+                await stack.enter_async_context(self._semaphores[host])
+
+                try:
+                    response = await stack.enter_async_context(self.transport.stream(url, headers))
+
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if attempt >= self.max_retries:
+                        raise
+
+                    sys.stderr.write(f"WARNING: Request to {url} failed ({e!r}), retrying\n")
+                    response = None
+
+                if response is not None:
+                    self._update_rate(bucket, response.status)
+
+                    if response.status not in self.RETRY_STATUSES or attempt >= self.max_retries:
+                        yield response
+                        return
+
+                    delay = self._retry_after(response)
+
+                    if delay is not None:
+                        bucket.pause(delay)
+
+                    sys.stderr.write(f"WARNING: Request to {url} returned {response.status}, retrying\n")
+
+            await asyncio.sleep(self._backoff(attempt) if delay is None else delay)
+            attempt += 1
+
+    def _register_host(self, url: str) -> str:
+        """
+        Create the token bucket and semaphore of the host of an url if needed
+
+        :param url: An url located on the host
+        :return: The host
+        """
+
+        host = urlparse(url).netloc
+
+        if host not in self._buckets.keys():
+            self._buckets[host] = OSMTokenBucket(self.requests_per_second)
+            self._semaphores[host] = asyncio.Semaphore(self.max_concurrency)
+
+        return host
+
+    def _update_rate(self, bucket: OSMTokenBucket, status: int) -> None:
+        """
+        Halve the rate of a host when throttled, slowly raise it back on success
+
+        :param bucket: The token bucket of the host
+        :param status: The HTTP status code received
+        :return: None
+        """
+
+        if status in self.THROTTLE_STATUSES:
+            bucket.set_rate(max(self.min_requests_per_second, bucket.rate / 2))
+
+        elif status < 500:
+            bucket.set_rate(min(self.requests_per_second, bucket.rate + self.requests_per_second / 20))
+
+    def _backoff(self, attempt: int) -> float:
+        """
+        Get the delay before a retry, using full jitter exponential backoff
+
+        :param attempt: Number of retries already made
+        :return: The delay in seconds
+        """
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _retry_after(self, response: OSMResponse) -> float | None:
+        """
+        Read the Retry-After header of a response, in seconds or as an HTTP date
+
+        :param response: The response
+        :return: The delay in seconds, capped by backoff_max, or None if the header is missing or invalid
+        """
+
+        value = {key.lower(): value for key, value in response.headers.items()}.get("retry-after")
+
+        if value is None:
+            return None
+
+        try:
+            delay = float(value)
+
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+
+            except (TypeError, ValueError):
+                return None
+
+        return min(self.backoff_max, max(0.0, delay))
+
+    async def prewarm(self, url: str, connections: int = 1) -> None:
+        """
+        Prewarm the underlying transport
+
+        :param url: An url located on the host to open connections to
+        :param connections: Number of connections to open
+        :return: None
+        """
+
+        await self.transport.prewarm(url, connections)
+
+    async def close(self) -> None:
+        """
+        Close the underlying transport
+        :return: None
+        """
+
+        await self.transport.close()
@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from typing import Dict, Optional
+
+from .Cassette import OSMCassette
+from .Response import OSMResponse
+from .Transport import OSMTransport
+
+
+class OSMRecordTransport(OSMTransport):
+    """
+    Transport forwarding every request to another transport and recording each response in a cassette directory
+    """
+
+    def __init__(self, transport: OSMTransport, cassette_path: str) -> None:
+        """
+        :param transport: The transport actually performing requests (usually an OSMHTTPTransport)
+        :param cassette_path: The directory where responses are recorded
+        """
+
+        self.transport: OSMTransport = transport
+        self.cassette: OSMCassette = OSMCassette(cassette_path)
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> OSMResponse:
+        """
+        Perform a GET request and record its response
+
+        :param url: The url to request
+        :param headers: Additional headers to send
+        :return: The response fully read
+        """
+
+        response = await self.transport.get(url, headers)
+        self.cassette.save(response)
+
+        return response
+
+    async def prewarm(self, url: str, connections: int = 1) -> None:
+        """
+        Prewarm the underlying transport
+
+        :param url: An url located on the host to open connections to
+        :param connections: Number of connections to open
+        :return: None
+        """
+
+        await self.transport.prewarm(url, connections)
+
+    async def close(self) -> None:
+        """
+        Close the underlying transport
+        :return: None
+        """
+
+        await self.transport.close()
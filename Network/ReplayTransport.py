@@ -0,0 +1,45 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from typing import Dict, Optional
+
+from .Cassette import OSMCassette
+from .Response import OSMResponse
+from .Transport import OSMTransport
+
+
+class OSMReplayTransport(OSMTransport):
+    """
+    Transport serving responses previously recorded by OSMRecordTransport, without any network access
+    Responses are kept in memory once loaded from the cassette directory
+    """
+
+    def __init__(self, cassette_path: str) -> None:
+        """
+        :param cassette_path: The directory where responses were recorded
+        """
+
+        self.cassette: OSMCassette = OSMCassette(cassette_path)
+
+        self._responses: Dict[str, OSMResponse] = {}
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> OSMResponse:
+        """
+        Serve the recorded response of an url
+
+        :param url: The url to request
+        :param headers: Ignored, responses are only matched on url
+        :return: The recorded response
+
+        :except KeyError: If this url was never recorded
+        """
+
+        if url not in self._responses:
+            response = self.cassette.load(url)
+
+            if response is None:
+                raise KeyError(f"No recorded response for {url} in {self.cassette.path}")
+
+            self._responses[url] = response
+
+        return self._responses[url]
@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from typing import Dict
+
+from .JsonDecoder import decode_json
+
+
+class OSMResponse:
+    """
+    This class represent a response returned by a transport, fully read in memory
+    """
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        """
+        :param url: The requested url
+        :param status: The HTTP status code
+        :param headers: The response headers
+        :param body: The raw response body
+        """
+
+        self.url: str = url
+        self.status: int = status
+        self.headers: Dict[str, str] = headers
+        self.body: bytes = body
+
+    def text(self) -> str:
+        """
+        Decode the body as text
+        :return: The decoded body
+        """
+
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> object:
+        """
+        Decode the body as json, directly from bytes with the fastest installed decoder (see set_json_decoder)
+        :return: The decoded json
+        """
+
+        return decode_json(self.body)
+
+    def __str__(self) -> str:
+        """
+        :return: A string corresponding to this object
+        """
+
+        return f"<OSMResponse object: {self.status} {self.url}, {len(self.body)} bytes>"
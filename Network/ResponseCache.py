@@ -0,0 +1,182 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import asyncio
+import json
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Tuple, TypeVar
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from .Response import OSMResponse
+
+_T = TypeVar("_T")
+
+
+class OSMResponseCache:
+    """
+    Persistent cache of responses stored in a SQLite database
+    The database uses WAL journal mode, so it can be shared by several processes
+    Queries run on a dedicated thread, so waiting for the database never blocks the event loop
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 5) -> None:
+        """
+        :param path: Path of the SQLite database file. It's created if it doesn't exist
+        :param busy_timeout: Number of seconds to wait for another process to release the database. If it isn't
+        released by then, the response is served as if it wasn't stored
+        """
+
+        self.path: str = path
+        self.busy_timeout: float = busy_timeout
+
+        # A single thread, as the connection must only be used by the thread which created it
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="OSMResponseCache")
+        self._connection: sqlite3.Connection = self._executor.submit(self._connect).result()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the database and create its table if needed. Runs on the cache thread
+        :return: The connection
+        """
+
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "url TEXT NOT NULL, "
+            "status INTEGER NOT NULL, "
+            "headers TEXT NOT NULL, "
+            "body BLOB NOT NULL, "
+            "etag TEXT, "
+            "last_modified TEXT, "
+            "stored_at REAL NOT NULL)"
+        )
+
+        return connection
+
+    async def _run(self, default: _T, function: Callable[..., _T], *args) -> _T:
+        """
+        Run a query on the cache thread
+
+        :param default: Returned if the database couldn't be used, e.g. if another process held it for longer than
+        self.busy_timeout
+        :param function: The function performing the query
+        :param args: Arguments given to function
+        :return: What function returned, or default
+        """
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+        except sqlite3.OperationalError as e:
+            sys.stderr.write(f"WARNING: Couldn't use response cache {self.path}: {e}\n")
+            return default
+
+    @staticmethod
+    def key(url: str) -> str:
+        """
+        Get the canonical form of an url, with its query parameters sorted
+        :param url: The requested url
+        :return: The key of this url
+        """
+
+        parts = urlsplit(url)
+
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(sorted(parse_qsl(parts.query))), ""))
+
+    async def get(self, url: str) -> Tuple[OSMResponse, float] | None:
+        """
+        Load the response stored for an url
+
+        :param url: The requested url
+        :return: The stored response and the time.time() it was stored or revalidated at, or None if not stored or if
+        the database couldn't be read
+        """
+
+        return await self._run(None, self._get, url)
+
+    def _get(self, url: str) -> Tuple[OSMResponse, float] | None:
+        row = self._connection.execute(
+            "SELECT url, status, headers, body, stored_at FROM responses WHERE key = ?",
+            (self.key(url),)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        return OSMResponse(row[0], row[1], json.loads(row[2]), row[3]), row[4]
+
+    async def put(self, response: OSMResponse) -> None:
+        """
+        Store a response, replacing any previous response to the same url. Nothing is stored if the database couldn't
+        be written
+
+        :param response: The response to store
+        :return: None
+        """
+
+        await self._run(None, self._put, response)
+
+    def _put(self, response: OSMResponse) -> None:
+        headers = {key.lower(): value for key, value in response.headers.items()}
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses (key, url, status, headers, body, etag, last_modified, stored_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                self.key(response.url),
+                response.url,
+                response.status,
+                json.dumps(response.headers),
+                response.body,
+                headers.get("etag"),
+                headers.get("last-modified"),
+                time.time()
+            )
+        )
+
+    async def get_validators(self, url: str) -> Tuple[str | None, str | None]:
+        """
+        Get the values used to revalidate the response stored for an url
+
+        :param url: The requested url
+        :return: Its ETag and Last-Modified headers, each one being None if unknown
+        """
+
+        return await self._run((None, None), self._get_validators, url)
+
+    def _get_validators(self, url: str) -> Tuple[str | None, str | None]:
+        row = self._connection.execute(
+            "SELECT etag, last_modified FROM responses WHERE key = ?",
+            (self.key(url),)
+        ).fetchone()
+
+        return (None, None) if row is None else (row[0], row[1])
+
+    async def touch(self, url: str) -> None:
+        """
+        Mark the response stored for an url as revalidated now
+
+        :param url: The requested url
+        :return: None
+        """
+
+        await self._run(None, self._touch, url)
+
+    def _touch(self, url: str) -> None:
+        self._connection.execute("UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), self.key(url)))
+
+    def close(self) -> None:
+        """
+        Close the database connection and stop the cache thread
+        :return: None
+        """
+
+        self._executor.submit(self._connection.close).result()
+        self._executor.shutdown()
@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+_T = TypeVar("_T")
+
+
+class OSMSingleFlight:
+    """
+    Coalesce concurrent identical calls: while a call is running, other calls with the same key wait for it and get
+    the same result (or exception) instead of running again
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+        self._waiters: Dict[asyncio.Future, int] = {}
+
+    async def run(self, key: Hashable, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        """
+        Run fetch, or wait for the running call with the same key
+        Cancelling a caller doesn't cancel the call for the others. The call is only cancelled once every caller
+        waiting for it was cancelled
+
+        :param key: Identifies identical calls, e.g. ("user", uid)
+        :param fetch: Function starting the call, only called if no call with this key is running
+        :return: The result of the call
+        """
+
+        flight = self._flights.get(key)
+
+        if flight is None:
+            flight = asyncio.ensure_future(fetch())
+
+            self._flights[key] = flight
+            self._waiters[flight] = 0
+
+            flight.add_done_callback(lambda done: self._forget(key, done))
+
+        self._waiters[flight] += 1
+
+        try:
+            return await asyncio.shield(flight)
+
+        finally:
+            self._waiters[flight] -= 1
+
+            if self._waiters[flight] == 0:
+                del self._waiters[flight]
+
+                if not flight.done():
+                    # Nobody needs the result anymore
+                    self._forget(key, flight)
+                    flight.cancel()
+
+    def _forget(self, key: Hashable, flight: asyncio.Future) -> None:
+        """
+        Stop giving a call to new callers
+        :param key: The key of the call
+        :param flight: The call
+        :return: None
+        """
+
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def __len__(self) -> int:
+        """
+        :return: Number of calls running
+        """
+
+        return len(self._flights)
+
+    def __str__(self) -> str:
+        """
+        :return: A string corresponding to this object
+        """
+
+        return f"<OSMSingleFlight object: {len(self._flights)} calls running>"
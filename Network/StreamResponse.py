@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from typing import AsyncIterator, Dict
+
+from .Response import OSMResponse
+
+
+class OSMStreamResponse:
+    """
+    This class represent a response returned by a transport whose body is read progressively
+    It is only usable inside the transport stream context
+    """
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], chunks: AsyncIterator[bytes]) -> None:
+        """
+        :param url: The requested url
+        :param status: The HTTP status code
+        :param headers: The response headers
+        :param chunks: Asynchronous iterator over the body chunks, as they are received
+        """
+
+        self.url: str = url
+        self.status: int = status
+        self.headers: Dict[str, str] = headers
+
+        self._chunks: AsyncIterator[bytes] = chunks
+
+    @classmethod
+    def from_response(cls, response: OSMResponse) -> "OSMStreamResponse":
+        """
+        Build a stream response from a fully read response, its body being a single chunk
+        :param response: The response
+        :return: The stream response
+        """
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield response.body
+
+        return cls(response.url, response.status, response.headers, chunks())
+
+    def iter_chunks(self) -> AsyncIterator[bytes]:
+        """
+        :return: Asynchronous iterator over the body chunks not read yet
+        """
+
+        return self._chunks
+
+    async def read(self) -> OSMResponse:
+        """
+        Read the rest of the body
+        :return: A fully read response containing the body chunks not read yet
+        """
+
+        return OSMResponse(self.url, self.status, self.headers, b"".join([i async for i in self._chunks]))
+
+    def __str__(self) -> str:
+        """
+        :return: A string corresponding to this object
+        """
+
+        return f"<OSMStreamResponse object: {self.status} {self.url}>"
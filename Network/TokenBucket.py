@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import asyncio
+import time
+
+
+class OSMTokenBucket:
+    """
+    Token bucket used to limit the rate of requests sent to a host
+    Tokens are refilled at rate tokens per second, up to capacity. Each request consumes one token
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """
+        :param rate: Number of tokens refilled per second
+        :param capacity: Maximum number of tokens stored, allowing bursts. Default is max(1, rate)
+        """
+
+        self.rate: float = rate
+        self.capacity: float = max(1.0, rate) if capacity is None else capacity
+
+        self._tokens: float = self.capacity
+        self._updated: float = time.monotonic()
+        self._paused_until: float = 0
+
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        """
+        Add tokens earned since last refill
+        :param now: The current monotonic time
+        :return: None
+        """
+
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available and consume it. Waiters are served in order
+        :return: None
+        """
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Prevent any token from being consumed for some time (e.g. when the host asks us to retry later)
+
+        :param seconds: Number of seconds to wait for
+        :return: None
+        """
+
+        now = time.monotonic()
+
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._tokens = 0
+        self._updated = max(now, self._paused_until)
+
+    def set_rate(self, rate: float) -> None:
+        """
+        Change the refill rate, keeping tokens already earned
+
+        :param rate: The new number of tokens refilled per second
+        :return: None
+        """
+
+        now = time.monotonic()
+
+        if now >= self._paused_until:
+            self._refill(now)
+
+        self.rate = rate
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from .Response import OSMResponse
+from .StreamResponse import OSMStreamResponse
+
+
+class OSMTransport:
+    """
+    Base class of every transport. A transport is what PyOSM uses to perform its requests
+    Subclasses must at least implement get
+    """
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> OSMResponse:
+        """
+        Perform a GET request
+
+        :param url: The url to request
+        :param headers: Additional headers to send
+        :return: The response fully read
+        """
+
+        raise NotImplementedError
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers: Optional[Dict[str, str]] = None) -> AsyncIterator[OSMStreamResponse]:
+        """
+        Perform a GET request whose body is read progressively, to be used with async with
+        By default, the response is fully read with get and its body is a single chunk
+
+        :param url: The url to request
+        :param headers: Additional headers to send
+        :return: The response, whose body can be read until leaving the context
+        """
+
+        yield OSMStreamResponse.from_response(await self.get(url, headers))
+
+    async def prewarm(self, url: str, connections: int = 1) -> None:
+        """
+        Open connections in advance. Does nothing by default
+
+        :param url: An url located on the host to open connections to
+        :param connections: Number of connections to open
+        :return: None
+        """
+
+        return None
+
+    async def close(self) -> None:
+        """
+        Release every resource held by this transport. Does nothing by default
+        :return: None
+        """
+
+        return None
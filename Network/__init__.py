@@ -0,0 +1,18 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from .Batcher import OSMBatcher
+from .CachedTransport import OSMCachedTransport
+from .Cassette import OSMCassette
+from .HTTPTransport import OSMHTTPTransport
+from .RateLimitedTransport import OSMRateLimitedTransport
+from .RecordTransport import OSMRecordTransport
+from .ReplayTransport import OSMReplayTransport
+from .Response import OSMResponse
+from .ResponseCache import OSMResponseCache
+from .SingleFlight import OSMSingleFlight
+from .StreamResponse import OSMStreamResponse
+from .TokenBucket import OSMTokenBucket
+from .Transport import OSMTransport
+from .JsonDecoder import get_json_decoder_name
+from .JsonDecoder import set_json_decoder
@@ -2,6 +2,7 @@
 # Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
 
 import math
+from typing import Tuple
 
 
 class OSMBoundingBox:
@@ -10,6 +11,8 @@ class OSMBoundingBox:
     For more information, please refer to https://wiki.openstreetmap.org/wiki/Bounding_box
     """
 
+    __slots__ = ("left", "bottom", "right", "top")
+
     def __init__(self, left: float, bottom: float, right: float, top: float) -> None:
         self.left = left
         self.bottom = bottom
@@ -51,6 +54,70 @@ class OSMBoundingBox:
         else:
             return False
 
+    def split_date_line(self) -> Tuple["OSMBoundingBox", ...]:
+        """
+        Split a bounding box crossing date line into 2 bounding boxes on each side of it
+        :return: The 2 bounding boxes if it crosses date line, else a tuple containing only this bounding box
+        """
+
+        if not self.cross_date_line():
+            return (self,)
+
+        return (
+            OSMBoundingBox(self.left, self.bottom, 180, self.top),
+            OSMBoundingBox(-180, self.bottom, self.right, self.top)
+        )
+
+    def split(self, max_area: float) -> Tuple["OSMBoundingBox", ...]:
+        """
+        Split this bounding box into a grid of bounding boxes whose area is under max_area
+        Must not be crossing date line, use split_date_line first
+
+        :param max_area: The maximum area of each bounding box, in square degrees
+        :return: The bounding boxes covering this one, or a tuple containing only this bounding box if small enough
+
+        :except ValueError: If max_area isn't a positive value
+        """
+
+        if max_area <= 0:
+            raise ValueError("max_area must be a positive value")
+
+        if self.get_area() <= max_area:
+            return (self,)
+
+        width = math.fabs(self.right - self.left)
+        height = math.fabs(self.top - self.bottom)
+
+        rows = max(1, math.ceil(height / math.sqrt(max_area)))
+        columns = max(1, math.ceil(width * (height / rows) / max_area))
+
+        return tuple([
+            OSMBoundingBox(
+                self.left + width * x / columns,
+                self.bottom + height * y / rows,
+                self.left + width * (x + 1) / columns,
+                self.bottom + height * (y + 1) / rows
+            )
+            for y in range(rows)
+            for x in range(columns)
+        ])
+
+    def subdivide(self) -> Tuple["OSMBoundingBox", ...]:
+        """
+        Split this bounding box into 4 bounding boxes of the same size
+        :return: The 4 quarters of this bounding box
+        """
+
+        middle_lon = (self.left + self.right) / 2
+        middle_lat = (self.bottom + self.top) / 2
+
+        return (
+            OSMBoundingBox(self.left, self.bottom, middle_lon, middle_lat),
+            OSMBoundingBox(middle_lon, self.bottom, self.right, middle_lat),
+            OSMBoundingBox(self.left, middle_lat, middle_lon, self.top),
+            OSMBoundingBox(middle_lon, middle_lat, self.right, self.top)
+        )
+
     def __str__(self) -> str:
         """
         :return: The bounding box in the form of left,bottom,right,top
@@ -0,0 +1,31 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from .ChangeAction import OSMChangeAction
+from .Element import OSMElement
+
+
+class OSMChange:
+    """
+    This class is used to represent a change made in a changeset: an element and what was done to it
+    For more information, please refer to https://wiki.openstreetmap.org/wiki/OsmChange
+    """
+
+    __slots__ = ("action", "element")
+
+    def __init__(self, action: OSMChangeAction, element: OSMElement) -> None:
+        """
+        :param action: What was done to the element
+        :param element: The element, in its state after this change
+        :return: None
+        """
+
+        self.action: OSMChangeAction = action
+        self.element: OSMElement = element
+
+    def __str__(self) -> str:
+        """
+        :return: A string corresponding to this object
+        """
+
+        return f"<OSMChange object: {self.action.value} {self.element.type} {self.element.id}>"
@@ -0,0 +1,14 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from enum import Enum
+
+
+class OSMChangeAction(Enum):
+    """
+    This enum contains the actions an element can undergo in a changeset
+    """
+
+    CREATE: str = "create"
+    MODIFY: str = "modify"
+    DELETE: str = "delete"
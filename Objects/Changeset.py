@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MIT
 # Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
 
+import sys
 from datetime import datetime
 from typing import Dict, Tuple
 
@@ -10,15 +11,27 @@ from .ChangesetTags import OSMChangesetTags
 
 type _json_types = None | str | float | int | bool
 
+# Value of attributes which are not built yet, as None is a valid value for some of them
+_UNSET = object()
+
+# Shared by every changeset not closed yet, to avoid building one per changeset
+_NOT_CLOSED = datetime.fromisoformat("1970-01-01T00:00:00Z")
+
 
 class OSMChangeset:
     """
     This class is used to represent a changeset
     """
 
-    def __init__(self, json_response: Dict[str, _json_types | Dict[str, _json_types]]) -> None:
+    __slots__ = (
+        "id", "comments_count", "changes_count", "uid", "user", "is_open", "_json_response", "_created_at",
+        "_closed_at", "_bounding_box", "_tags", "_comments"
+    )
+
+    def __init__(self, json_response: Dict[str, _json_types | Dict[str, _json_types]], lazy: bool = False) -> None:
         """
         :param json_response: The json response returned by API corresponding to a changeset
+        :param lazy: If True, created_at, closed_at, bounding_box, tags and comments are only built when first accessed
         :return: None
         """
 
@@ -27,38 +40,82 @@ class OSMChangeset:
         self.changes_count: int = json_response["changes_count"]
         self.uid: int = json_response["uid"]
 
-        self.user: str = json_response["user"]
+        self.user: str = sys.intern(json_response["user"])
 
         self.is_open: bool = json_response["open"]
 
-        self.created_at: datetime = datetime.fromisoformat(json_response["created_at"])
+        self._json_response: Dict[str, _json_types | Dict[str, _json_types]] | None = json_response
+
+        self._created_at: datetime | object = _UNSET
+        self._closed_at: datetime | object = _UNSET
+        self._bounding_box: OSMBoundingBox | None | object = _UNSET
+        self._tags: OSMChangesetTags | object = _UNSET
+        self._comments: Tuple[OSMChangesetComment, ...] | object = _UNSET
+
+        if not lazy:
+            self.materialize()
+
+    def materialize(self) -> None:
+        """
+        Build every lazy attribute now, and release the json response
+        :return: None
+        """
+
+        _ = self.created_at, self.closed_at, self.bounding_box, self.tags, self.comments
+
+        self._json_response = None
+
+    @property
+    def created_at(self) -> datetime:
+        if self._created_at is _UNSET:
+            self._created_at = datetime.fromisoformat(self._json_response["created_at"])
+
+        return self._created_at
+
+    @property
+    def closed_at(self) -> datetime:
+        if self._closed_at is _UNSET:
+            if "closed_at" in self._json_response.keys():
+                self._closed_at = datetime.fromisoformat(self._json_response["closed_at"])
+
+            else:
+                self._closed_at = _NOT_CLOSED
+
+        return self._closed_at
+
+    @property
+    def bounding_box(self) -> OSMBoundingBox | None:
+        if self._bounding_box is _UNSET:
+            if "min_lon" in self._json_response.keys():
+                self._bounding_box = OSMBoundingBox(
+                    self._json_response["min_lon"],
+                    self._json_response["min_lat"],
+                    self._json_response["max_lon"],
+                    self._json_response["max_lat"]
+                )
 
-        if "closed_at" in json_response.keys():
-            self.closed_at: datetime = datetime.fromisoformat(json_response["closed_at"])
+            else:
+                self._bounding_box = None
 
-        else:
-            self.closed_at: datetime = datetime.fromisoformat("1970-01-01T00:00:00Z")
+        return self._bounding_box
 
-        if "min_lon" in json_response.keys():
-            self.bounding_box: OSMBoundingBox | None = OSMBoundingBox(
-                json_response["min_lon"],
-                json_response["min_lat"],
-                json_response["max_lon"],
-                json_response["max_lat"]
-            )
+    @property
+    def tags(self) -> OSMChangesetTags:
+        if self._tags is _UNSET:
+            self._tags = OSMChangesetTags(self._json_response)
 
-        else:
-            self.bounding_box: OSMBoundingBox | None = None
+        return self._tags
 
-        self.tags: OSMChangesetTags(json_response) = OSMChangesetTags(json_response)
+    @property
+    def comments(self) -> Tuple[OSMChangesetComment, ...]:
+        if self._comments is _UNSET:
+            if "comments" in self._json_response.keys():
+                self._comments = tuple([OSMChangesetComment(i) for i in self._json_response["comments"]])
 
-        if "comments" in json_response.keys():
-            self.comments: Tuple[OSMChangesetComment, ...] = tuple(
-                [OSMChangesetComment(i) for i in json_response["comments"]]
-            )
+            else:
+                self._comments = ()
 
-        else:
-            self.comments: Tuple[OSMChangesetComment] = ()
+        return self._comments
 
     def __str__(self) -> str:
         """
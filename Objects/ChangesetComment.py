@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MIT
 # Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
 
+import sys
 from datetime import datetime
 from typing import Dict
 
@@ -10,6 +11,8 @@ class OSMChangesetComment:
     This class is used to represent a changeset comment
     """
 
+    __slots__ = ("comment_id", "visible", "date", "uid", "user", "text")
+
     def __init__(self, json_response: Dict[str, int | bool | str]) -> None:
         """
         :param json_response: The json response of one changeset comment
@@ -21,7 +24,7 @@ class OSMChangesetComment:
         self.date: datetime = datetime.fromisoformat(json_response['date'])
 
         self.uid: int = json_response["uid"] if "uid" in json_response.keys() else -1
-        self.user: str = json_response["user"] if "user" in json_response.keys() else ""
+        self.user: str = sys.intern(json_response["user"]) if "user" in json_response.keys() else ""
 
         self.text: str = json_response["text"]
 
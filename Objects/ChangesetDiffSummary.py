@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from .Change import OSMChange
+from .ChangeAction import OSMChangeAction
+
+
+class OSMChangesetDiffSummary:
+    """
+    This class is used to summarize changes made in a changeset without keeping them
+    """
+
+    __slots__ = ("changeset_id", "changes_count", "counts", "tag_keys")
+
+    def __init__(self, changeset_id: int) -> None:
+        """
+        :param changeset_id: The changeset id
+        :return: None
+        """
+
+        self.changeset_id: int = changeset_id
+        self.changes_count: int = 0
+
+        # (action, element type) -> number of changes
+        self.counts: Dict[Tuple[OSMChangeAction, str], int] = {}
+
+        # Tag key -> number of created or modified elements having it
+        self.tag_keys: Counter[str] = Counter()
+
+    def add(self, change: OSMChange) -> None:
+        """
+        Count a change
+        :param change: The change
+        :return: None
+        """
+
+        key = (change.action, change.element.type)
+
+        self.changes_count += 1
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+        if change.action != OSMChangeAction.DELETE:
+            self.tag_keys.update(change.element.tags.keys())
+
+    def get_count(self, action: Optional[OSMChangeAction] = None, element_type: Optional[str] = None) -> int:
+        """
+        Get a number of changes
+        :param action: Count only changes with this action, or None for every action
+        :param element_type: Count only changes of this element type ("node", "way" or "relation"), or None for every type
+        :return: The number of changes
+        """
+
+        return sum(
+            count for (i_action, i_type), count in self.counts.items()
+            if (action is None or i_action == action) and (element_type is None or i_type == element_type)
+        )
+
+    def __str__(self) -> str:
+        """
+        :return: A string corresponding to this object
+        """
+
+        counts = ", ".join([f"{i.value}={self.get_count(action=i)}" for i in OSMChangeAction])
+
+        return f"<OSMChangesetDiffSummary object: changeset={self.changeset_id}, {counts}>"
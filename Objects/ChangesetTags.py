@@ -2,16 +2,27 @@
 # Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
 
 import json
-from typing import Dict, Tuple
+import sys
+from types import MappingProxyType
+from typing import Dict, Tuple, Mapping
 
 type _json_types = None | str | float | int | bool
 
+# Shared by every tags object without custom tags, to avoid building an empty dict for each of them
+_NO_CUSTOM_TAGS: Mapping[str, _json_types] = MappingProxyType({})
+
 
 class OSMChangesetTags:
     """
     This class is used to represet tags on a changeset
     """
 
+    __slots__ = (
+        "comment", "created_by", "imagery_used", "source", "locale", "host", "closed_note", "bot",
+        "review_requested", "ideditor_walkthrough_started", "hashtags", "ideditor_walkthrough_progress",
+        "changeset_count", "custom_tags"
+    )
+
     def __init__(self, json_response: Dict[str, _json_types | Dict[str, _json_types]]) -> None:
         """
         :param json_response: The json response returned by API corresponding to a changeset
@@ -35,7 +46,8 @@ class OSMChangesetTags:
 
         self.changeset_count: int | None = None
 
-        self.custom_tags: Dict[str, _json_types] = {}
+        # Read-only empty mapping until a custom tag is found
+        self.custom_tags: Dict[str, _json_types] | Mapping[str, _json_types] = _NO_CUSTOM_TAGS
 
         self._builder(json_response)
 
@@ -53,16 +65,17 @@ class OSMChangesetTags:
             match key:
                 case "comment":
                     self.comment: str = value
+                # Those values are shared by many changesets, so they're interned to be stored only once
                 case "created_by":
-                    self.created_by: str = value
+                    self.created_by: str = sys.intern(value)
                 case "imagery_used":
-                    self.imagery_used: str = value
+                    self.imagery_used: str = sys.intern(value)
                 case "source":
-                    self.source: str = value
+                    self.source: str = sys.intern(value)
                 case "locale":
-                    self.locale: str = value
+                    self.locale: str = sys.intern(value)
                 case "host":
-                    self.host: str = value
+                    self.host: str = sys.intern(value)
                 case "closed_note":
                     self.closed_note: str = value
 
@@ -97,6 +110,9 @@ class OSMChangesetTags:
                     self.changeset_count: int = int(value)
 
                 case _:
+                    if self.custom_tags is _NO_CUSTOM_TAGS:
+                        self.custom_tags = {}
+
                     self.custom_tags.update({key: value})
 
     def to_dict(self, remove_null_values: bool = False) -> (
@@ -122,7 +138,7 @@ class OSMChangesetTags:
             "hashtags": self.hashtags,
             "ideditor_walkthrough_progress": self.ideditor_walkthrough_progress,
             "changeset_count": self.changeset_count,
-            "custom_tags": self.custom_tags,
+            "custom_tags": dict(self.custom_tags),
         }
 
         if remove_null_values:
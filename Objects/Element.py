@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import sys
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+
+type _json_types = None | str | float | int | bool
+type OSMMember = Tuple[str, int, str]
+
+# Shared by every element without tags, to avoid building one dict per element
+_NO_TAGS: Mapping[str, str] = MappingProxyType({})
+
+
+class OSMElement:
+    """
+    This class is used to represent a map element: a node, a way or a relation
+    For more information, please refer to https://wiki.openstreetmap.org/wiki/Elements
+    """
+
+    __slots__ = (
+        "type", "id", "version", "changeset", "timestamp", "uid", "user", "visible", "tags", "lat", "lon", "nodes",
+        "members"
+    )
+
+    def __init__(
+            self,
+            json_response: Dict[str, _json_types | Dict[str, str] | List[int] | List[Dict[str, _json_types]]]
+    ) -> None:
+        """
+        Based on responses from API endpoints such as /api/0.6/nodes.json (e.g. what's in "elements")
+        :param json_response: The json response corresponding to an element
+        :return: None
+        """
+
+        self.type: str = sys.intern(json_response["type"])
+        self.id: int = json_response["id"]
+        self.version: int | None = json_response.get("version")
+        self.changeset: int | None = json_response.get("changeset")
+
+        if "timestamp" in json_response.keys():
+            self.timestamp: datetime | None = datetime.fromisoformat(json_response["timestamp"])
+        else:
+            self.timestamp: datetime | None = None
+
+        self.uid: int | None = json_response.get("uid")
+        self.user: str | None = sys.intern(json_response["user"]) if "user" in json_response.keys() else None
+
+        self.visible: bool = json_response.get("visible", True)
+
+        if json_response.get("tags"):
+            self.tags: Mapping[str, str] = {sys.intern(k): v for k, v in json_response["tags"].items()}
+        else:
+            self.tags: Mapping[str, str] = _NO_TAGS
+
+        # Only for nodes, None for deleted ones
+        self.lat: float | None = json_response.get("lat")
+        self.lon: float | None = json_response.get("lon")
+
+        # Only for ways: ids of their nodes
+        self.nodes: Tuple[int, ...] = tuple(json_response["nodes"]) if "nodes" in json_response.keys() else ()
+
+        # Only for relations: (type, ref, role) of their members
+        if "members" in json_response.keys():
+            self.members: Tuple[OSMMember, ...] = tuple([
+                (sys.intern(i["type"]), i["ref"], sys.intern(i["role"])) for i in json_response["members"]
+            ])
+        else:
+            self.members: Tuple[OSMMember, ...] = ()
+
+    def __str__(self) -> str:
+        """
+        :return: A string corresponding to this object
+        """
+
+        return f"<OSMElement object: {self.type} {self.id} v{self.version}, tags={dict(self.tags)}>"
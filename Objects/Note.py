@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MIT
 # Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
 
+import sys
 from datetime import datetime
 from typing import Union, Dict, List
 
@@ -12,28 +13,31 @@ class OSMNote:
     This class is used to represent a note
     """
 
+    __slots__ = (
+        "type", "geometry", "id", "url", "status", "reopen_url", "close_url", "comment_url", "_properties",
+        "_date_created", "_comments"
+    )
+
     # noinspection PyTypeChecker
-    def __init__(self, json_response: Dict[str, Union[object, Dict[str, Union[object, Dict[str, object]]]]]) -> None:
+    def __init__(
+            self,
+            json_response: Dict[str, Union[object, Dict[str, Union[object, Dict[str, object]]]]],
+            lazy: bool = False
+    ) -> None:
         """
         Based on responses from this API endpoint /api/0.6/notes.json
         :param json_response: The json response of each note (e.g. what's in "features")
+        :param lazy: If True, date_created and comments are only built when first accessed
         :return: None
         """
 
-        self.type: str = json_response['type']
+        self.type: str = sys.intern(json_response['type'])
         self.geometry: Dict[str: str | List[float]] = json_response['geometry']
 
         self.id: int = json_response['properties']['id']
         self.url: str = json_response['properties']['url']
 
-        self.date_created: datetime = datetime.strptime(
-            json_response['properties']['date_created'],
-            "%Y-%m-%d %H:%M:%S UTC"
-        )
-
-        self.status: str = json_response['properties']['status']
-
-        self.comments: List[OSMNoteComment] = [OSMNoteComment(i) for i in json_response['properties']['comments']]
+        self.status: str = sys.intern(json_response['properties']['status'])
 
         if 'reopen_url' in json_response['properties'].keys():
             self.reopen_url: str = json_response['properties']['reopen_url']
@@ -50,6 +54,38 @@ class OSMNote:
         else:
             self.comment_url: str = None
 
+        self._properties: Dict[str, object] | None = json_response['properties']
+
+        self._date_created: datetime | None = None
+        self._comments: List[OSMNoteComment] | None = None
+
+        if not lazy:
+            self.materialize()
+
+    def materialize(self) -> None:
+        """
+        Build every lazy attribute now, and release the json response
+        :return: None
+        """
+
+        _ = self.date_created, self.comments
+
+        self._properties = None
+
+    @property
+    def date_created(self) -> datetime:
+        if self._date_created is None:
+            self._date_created = datetime.strptime(self._properties['date_created'], "%Y-%m-%d %H:%M:%S UTC")
+
+        return self._date_created
+
+    @property
+    def comments(self) -> List[OSMNoteComment]:
+        if self._comments is None:
+            self._comments = [OSMNoteComment(i) for i in self._properties['comments']]
+
+        return self._comments
+
     def __str__(self) -> str:
         """
         :return: A string corresponding to this object
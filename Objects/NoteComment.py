@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MIT
 # Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
 
+import sys
 from datetime import datetime
 from typing import Dict
 
@@ -10,6 +11,8 @@ class OSMNoteComment:
     This class is used to represent a note comment
     """
 
+    __slots__ = ("date", "action", "text", "html", "uid", "user", "user_url")
+
     # noinspection PyTypeChecker
     def __init__(self, json_response: Dict[str, object]) -> None:
         """
@@ -17,12 +20,12 @@ class OSMNoteComment:
         """
 
         self.date: datetime = datetime.strptime(json_response['date'], "%Y-%m-%d %H:%M:%S UTC")
-        self.action: str = json_response['action']
+        self.action: str = sys.intern(json_response['action'])
         self.text: str = json_response['text']
         self.html: str = json_response['html']
 
         self.uid: int = json_response["uid"] if "uid" in json_response.keys() else -1
-        self.user: str = json_response["user"] if "user" in json_response.keys() else ""
+        self.user: str = sys.intern(json_response["user"]) if "user" in json_response.keys() else ""
         self.user_url: str = json_response["user_url"] if "user_url" in json_response.keys() else ""
 
     def __str__(self) -> str:
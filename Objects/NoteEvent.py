@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from datetime import datetime
+
+from .Note import OSMNote
+from .NoteComment import OSMNoteComment
+from .NoteEventType import OSMNoteEventType
+
+
+class OSMNoteEvent:
+    """
+    This class is used to represent something which happened to a note, found by OSMNoteWatcher
+    """
+
+    __slots__ = ("type", "note", "comment", "date", "region")
+
+    def __init__(
+            self,
+            event_type: OSMNoteEventType,
+            note: OSMNote,
+            comment: OSMNoteComment | None,
+            date: datetime,
+            region: str
+    ) -> None:
+        """
+        :param event_type: What happened to the note
+        :param note: The note, in its state when it was fetched
+        :param comment: The comment corresponding to this event, or None if the status changed without any comment
+        being returned (e.g. it was hidden)
+        :param date: When it happened, in UTC
+        :param region: Name of the watched region the note was found in
+        :return: None
+        """
+
+        self.type: OSMNoteEventType = event_type
+        self.note: OSMNote = note
+        self.comment: OSMNoteComment | None = comment
+        self.date: datetime = date
+        self.region: str = region
+
+    def __str__(self) -> str:
+        """
+        :return: A string corresponding to this object
+        """
+
+        return f"<OSMNoteEvent object: {self.type.value} note {self.note.id} on {self.date.isoformat()}, {self.region}>"
@@ -0,0 +1,16 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+from enum import Enum
+
+
+class OSMNoteEventType(Enum):
+    """
+    This enum contains what can happen to a note. Values are the same as note comments actions
+    """
+
+    OPENED: str = "opened"
+    COMMENTED: str = "commented"
+    CLOSED: str = "closed"
+    REOPENED: str = "reopened"
+    HIDDEN: str = "hidden"
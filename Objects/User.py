@@ -10,6 +10,11 @@ class OSMUser:
     This class is used to represent a user
     """
 
+    __slots__ = (
+        "uid", "display_name", "account_created", "description", "pfp_link", "roles", "changesets_count",
+        "traces_count", "blocks_count", "blocks_active", "agreed_contributor_terms"
+    )
+
     # noinspection PyTypeChecker
     def __init__(self, json_response: Dict[str, Union[object, Dict[str, Union[object, Dict[str, object]]]]]) -> None:
         """
@@ -2,10 +2,16 @@
 # Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
 
 from .BoundingBox import OSMBoundingBox
+from .ChangeAction import OSMChangeAction
+from .Change import OSMChange
 from .Changeset import OSMChangeset
 from .ChangesetComment import OSMChangesetComment
+from .ChangesetDiffSummary import OSMChangesetDiffSummary
 from .ChangesetTags import OSMChangesetTags
+from .Element import OSMElement
 from .Note import OSMNote
 from .NoteComment import OSMNoteComment
+from .NoteEvent import OSMNoteEvent
+from .NoteEventType import OSMNoteEventType
 from .TimeDelta import OSMTimeDelta
 from .User import OSMUser
@@ -1,23 +1,46 @@
 # SPDX-License-Identifier: MIT
 # Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
 
+import asyncio
 import json
 import sys
-from typing import Tuple, Iterable, Optional, Literal
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Tuple, Iterable, Optional, Literal, AsyncIterator, Dict, Callable, Awaitable, TypeVar, List
 from urllib.parse import quote
 
-import aiohttp
-
+from .Cache import OSMMemoryCache
 from .Capabilities import OSMCapabilities
+from .Frames import OSMMapData
+from .Frames import OSMMapDataBuilder
 from .Enums import OSMOrder
 from .Enums import OSMSort
 from .Enums import OSMStatus
+from .Errors import OSMIncompleteResultError
+from .Network import OSMBatcher
+from .Network import OSMHTTPTransport
+from .Network import OSMRateLimitedTransport
+from .Network import OSMSingleFlight
+from .Network import OSMTransport
+from .Network.JsonStream import iter_json_array
+from .Network.OsmChangeStream import iter_osm_change
 from .Objects import OSMBoundingBox
+from .Objects import OSMChange
 from .Objects import OSMChangeset
+from .Objects import OSMChangesetDiffSummary
+from .Objects import OSMElement
 from .Objects import OSMNote
 from .Objects import OSMTimeDelta
 from .Objects import OSMUser
 
+_T = TypeVar("_T")
+_K = TypeVar("_K")
+
+# Maximum length of urls built by element multi-fetch, to stay under common server limits
+_MAX_URL_LENGTH = 4000
+
+type _element_key = Tuple[str, int, int | None]
+
 """
 HOW TO FIND YOUR USER ID
 Log in into your OSM account and you will be able to get it on https://api.openstreetmap.org/api/0.6/user/details.json
@@ -26,29 +49,193 @@ It should be under {'user': {'id': YOUR_USER_ID}}
 
 
 class PyOSM:
-    def __init__(self):
+    def __init__(
+            self,
+            transport: Optional[OSMTransport] = None,
+            api_url: str = "https://api.openstreetmap.org/api/0.6",
+            connections_limit: int = 100,
+            connections_limit_per_host: int = 10,
+            keepalive_timeout: float = 30,
+            dns_cache_ttl: int = 300,
+            requests_per_second: float | None = 10,
+            cache: Optional[OSMMemoryCache] = None,
+            capabilities_path: Optional[str] = None,
+            capabilities_ttl: float = 86400,
+            lazy_objects: bool = False,
+            coalesce_requests: bool = True,
+            batch_delay: float | None = None,
+            max_batch_size: int = 100
+    ) -> None:
+        """
+        :param transport: The transport used to perform requests. If not set, an OSMHTTPTransport is built using the
+        connection pool parameters below, wrapped in an OSMRateLimitedTransport
+        :param api_url: Base url of the API, without trailing slash
+        :param connections_limit: Maximum number of simultaneous connections kept by the pool
+        :param connections_limit_per_host: Maximum number of simultaneous connections to the same host
+        :param keepalive_timeout: Number of seconds an idle connection is kept alive for reuse
+        :param dns_cache_ttl: Number of seconds a resolved DNS entry is cached for
+        :param requests_per_second: Maximum number of requests per second, requests are retried when throttled. If
+        None, requests are neither limited nor retried
+        :param cache: In memory cache used by self.fetch_user_info, self.fetch_note_by_id and self.fetch_changeset_by_id.
+        If None, nothing is cached
+        :param capabilities_path: Json file where capabilities are saved, and loaded from when creating PyOSM. If None,
+        capabilities are never saved
+        :param capabilities_ttl: Number of seconds before capabilities are refreshed in background
+        :param lazy_objects: If True, OSMNote and OSMChangeset attributes costly to build are only built when first
+        accessed
+        :param coalesce_requests: If True, concurrent identical calls of self.get_uid_with_changeset,
+        self.fetch_user_info, self.fetch_note_by_id and self.fetch_changeset_by_id share a single request and return the
+        same object
+        :param batch_delay: If set, self.fetch_user_info and self.fetch_changeset_by_id calls made within this number of
+        seconds are merged into a single bulk request. If None, each call performs its own request
+        :param max_batch_size: Maximum number of users or changesets merged into a single bulk request
+        """
+
         self.capabilities: OSMCapabilities = OSMCapabilities()
+        self.capabilities_path: str | None = capabilities_path
+        self.capabilities_ttl: float = capabilities_ttl
+
+        if capabilities_path is not None:
+            self.capabilities.load(capabilities_path)
+
+        self._capabilities_lock: asyncio.Lock = asyncio.Lock()
+        self._capabilities_task: asyncio.Task | None = None
+        self._capabilities_attempted_at: float = 0
+
+        self.api_url: str = api_url
+
+        if transport is None:
+            transport = OSMHTTPTransport(
+                connections_limit=connections_limit,
+                connections_limit_per_host=connections_limit_per_host,
+                keepalive_timeout=keepalive_timeout,
+                dns_cache_ttl=dns_cache_ttl
+            )
+
+            if requests_per_second is not None:
+                transport = OSMRateLimitedTransport(
+                    transport,
+                    requests_per_second=requests_per_second,
+                    max_concurrency=connections_limit_per_host
+                )
+
+        self.transport: OSMTransport = transport
+
+        self.cache: OSMMemoryCache | None = cache
+
+        self.lazy_objects: bool = lazy_objects
+
+        self.single_flight: OSMSingleFlight | None = OSMSingleFlight() if coalesce_requests else None
+
+        self.user_batcher: OSMBatcher[int, OSMUser] | None = None
+        self.changeset_batcher: OSMBatcher[int, OSMChangeset] | None = None
+
+        if batch_delay is not None:
+            self.user_batcher = OSMBatcher(self.fetch_users_info_map, batch_delay, max_batch_size)
+            self.changeset_batcher = OSMBatcher(self.fetch_changesets_by_ids, batch_delay, max_batch_size)
+
+    async def __aenter__(self) -> "PyOSM":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def prewarm(self, connections: int = 1) -> None:
+        """
+        Open connections to the API in advance so the first calls don't pay TCP and TLS handshakes
+
+        :param connections: Number of connections to open
+        :return: None
+        """
+
+        await self.transport.prewarm(f"{self.api_url}/capabilities.json", connections)
+
+    async def close(self) -> None:
+        """
+        Close the transport and every connection it holds. PyOSM can still be used after, connections will be opened
+        again on next call
+
+        :return: None
+        """
+
+        if self._capabilities_task is not None and not self._capabilities_task.done():
+            self._capabilities_task.cancel()
+
+            # Waits for the update to stop, so it doesn't use the transport while it is closed
+            await asyncio.wait([self._capabilities_task])
+
+        await self.transport.close()
 
     async def update_capabilities(self) -> bool:
         """
-        Updates api rates dictionary
+        Updates api rates dictionary, and saves it in self.capabilities_path if defined
 
         :return: True if it managed to update api rates
         """
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"https://api.openstreetmap.org/api/0.6/capabilities.json") as resp:
-                if resp.status == 200:
-                    data = json.loads(await resp.text())
+        self._capabilities_attempted_at = time.monotonic()
+
+        resp = await self.transport.get(f"{self.api_url}/capabilities.json")
 
-                    self.capabilities.update_from_api(data)
+        if resp.status == 200:
+            data = resp.json()
 
-                else:
-                    sys.stderr.write(f"WARNING: Couldn't fetch OSM API rates: {resp.status} {await resp.text()}\n")
-                    return False
+            self.capabilities.update_from_api(data)
+
+            if self.capabilities_path is not None:
+                try:
+                    self.capabilities.save(self.capabilities_path)
+
+                except OSError as e:
+                    sys.stderr.write(f"WARNING: Couldn't save OSM API rates: {e}\n")
+
+            return True
+
+        else:
+            sys.stderr.write(f"WARNING: Couldn't fetch OSM API rates: {resp.status} {resp.text()}\n")
+            return False
+
+    async def ensure_capabilities(self) -> None:
+        """
+        Make sure capabilities can be used: fetch them if they never were, or refresh them in background if stale
+        :return: None
+        """
+
+        if not self.capabilities.is_loaded():
+            async with self._capabilities_lock:
+                if not self.capabilities.is_loaded():
+                    await self.update_capabilities()
+
+        elif self.capabilities.is_stale(self.capabilities_ttl):
+            self.refresh_capabilities()
+
+    def refresh_capabilities(self) -> None:
+        """
+        Update capabilities in background, unless an update is already running or was attempted less than a minute ago
+        :return: None
+        """
+
+        if self._capabilities_task is not None and not self._capabilities_task.done():
+            return
+
+        if self._capabilities_attempted_at != 0 and time.monotonic() - self._capabilities_attempted_at < 60:
+            return
+
+        self._capabilities_task = asyncio.create_task(self.update_capabilities())
+        self._capabilities_task.add_done_callback(self._on_capabilities_refreshed)
 
     @staticmethod
-    async def get_uid_with_changeset(display_name: str) -> int:
+    def _on_capabilities_refreshed(task: asyncio.Task) -> None:
+        """
+        Write a warning if a background update of capabilities failed, as nothing awaits it
+        :param task: The finished update
+        :return: None
+        """
+
+        if not task.cancelled() and task.exception() is not None:
+            sys.stderr.write(f"WARNING: Couldn't refresh OSM API rates: {task.exception()!r}\n")
+
+    async def get_uid_with_changeset(self, display_name: str) -> int:
         """
         Following method is a hack used to get a user UID from one of their changeset
         This doesn't work if someone never made any changeset
@@ -57,25 +244,33 @@ class PyOSM:
         :return: If UID is found, return its value; else it will return -1
         """
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                    f"https://api.openstreetmap.org/api/0.6/changesets.json?limit=1&display_name={quote(display_name)}"
-            ) as resp:
-                if resp.status == 200:
-                    data = json.loads(await resp.text())
+        return await self._coalesce(("uid", display_name), lambda: self._get_uid_with_changeset(display_name))
+
+    async def _get_uid_with_changeset(self, display_name: str) -> int:
+        """
+        Perform the request of self.get_uid_with_changeset
+        :param display_name: The display name of the user
+        :return: Its UID, or -1
+        """
+
+        resp = await self.transport.get(
+            f"{self.api_url}/changesets.json?limit=1&display_name={quote(display_name)}"
+        )
 
-                    if len(data['changesets']) == 0:
-                        return -1
+        if resp.status == 200:
+            data = resp.json()
 
-                    return data['changesets'][0]["uid"]
+            if len(data['changesets']) == 0:
+                return -1
 
-                else:
-                    sys.stderr.write(f"WARNING: Couldn't fetch OSM UID from display_name: {resp.status} "
-                                     f"{await resp.text()}\n")
-                    return -1
+            return data['changesets'][0]["uid"]
 
-    @staticmethod
-    async def fetch_user_info(uid: int) -> OSMUser | None:
+        else:
+            sys.stderr.write(f"WARNING: Couldn't fetch OSM UID from display_name: {resp.status} "
+                             f"{resp.text()}\n")
+            return -1
+
+    async def fetch_user_info(self, uid: int) -> OSMUser | None:
         """
         Fetch a user using its UID
 
@@ -83,38 +278,226 @@ class PyOSM:
         :return: Inititalized OSMUser if successfull, else None
         """
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"https://api.openstreetmap.org/api/0.6/user/{uid}.json") as resp:
-                if resp.status == 200:
-                    data = json.loads(await resp.text())
+        if self.cache is not None:
+            cached = self.cache.get(("user", uid))
 
-                    return OSMUser(data["user"])
+            if cached is not None:
+                return cached
 
-                else:
-                    sys.stderr.write(f"WARNING: Couldn't fetch user informations: {resp.status} {await resp.text()}\n")
-                    return None
+        return await self._coalesce(("user", uid), lambda: self._fetch_user_info(uid))
 
-    @staticmethod
-    async def fetch_users_info(uid: Iterable[int]) -> Tuple[OSMUser, ...] | None:
+    async def _fetch_user_info(self, uid: int) -> OSMUser | None:
+        """
+        Perform the request of self.fetch_user_info and cache its result, or add it to the next batch if
+        self.user_batcher is set
+        :param uid: The user's UID
+        :return: The user, or None
+        """
+
+        if self.user_batcher is not None:
+            return await self.user_batcher.load(uid)
+
+        resp = await self.transport.get(f"{self.api_url}/user/{uid}.json")
+
+        if resp.status == 200:
+            data = resp.json()
+
+            user = OSMUser(data["user"])
+
+            if self.cache is not None:
+                self.cache.put(("user", uid), user)
+
+            return user
+
+        else:
+            sys.stderr.write(f"WARNING: Couldn't fetch user informations: {resp.status} {resp.text()}\n")
+            return None
+
+    async def fetch_users_info(
+            self,
+            uid: Iterable[int],
+            chunk_size: int = 100,
+            max_concurrency: int = 4
+    ) -> Tuple[OSMUser, ...] | None:
         """
         Fetch multiple user using their UID
+        UIDs are split in chunks of chunk_size, fetched concurrently
+
+        :param uid: Every UID we want to get information on
+        :param chunk_size: Maximum number of UIDs fetched per request
+        :param max_concurrency: Maximum number of requests performed at the same time
+        :return: Inititalized OSMUsers in a tuple, in the same order as uid, if successfull, else None
+        """
+
+        users: Dict[int, OSMUser | None] = {i: None for i in uid}
+        failed = True
+
+        async for _, result in self._iter_chunks(users.keys(), chunk_size, max_concurrency, self._fetch_users_chunk):
+            if result is not None:
+                users.update(result)
+                failed = False
+
+        if failed and len(users) != 0:
+            return None
+
+        return tuple([i for i in users.values() if i is not None])
+
+    async def fetch_users_info_map(
+            self,
+            uid: Iterable[int],
+            chunk_size: int = 100,
+            max_concurrency: int = 4
+    ) -> Dict[int, OSMUser | None]:
+        """
+        Fetch multiple user using their UID, reporting the ones which couldn't be fetched
+        UIDs are split in chunks of chunk_size, fetched concurrently
 
         :param uid: Every UID we want to get information on
-        :return: Inititalized OSMUsers in a tuple if successfull, else None
+        :param chunk_size: Maximum number of UIDs fetched per request
+        :param max_concurrency: Maximum number of requests performed at the same time
+        :return: A dict associating each UID, in the same order as uid, to its OSMUser or None if this user is missing,
+        suspended or if its request failed
         """
 
-        uid_str = ','.join([str(i) for i in uid])
+        users: Dict[int, OSMUser | None] = {i: None for i in uid}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"https://api.openstreetmap.org/api/0.6/users.json?users={uid_str}") as resp:
-                if resp.status == 200:
-                    data = json.loads(await resp.text())
+        async for _, result in self._iter_chunks(users.keys(), chunk_size, max_concurrency, self._fetch_users_chunk):
+            if result is not None:
+                users.update(result)
 
-                    return tuple([OSMUser(i["user"]) for i in data["users"]])
+        return users
 
-                else:
-                    sys.stderr.write(f"WARNING: Couldn't fetch user informations: {resp.status} {await resp.text()}\n")
-                    return None
+    async def iter_users_info(
+            self,
+            uid: Iterable[int],
+            chunk_size: int = 100,
+            max_concurrency: int = 4
+    ) -> AsyncIterator[OSMUser]:
+        """
+        Fetch multiple user using their UID, returning them as soon as their chunk is fetched
+        UIDs are split in chunks of chunk_size, fetched concurrently. Missing users are skipped
+
+        :param uid: Every UID we want to get information on
+        :param chunk_size: Maximum number of UIDs fetched per request
+        :param max_concurrency: Maximum number of requests performed at the same time
+        :return: An asynchronous iterator of OSMUsers, in the order their chunks are fetched
+        """
+
+        async for _, result in self._iter_chunks(uid, chunk_size, max_concurrency, self._fetch_users_chunk):
+            if result is None:
+                continue
+
+            for user in result.values():
+                if user is not None:
+                    yield user
+
+    async def _fetch_users_chunk(self, uid: Tuple[int, ...]) -> Dict[int, OSMUser | None] | None:
+        """
+        Fetch a chunk of users in a single request
+
+        :param uid: The UIDs to fetch
+        :return: A dict associating each UID to its OSMUser or None if missing, or None if the request failed
+        """
+
+        resp = await self.transport.get(f"{self.api_url}/users.json?users={','.join([str(i) for i in uid])}")
+
+        if resp.status == 200:
+            data = resp.json()
+
+            users = {i["user"]["id"]: OSMUser(i["user"]) for i in data["users"]}
+
+            if self.cache is not None:
+                for key, value in users.items():
+                    self.cache.put(("user", key), value)
+
+            return {i: users.get(i) for i in uid}
+
+        elif resp.status == 404:
+            # Returned when none of the requested users exist
+            return {i: None for i in uid}
+
+        else:
+            sys.stderr.write(f"WARNING: Couldn't fetch user informations: {resp.status} {resp.text()}\n")
+            return None
+
+    async def _coalesce(self, key: Tuple, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        """
+        Run fetch, sharing it with concurrent calls having the same key if self.single_flight is set
+
+        :param key: Identifies identical calls, e.g. ("user", uid)
+        :param fetch: Function starting the call
+        :return: The result of the call
+        """
+
+        if self.single_flight is None:
+            return await fetch()
+
+        return await self.single_flight.run(key, fetch)
+
+    @staticmethod
+    async def _iter_chunks(
+            ids: Iterable[_K],
+            chunk_size: int,
+            max_concurrency: int,
+            fetch_chunk: Callable[[Tuple[_K, ...]], Awaitable[_T]]
+    ) -> AsyncIterator[Tuple[Tuple[_K, ...], _T]]:
+        """
+        Split ids into chunks and fetch them concurrently. Duplicated ids are only fetched once
+
+        :param ids: Every id to fetch
+        :param chunk_size: Maximum number of ids per chunk
+        :param max_concurrency: Maximum number of chunks fetched at the same time
+        :param fetch_chunk: Coroutine fetching one chunk
+        :return: An asynchronous iterator of (chunk, result) couples, in the order chunks are fetched
+
+        :except ValueError: If chunk_size or max_concurrency isn't positive
+        """
+
+        if chunk_size <= 0:
+            raise ValueError("Invalid chunk_size: must be a positive integer")
+
+        if max_concurrency <= 0:
+            raise ValueError("Invalid max_concurrency: must be a positive integer")
+
+        unique_ids = tuple(dict.fromkeys(ids))
+        chunks = [unique_ids[i:i + chunk_size] for i in range(0, len(unique_ids), chunk_size)]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(chunk: Tuple[_K, ...]) -> Tuple[Tuple[_K, ...], _T]:
+            async with semaphore:
+                return chunk, await fetch_chunk(chunk)
+
+        tasks = [asyncio.ensure_future(run(i)) for i in chunks]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _stream_array(self, url: str, key: str, error: str) -> AsyncIterator[object]:
+        """
+        Request an url and yield each element of an array of its json response as soon as it is received
+
+        :param url: The url to request
+        :param key: The key of the array in the json response, e.g. "features" or "changesets"
+        :param error: The warning written if the request failed
+        :return: An asynchronous iterator over the decoded elements
+
+        :except json.JSONDecodeError: If the response was truncated, after every element received was yielded
+        """
+
+        async with self.transport.stream(url) as resp:
+            if resp.status != 200:
+                resp = await resp.read()
+                sys.stderr.write(f"WARNING: {error}: {resp.status} {resp.text()}\n")
+                return
+
+            async for i in iter_json_array(resp.iter_chunks(), key):
+                yield i
 
     async def fetch_notes_by_bbox(self, bbox: OSMBoundingBox, limit: int = 100, closed: int = 7) -> Tuple[OSMNote, ...]:
         """
@@ -128,6 +511,66 @@ class PyOSM:
         :except ValueError: Raises this exception if the parameters are invalid (e.g. bounding box crosses date line, is too big or if limit is too high)
         """
 
+        notes = await self._fetch_notes_by_bbox(bbox, limit, closed)
+
+        return () if notes is None else notes
+
+    async def _fetch_notes_by_bbox(self, bbox: OSMBoundingBox, limit: int, closed: int) -> Tuple[OSMNote, ...] | None:
+        """
+        Same as fetch_notes_by_bbox, but tells failed requests apart from areas without notes
+        :return: A tuple of OSM Notes, or None if the request failed
+
+        :except ValueError: If the parameters are invalid
+        """
+
+        resp = await self.transport.get(await self._notes_by_bbox_url(bbox, limit, closed))
+
+        if resp.status == 200:
+            data = resp.json()
+
+            if len(data['features']) == 0:
+                return ()
+
+            return tuple([OSMNote(i, lazy=self.lazy_objects) for i in data['features']])
+
+        else:
+            sys.stderr.write(f"WARNING: Couldn't fetch OSM notes: {resp.status} {resp.text()}\n")
+            return None
+
+    async def stream_notes_by_bbox(
+            self,
+            bbox: OSMBoundingBox,
+            limit: int = 100,
+            closed: int = 7
+    ) -> AsyncIterator[OSMNote]:
+        """
+        Same as fetch_notes_by_bbox, but each note is yielded as soon as it is received instead of waiting for the whole
+        response
+
+        :param bbox: Coordinates for the area to retrieve the notes from. Must not be overlaping the date line
+        :param limit: Number of entries returned at max
+        :param closed: Number of days a note needs to be closed to be excluded (0 means only open notes are returned, negative means all notes)
+        :return: An asynchronous iterator over OSM Notes
+
+        :except ValueError: Raises this exception if the parameters are invalid (e.g. bounding box crosses date line, is too big or if limit is too high)
+        :except json.JSONDecodeError: If the response was truncated, after every note received was yielded
+        """
+
+        url = await self._notes_by_bbox_url(bbox, limit, closed)
+
+        async for i in self._stream_array(url, "features", "Couldn't fetch OSM notes"):
+            yield OSMNote(i, lazy=self.lazy_objects)
+
+    async def _notes_by_bbox_url(self, bbox: OSMBoundingBox, limit: int, closed: int) -> str:
+        """
+        Check parameters of fetch_notes_by_bbox and build its url
+        :return: The url
+
+        :except ValueError: If the parameters are invalid
+        """
+
+        await self.ensure_capabilities()
+
         # ===== Parameters checks ===== #
 
         if not bbox.check_data():
@@ -144,24 +587,85 @@ class PyOSM:
 
         # ========== #
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                    f"https://api.openstreetmap.org/api/0.6/notes.json?bbox={bbox}&limit={limit}&closed={closed}"
-            ) as resp:
-                if resp.status == 200:
-                    data = json.loads(await resp.text())
+        return f"{self.api_url}/notes.json?bbox={bbox}&limit={limit}&closed={closed}"
 
-                    if len(data['features']) == 0:
-                        return ()
+    async def fetch_notes_by_tiled_bbox(
+            self,
+            bbox: OSMBoundingBox,
+            closed: int = 7,
+            limit: Optional[int] = None,
+            max_concurrency: int = 4,
+            max_depth: int = 6
+    ) -> Tuple[OSMNote, ...]:
+        """
+        Fetch every note located in a bounding box of any size, even crossing date line.
+        The bounding box is split into tiles small enough for self.fetch_notes_by_bbox, which are fetched concurrently.
+        Tiles returning limit notes are subdivided in 4 and fetched again, as some notes may be missing.
+
+        :param bbox: Coordinates for the area to retrieve the notes from
+        :param closed: Number of days a note needs to be closed to be excluded (0 means only open notes are returned, negative means all notes)
+        :param limit: Number of entries requested per tile. Default is self.capabilities.notes.maximum_query_limit
+        :param max_concurrency: Maximum number of tiles fetched at the same time
+        :param max_depth: Maximum number of times a tile can be subdivided
+        :return: A tuple of OSM Notes, without duplicates
+
+        :except ValueError: Raises this exception if the parameters are invalid
+        :except OSMIncompleteResultError: If some tiles couldn't be fetched, or still returned limit notes after
+        max_depth subdivisions. Its result contains notes of every other tile, and failed contains those tiles
+        """
 
-                    return tuple([OSMNote(i) for i in data['features']])
+        await self.ensure_capabilities()
 
-                else:
-                    sys.stderr.write(f"WARNING: Couldn't fetch OSM notes: {resp.status} {await resp.text()}\n")
-                    return ()
+        if limit is None:
+            limit = self.capabilities.notes.maximum_query_limit
 
-    @staticmethod
-    async def fetch_note_by_id(note_id: int) -> OSMNote | None:
+        if max_concurrency <= 0:
+            raise ValueError("Invalid max_concurrency: must be a positive integer")
+
+        tiles = []
+        for i in bbox.split_date_line():
+            if not i.check_data():
+                raise ValueError("Bounding box invalid: for more information, check Documentation/OSMBoundingBox.md")
+
+            tiles.extend(i.split(self.capabilities.notes.area))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        notes: Dict[int, OSMNote] = {}
+
+        # Tiles which couldn't be fetched, or whose notes may not all be returned
+        failed: List[OSMBoundingBox] = []
+
+        async def fetch_tile(tile: OSMBoundingBox, depth: int) -> None:
+            async with semaphore:
+                result = await self._fetch_notes_by_bbox(tile, limit, closed)
+
+            if result is None:
+                failed.append(tile)
+                return
+
+            for note in result:
+                notes[note.id] = note
+
+            if len(result) >= limit:
+                if depth >= max_depth:
+                    failed.append(tile)
+                    return
+
+                await asyncio.gather(*[fetch_tile(i, depth + 1) for i in tile.subdivide()])
+
+        await asyncio.gather(*[fetch_tile(i, 0) for i in tiles])
+
+        if failed:
+            raise OSMIncompleteResultError(
+                f"{len(failed)} tiles couldn't be fetched or still have at least {limit} notes after {max_depth} "
+                f"subdivisions, some notes are missing",
+                tuple(notes.values()),
+                tuple(failed)
+            )
+
+        return tuple(notes.values())
+
+    async def fetch_note_by_id(self, note_id: int) -> OSMNote | None:
         """
         Fetch a note by its internal id
 
@@ -169,17 +673,36 @@ class PyOSM:
         :return: The note object or None if something went wrong
         """
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"https://api.openstreetmap.org/api/0.6/notes/{note_id}.json") as resp:
-                if resp.status == 200:
-                    data = json.loads(await resp.text())
+        if self.cache is not None:
+            cached = self.cache.get(("note", note_id))
+
+            if cached is not None:
+                return cached
+
+        return await self._coalesce(("note", note_id), lambda: self._fetch_note_by_id(note_id))
+
+    async def _fetch_note_by_id(self, note_id: int) -> OSMNote | None:
+        """
+        Perform the request of self.fetch_note_by_id and cache its result
+        :param note_id: The note ID
+        :return: The note, or None
+        """
+
+        resp = await self.transport.get(f"{self.api_url}/notes/{note_id}.json")
 
-                    return OSMNote(data)
+        if resp.status == 200:
+            data = resp.json()
 
+            note = OSMNote(data, lazy=self.lazy_objects)
 
-                else:
-                    sys.stderr.write(f"WARNING: Couldn't fetch OSM note: {resp.status} {await resp.text()}\n")
-                    return None
+            if self.cache is not None:
+                self.cache.put(("note", note_id), note)
+
+            return note
+
+        else:
+            sys.stderr.write(f"WARNING: Couldn't fetch OSM note: {resp.status} {resp.text()}\n")
+            return None
 
     async def fetch_notes_by_search(
             self,
@@ -203,7 +726,7 @@ class PyOSM:
         :param user_name: Search for notes which the given user interacted with
         :param user_id: Same than user_name but with user ID. If both option provided, user_name takes priority
         :param bbox: Coordinates for the area to retrieve the notes from. Must be under self._capability['note_area'] degrees
-        :param during: Keep only notes which were created at or updated at (defined in sort) in this timedelta. Before value is optional
+        :param during: Keep only notes which were created at or updated at (defined in sort) in this timedelta. After value is optional
         :param sort: Define what type of values we use for during. Valid values are defined in OSMSort
         :param order: Used to sort by newest or oldest. Valid values are defined in OSMOrder
 
@@ -211,6 +734,68 @@ class PyOSM:
         :except ValueError: If any parameters is invalid.
         """
 
+        url = await self._notes_by_search_url(limit, closed, query, user_name, user_id, bbox, during, sort, order)
+        resp = await self.transport.get(url)
+
+        if resp.status == 200:
+            data = resp.json()
+
+            if len(data['features']) == 0:
+                return ()
+
+            return tuple([OSMNote(i, lazy=self.lazy_objects) for i in data['features']])
+
+        else:
+            sys.stderr.write(f"WARNING: Couldn't fetch OSM notes: {resp.status} {resp.text()}\n")
+            return ()
+
+    async def stream_notes_by_search(
+            self,
+            limit: int = 100,
+            closed: int = 7,
+            query: Optional[str] = None,
+            user_name: Optional[str] = None,
+            user_id: Optional[int] = None,
+            bbox: Optional[OSMBoundingBox] = None,
+            during: Optional[OSMTimeDelta] = None,
+            sort: Optional[Literal[OSMSort.CREATED_AT, OSMSort.UPDATED_AT]] = None,
+            order: Optional[Literal[OSMOrder.NEWEST, OSMOrder.OLDEST]] = None
+    ) -> AsyncIterator[OSMNote]:
+        """
+        Same as fetch_notes_by_search, but each note is yielded as soon as it is received instead of waiting for the
+        whole response. Parameters are the same as fetch_notes_by_search ones
+
+        :return: An asynchronous iterator over notes matching search criterias
+        :except ValueError: If any parameters is invalid.
+        :except json.JSONDecodeError: If the response was truncated, after every note received was yielded
+        """
+
+        url = await self._notes_by_search_url(limit, closed, query, user_name, user_id, bbox, during, sort, order)
+
+        async for i in self._stream_array(url, "features", "Couldn't fetch OSM notes"):
+            yield OSMNote(i, lazy=self.lazy_objects)
+
+    async def _notes_by_search_url(
+            self,
+            limit: int,
+            closed: int,
+            query: Optional[str],
+            user_name: Optional[str],
+            user_id: Optional[int],
+            bbox: Optional[OSMBoundingBox],
+            during: Optional[OSMTimeDelta],
+            sort: Optional[Literal[OSMSort.CREATED_AT, OSMSort.UPDATED_AT]],
+            order: Optional[Literal[OSMOrder.NEWEST, OSMOrder.OLDEST]]
+    ) -> str:
+        """
+        Check parameters of fetch_notes_by_search and build its url
+        :return: The url
+
+        :except ValueError: If any parameters is invalid.
+        """
+
+        await self.ensure_capabilities()
+
         # ===== Parameters check ===== #
 
         if not 0 <= limit <= self.capabilities.notes.maximum_query_limit:
@@ -224,8 +809,8 @@ class PyOSM:
                 raise ValueError(f"Bounding box must be under {self.capabilities.notes.area} square degrees")
 
         if during is not None:
-            if not during.check_data_validity(optional_after=False):
-                raise ValueError("After value is newer than before value or you forgot to set before value")
+            if not during.check_data_validity(optional_before=False):
+                raise ValueError("After value is older than before value or you forgot to set before value")
 
         if isinstance(sort, str):
             sort = OSMSort(sort)
@@ -244,7 +829,7 @@ class PyOSM:
 
         # ===== Build URL ===== #
 
-        url = f"https://api.openstreetmap.org/api/0.6/notes/search.json?limit={limit}&closed={quote(str(closed))}"
+        url = f"{self.api_url}/notes/search.json?limit={limit}&closed={quote(str(closed))}"
 
         if query:
             url += f"&q={quote(query)}"
@@ -259,10 +844,10 @@ class PyOSM:
             url += f"&bbox={bbox}"
 
         if during is not None:
-            url += f"&from={quote(during.after.isoformat())}"
+            url += f"&from={quote(during.before.isoformat())}"
 
-            if during.before is not None:
-                url += f"&to={quote(during.before.isoformat())}"
+            if during.after is not None:
+                url += f"&to={quote(during.after.isoformat())}"
 
         if sort:
             url += f"&sort={sort.value if isinstance(sort, OSMSort) else sort}"
@@ -272,19 +857,103 @@ class PyOSM:
 
         # ========== #
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    data = json.loads(await resp.text())
+        return url
+
+    async def iter_notes(
+            self,
+            closed: int = 7,
+            query: Optional[str] = None,
+            user_name: Optional[str] = None,
+            user_id: Optional[int] = None,
+            bbox: Optional[OSMBoundingBox] = None,
+            during: Optional[OSMTimeDelta] = None,
+            sort: Literal[OSMSort.CREATED_AT, OSMSort.UPDATED_AT] = OSMSort.UPDATED_AT,
+            order: Literal[OSMOrder.NEWEST, OSMOrder.OLDEST] = OSMOrder.NEWEST,
+            max_results: Optional[int] = None,
+            page_size: Optional[int] = None
+    ) -> AsyncIterator[OSMNote]:
+        """
+        Iterate over every note matching defined criteria, without the limit of self.fetch_notes_by_search.
+        Notes are fetched page by page: after each page, the timedelta is shrunk to the last created at or updated at
+        datetime (defined in sort) seen, in the direction defined by order. Notes returned twice at pages boundaries
+        are skipped.
+
+        :param closed: Same as in self.fetch_notes_by_search
+        :param query: Same as in self.fetch_notes_by_search
+        :param user_name: Same as in self.fetch_notes_by_search
+        :param user_id: Same as in self.fetch_notes_by_search
+        :param bbox: Same as in self.fetch_notes_by_search
+        :param during: Same as in self.fetch_notes_by_search. If not set, iterate over every note since notes exist
+        :param sort: Define which datetime pages are sorted on. Valid values are defined in OSMSort
+        :param order: Define if notes are returned from newest or oldest. Valid values are defined in OSMOrder
+        :param max_results: Stop after this number of notes. If None, iterate until every note is returned
+        :param page_size: Number of notes requested per page. Default is self.capabilities.notes.maximum_query_limit
+
+        :return: An asynchronous iterator of notes
+        :except ValueError: If any parameters is invalid.
+        """
+
+        await self.ensure_capabilities()
+
+        if page_size is None:
+            page_size = self.capabilities.notes.maximum_query_limit
+
+        if page_size <= 0:
+            raise ValueError("Invalid page_size: must be a positive integer")
+
+        if isinstance(sort, str):
+            sort = OSMSort(sort)
+
+        if isinstance(order, str):
+            order = OSMOrder(order)
+
+        if during is None:
+            # Notes were introduced in 2013, every note is after this date
+            during = OSMTimeDelta(before=datetime.fromisoformat("2013-01-01T00:00:00Z"))
+
+        newest_first = order == OSMOrder.NEWEST
+
+        async def fetch_page(cursor: datetime | None) -> Tuple[OSMNote, ...]:
+            return await self.fetch_notes_by_search(
+                limit=page_size,
+                closed=closed,
+                query=query,
+                user_name=user_name,
+                user_id=user_id,
+                bbox=bbox,
+                during=self._move_timedelta(during, cursor, newest_first),
+                sort=sort,
+                order=order
+            )
+
+        async for note in self._iter_time_window(
+                fetch_page,
+                lambda note: note.id,
+                lambda note: self._note_datetime(note, sort),
+                page_size,
+                max_results,
+                newest_first
+        ):
+            yield note
 
-                    if len(data['features']) == 0:
-                        return ()
+    @staticmethod
+    def _note_datetime(note: OSMNote, sort: OSMSort) -> datetime:
+        """
+        Get the datetime a note is sorted on by the API
+
+        :param note: The note
+        :param sort: OSMSort.CREATED_AT for its creation datetime, OSMSort.UPDATED_AT for its last comment datetime
+        :return: The timezone aware datetime
+        """
 
-                    return tuple([OSMNote(i) for i in data['features']])
+        if sort == OSMSort.CREATED_AT or len(note.comments) == 0:
+            date = note.date_created
 
-                else:
-                    sys.stderr.write(f"WARNING: Couldn't fetch OSM notes: {resp.status} {await resp.text()}\n")
-                    return ()
+        else:
+            date = max([i.date for i in note.comments])
+
+        # Notes dates are returned in UTC without timezone
+        return date.replace(tzinfo=timezone.utc)
 
     async def fetch_changesets_by_search(
             self,
@@ -309,8 +978,8 @@ class PyOSM:
         :param user_id: Same than user_name but with user ID. If both option provided, user_name takes priority
         :param bbox: Changesets must be within this bounding box to be returned
         :param created_timedelta: Return changesets created during this timedelta. Note: You can set only before or before AND after but can't just set after
-        :param closed_timedelta: Return changesets created during this timedelta. Note: You can set only before or before AND after but can't just set after
-        :param by_ids: Return only changesets with those ID
+        :param closed_timedelta: Return changesets closed during this timedelta. Note: You can set only before or before AND after but can't just set after
+        :param by_ids: Return only changesets with those ID. To fetch more changesets than limit, use self.fetch_changesets_by_ids
         :param status: Decides if you want to get only open or closed changesets. Default value is both of them
         :param order: Define in which order to return changesets
 
@@ -318,6 +987,72 @@ class PyOSM:
         :except ValueError: If any parameter have invalid values. Please refer to the attached message
         """
 
+        url = await self._changesets_by_search_url(
+            limit, user_name, user_id, bbox, created_timedelta, closed_timedelta, by_ids, status, order
+        )
+        resp = await self.transport.get(url)
+
+        if resp.status == 200:
+            data = resp.json()
+
+            if len(data['changesets']) == 0:
+                return ()
+
+            return tuple([OSMChangeset(i, lazy=self.lazy_objects) for i in data['changesets']])
+
+        else:
+            sys.stderr.write(f"WARNING: Couldn't fetch OSM changesets: {resp.status} {resp.text()}\n")
+            return ()
+
+    async def stream_changesets_by_search(
+            self,
+            limit: int = 100,
+            user_name: Optional[str] = None,
+            user_id: Optional[int] = None,
+            bbox: Optional[OSMBoundingBox] = None,
+            created_timedelta: Optional[OSMTimeDelta] = None,
+            closed_timedelta: Optional[OSMTimeDelta] = None,
+            by_ids: Optional[Iterable[int]] = None,
+            status: Literal[OSMStatus.OPEN, OSMStatus.CLOSED, OSMStatus.OPEN_AND_CLOSED] = OSMStatus.OPEN_AND_CLOSED,
+            order: Optional[Literal[OSMOrder.NEWEST, OSMOrder.OLDEST]] = None
+    ) -> AsyncIterator[OSMChangeset]:
+        """
+        Same as fetch_changesets_by_search, but each changeset is yielded as soon as it is received instead of waiting
+        for the whole response. Parameters are the same as fetch_changesets_by_search ones
+
+        :return: An asynchronous iterator over changesets validating those conditions
+        :except ValueError: If any parameter have invalid values. Please refer to the attached message
+        :except json.JSONDecodeError: If the response was truncated, after every changeset received was yielded
+        """
+
+        url = await self._changesets_by_search_url(
+            limit, user_name, user_id, bbox, created_timedelta, closed_timedelta, by_ids, status, order
+        )
+
+        async for i in self._stream_array(url, "changesets", "Couldn't fetch OSM changesets"):
+            yield OSMChangeset(i, lazy=self.lazy_objects)
+
+    async def _changesets_by_search_url(
+            self,
+            limit: int,
+            user_name: Optional[str],
+            user_id: Optional[int],
+            bbox: Optional[OSMBoundingBox],
+            created_timedelta: Optional[OSMTimeDelta],
+            closed_timedelta: Optional[OSMTimeDelta],
+            by_ids: Optional[Iterable[int]],
+            status: Literal[OSMStatus.OPEN, OSMStatus.CLOSED, OSMStatus.OPEN_AND_CLOSED],
+            order: Optional[Literal[OSMOrder.NEWEST, OSMOrder.OLDEST]]
+    ) -> str:
+        """
+        Check parameters of fetch_changesets_by_search and build its url
+        :return: The url
+
+        :except ValueError: If any parameter have invalid values. Please refer to the attached message
+        """
+
+        await self.ensure_capabilities()
+
         # ===== Parameters check =====
 
         if not 0 <= limit <= self.capabilities.changesets.maximum_query_limit:
@@ -333,18 +1068,18 @@ class PyOSM:
                 raise ValueError("Bounding box invalid: for more information, check Documentation/OSMBoundingBox.md")
 
         if created_timedelta is not None:
-            if created_timedelta.after is None:
-                raise ValueError("You never defined a after datetime for created_timedelta")
+            if created_timedelta.before is None:
+                raise ValueError("You never defined a before datetime for created_timedelta")
 
-            if not created_timedelta.check_data_validity(optional_after=False):
-                raise ValueError(f"Created_timedelta is invalid: before datetime is older than after datetime")
+            if not created_timedelta.check_data_validity(optional_before=False):
+                raise ValueError(f"Created_timedelta is invalid: after datetime is older than before datetime")
 
         if closed_timedelta is not None:
-            if closed_timedelta.after is None:
-                raise ValueError("You never defined a after datetime for closed_timedelta")
+            if closed_timedelta.before is None:
+                raise ValueError("You never defined a before datetime for closed_timedelta")
 
-            if not closed_timedelta.check_data_validity(optional_after=False):
-                raise ValueError(f"Closed_timedelta is invalid: before datetime is older than after datetime")
+            if not closed_timedelta.check_data_validity(optional_before=False):
+                raise ValueError(f"Closed_timedelta is invalid: after datetime is older than before datetime")
 
         if isinstance(status, str):
             status = OSMStatus(status)
@@ -360,7 +1095,7 @@ class PyOSM:
 
         # ===== Build URL =====
 
-        url = f"https://api.openstreetmap.org/api/0.6/changesets.json?limit={limit}"
+        url = f"{self.api_url}/changesets.json?limit={limit}"
 
         if user_name:
             url += f"&display_name={quote(user_name)}"
@@ -372,16 +1107,16 @@ class PyOSM:
             url += f"&bbox={bbox}"
 
         if created_timedelta is not None:
-            url += f"&from={created_timedelta.after.isoformat()}"
+            url += f"&from={quote(created_timedelta.before.isoformat())}"
 
-            if created_timedelta.before is not None:
-                url += f"&to={created_timedelta.before.isoformat()}"
+            if created_timedelta.after is not None:
+                url += f"&to={quote(created_timedelta.after.isoformat())}"
 
         if closed_timedelta is not None:
-            url += f"&time={closed_timedelta.after.isoformat()}"
+            url += f"&time={quote(closed_timedelta.before.isoformat())}"
 
-            if closed_timedelta.before is not None:
-                url += f",{closed_timedelta.before.isoformat()}"
+            if closed_timedelta.after is not None:
+                url += f",{quote(closed_timedelta.after.isoformat())}"
 
         if by_ids is not None:
             url += f"&changesets={','.join([str(i) for i in by_ids])}"
@@ -399,22 +1134,220 @@ class PyOSM:
 
         # ========== #
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    data = json.loads(await resp.text())
+        return url
 
-                    if len(data['changesets']) == 0:
-                        return ()
+    async def iter_changesets(
+            self,
+            user_name: Optional[str] = None,
+            user_id: Optional[int] = None,
+            bbox: Optional[OSMBoundingBox] = None,
+            created_timedelta: Optional[OSMTimeDelta] = None,
+            closed_timedelta: Optional[OSMTimeDelta] = None,
+            status: Literal[OSMStatus.OPEN, OSMStatus.CLOSED, OSMStatus.OPEN_AND_CLOSED] = OSMStatus.OPEN_AND_CLOSED,
+            max_results: Optional[int] = None,
+            page_size: Optional[int] = None
+    ) -> AsyncIterator[OSMChangeset]:
+        """
+        Iterate over every changeset matching defined criteria, from newest to oldest, without the limit of
+        self.fetch_changesets_by_search.
+        Changesets are fetched page by page: after each page, the after datetime of the timedelta is moved back to the
+        oldest created_at seen. Changesets returned twice at pages boundaries are skipped.
+
+        :param user_name: Same as in self.fetch_changesets_by_search
+        :param user_id: Same as in self.fetch_changesets_by_search
+        :param bbox: Same as in self.fetch_changesets_by_search
+        :param created_timedelta: Same as in self.fetch_changesets_by_search
+        :param closed_timedelta: Same as in self.fetch_changesets_by_search
+        :param status: Same as in self.fetch_changesets_by_search
+        :param max_results: Stop after this number of changesets. If None, iterate until every changeset is returned
+        :param page_size: Number of changesets requested per page. Default is self.capabilities.changesets.maximum_query_limit
+
+        :return: An asynchronous iterator of changesets
+        :except ValueError: If any parameter have invalid values. Please refer to the attached message
+        """
+
+        await self.ensure_capabilities()
+
+        if page_size is None:
+            page_size = self.capabilities.changesets.maximum_query_limit
+
+        if page_size <= 0:
+            raise ValueError("Invalid page_size: must be a positive integer")
+
+        if created_timedelta is None and closed_timedelta is None:
+            # The API doesn't accept an upper bound alone, so we start the search at the first possible changeset
+            created_timedelta = OSMTimeDelta(before=datetime.fromisoformat("2005-01-01T00:00:00Z"))
 
-                    return tuple([OSMChangeset(i) for i in data['changesets']])
+        async def fetch_page(cursor: datetime | None) -> Tuple[OSMChangeset, ...]:
+            return await self.fetch_changesets_by_search(
+                limit=page_size,
+                user_name=user_name,
+                user_id=user_id,
+                bbox=bbox,
+                created_timedelta=self._move_timedelta(created_timedelta, cursor, newest_first=True),
+                closed_timedelta=self._move_timedelta(closed_timedelta, cursor, newest_first=True),
+                status=status
+            )
 
-                else:
-                    sys.stderr.write(f"WARNING: Couldn't fetch OSM changesets: {resp.status} {await resp.text()}\n")
-                    return ()
+        async for changeset in self._iter_time_window(
+                fetch_page,
+                lambda changeset: changeset.id,
+                lambda changeset: changeset.created_at,
+                page_size,
+                max_results,
+                newest_first=True
+        ):
+            yield changeset
 
     @staticmethod
-    async def fetch_changeset_by_id(changeset_id: int, include_discussion: bool = False) -> OSMChangeset | None:
+    async def _iter_time_window(
+            fetch_page: Callable[[datetime | None], Awaitable[Tuple[_T, ...]]],
+            get_id: Callable[[_T], int],
+            get_datetime: Callable[[_T], datetime],
+            page_size: int,
+            max_results: Optional[int],
+            newest_first: bool
+    ) -> AsyncIterator[_T]:
+        """
+        Iterate over paginated results by sliding a time window.
+        After each full page, the window is moved to the last datetime seen and objects returned twice at pages
+        boundaries are skipped.
+
+        :param fetch_page: Coroutine fetching a page, taking as parameter the cursor (None for the first page)
+        :param get_id: Function returning the ID of an object
+        :param get_datetime: Function returning the datetime an object is sorted on. Must be timezone aware
+        :param page_size: Number of objects requested per page
+        :param max_results: Stop after this number of objects. If None, iterate until the window is exhausted
+        :param newest_first: True if pages are sorted from newest to oldest, False if sorted from oldest to newest
+        :return: An asynchronous iterator of objects
+        """
+
+        cursor: datetime | None = None
+        seen: Dict[int, datetime] = {}
+        count = 0
+
+        while max_results is None or count < max_results:
+            page = await fetch_page(cursor)
+
+            new = 0
+
+            for i in page:
+                if get_id(i) in seen.keys():
+                    continue
+
+                seen[get_id(i)] = get_datetime(i)
+                new += 1
+
+                yield i
+
+                count += 1
+                if max_results is not None and count >= max_results:
+                    return
+
+            if len(page) < page_size:
+                return
+
+            if newest_first:
+                last = min([get_datetime(i) for i in page])
+
+            else:
+                last = max([get_datetime(i) for i in page])
+
+            if new == 0:
+                # Every object of this page have the same datetime: skip the ones left at this datetime
+                sys.stderr.write(f"WARNING: More than {page_size} results on {last.isoformat()}, some of them were "
+                                 f"skipped\n")
+                cursor = last - timedelta(microseconds=1) if newest_first else last + timedelta(microseconds=1)
+
+            else:
+                # API datetimes are rounded to the second, so we include the whole second of the last object
+                cursor = last + timedelta(seconds=1) if newest_first else last - timedelta(seconds=1)
+
+            if newest_first:
+                seen = {key: value for key, value in seen.items() if value <= cursor}
+
+            else:
+                seen = {key: value for key, value in seen.items() if value >= cursor}
+
+    @staticmethod
+    def _move_timedelta(
+            time_delta: OSMTimeDelta | None,
+            cursor: datetime | None,
+            newest_first: bool
+    ) -> OSMTimeDelta | None:
+        """
+        Build a copy of a timedelta shrunk to a cursor.
+        If newest_first, after datetime is moved back to cursor; else before datetime is moved forward to cursor
+
+        :param time_delta: The original timedelta
+        :param cursor: The datetime to move the timedelta to. If None, time_delta is returned as is
+        :param newest_first: Define which datetime of the timedelta is moved
+        :return: The moved timedelta
+        """
+
+        if time_delta is None or cursor is None:
+            return time_delta
+
+        bound = time_delta.after if newest_first else time_delta.before
+
+        if bound is not None:
+            if bound.tzinfo is None:
+                bound = bound.replace(tzinfo=timezone.utc)
+
+            if (newest_first and bound <= cursor) or (not newest_first and bound >= cursor):
+                return time_delta
+
+        if newest_first:
+            return OSMTimeDelta(before=time_delta.before, after=cursor)
+
+        else:
+            return OSMTimeDelta(before=cursor, after=time_delta.after)
+
+    async def fetch_changesets_by_ids(
+            self,
+            changeset_ids: Iterable[int],
+            chunk_size: Optional[int] = None,
+            max_concurrency: int = 4
+    ) -> Dict[int, OSMChangeset | None]:
+        """
+        Fetch multiple changesets by their ID
+        IDs are split in chunks of chunk_size, fetched concurrently
+        Note: this method doesn't return comments, please use self.fetch_changeset_by_id for this purpose
+
+        :param changeset_ids: Every changeset ID to fetch
+        :param chunk_size: Maximum number of changesets fetched per request. Must be under self.capabilities.changesets.maximum_query_limit, which is the default value
+        :param max_concurrency: Maximum number of requests performed at the same time
+        :return: A dict associating each ID, in the same order as changeset_ids, to its OSMChangeset or None if it couldn't be fetched
+
+        :except ValueError: If chunk_size is invalid
+        """
+
+        await self.ensure_capabilities()
+
+        if chunk_size is None:
+            chunk_size = self.capabilities.changesets.maximum_query_limit
+
+        if not 0 < chunk_size <= self.capabilities.changesets.maximum_query_limit:
+            raise ValueError(
+                f"Invalid chunk_size: must be a positive below {self.capabilities.changesets.maximum_query_limit}"
+            )
+
+        changesets: Dict[int, OSMChangeset | None] = {i: None for i in changeset_ids}
+
+        async def fetch_chunk(chunk: Tuple[int, ...]) -> Tuple[OSMChangeset, ...]:
+            return await self.fetch_changesets_by_search(limit=len(chunk), by_ids=chunk)
+
+        async for _, result in self._iter_chunks(changesets.keys(), chunk_size, max_concurrency, fetch_chunk):
+            for changeset in result:
+                if changeset.id in changesets.keys():
+                    changesets[changeset.id] = changeset
+
+                if self.cache is not None:
+                    self.cache.put(("changeset", changeset.id, False), changeset)
+
+        return changesets
+
+    async def fetch_changeset_by_id(self, changeset_id: int, include_discussion: bool = False) -> OSMChangeset | None:
         """
         Fetch a changeset by its ID
         :param changeset_id: The changeset ID to fetch from
@@ -422,30 +1355,352 @@ class PyOSM:
         :return: The fetched changeset, or None if any issue happened
         """
 
-        url = f"https://api.openstreetmap.org/api/0.6/changeset/{changeset_id}.json"
+        if self.cache is not None:
+            # A changeset fetched with its discussion can also be used when the discussion isn't needed
+            cached = self.cache.get(("changeset", changeset_id, True))
+
+            if cached is None and not include_discussion:
+                cached = self.cache.get(("changeset", changeset_id, False))
+
+            if cached is not None:
+                return cached
+
+        return await self._coalesce(
+            ("changeset", changeset_id, include_discussion),
+            lambda: self._fetch_changeset_by_id(changeset_id, include_discussion)
+        )
+
+    async def _fetch_changeset_by_id(self, changeset_id: int, include_discussion: bool) -> OSMChangeset | None:
+        """
+        Perform the request of self.fetch_changeset_by_id and cache its result, or add it to the next batch if
+        self.changeset_batcher is set and include_discussion is False, as bulk requests don't return comments
+        :param changeset_id: The changeset ID
+        :param include_discussion: If set to True, also fetch this changeset comments
+        :return: The changeset, or None
+        """
+
+        if self.changeset_batcher is not None and not include_discussion:
+            return await self.changeset_batcher.load(changeset_id)
+
+        url = f"{self.api_url}/changeset/{changeset_id}.json"
 
         if include_discussion:
             url += "?include_discussion=true"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    data = json.loads(await resp.text())
+        resp = await self.transport.get(url)
+
+        if resp.status == 200:
+            data = resp.json()
+
+            if len(data['changeset']) == 0:
+                sys.stderr.write(f"WARNING: Couldn't fetch OSM changesets: data invalid\n")
+                return None
+
+            changeset = OSMChangeset(data['changeset'], lazy=self.lazy_objects)
+
+            if self.cache is not None:
+                self.cache.put(("changeset", changeset_id, include_discussion), changeset, include_discussion)
+
+            return changeset
+
+        else:
+            sys.stderr.write(f"WARNING: Couldn't fetch OSM changesets: {resp.status} {resp.text()}\n")
+            return None
+
+    async def iter_changeset_diff(self, changeset_id: int) -> AsyncIterator[OSMChange]:
+        """
+        Iterate over changes made in a changeset, each of them being yielded as soon as it is received
+        For more information: https://wiki.openstreetmap.org/wiki/API_v0.6#Download:_GET_/api/0.6/changeset/#id/download
+
+        :param changeset_id: The changeset ID
+        :return: An asynchronous iterator over changes, in the order they were made
+
+        :except xml.etree.ElementTree.ParseError: If the response is invalid or was truncated, after every change
+        received was yielded
+        """
+
+        async with self.transport.stream(f"{self.api_url}/changeset/{changeset_id}/download") as resp:
+            if resp.status != 200:
+                resp = await resp.read()
+                sys.stderr.write(f"WARNING: Couldn't fetch OSM changeset diff: {resp.status} {resp.text()}\n")
+                return
+
+            async for i in iter_osm_change(resp.iter_chunks()):
+                yield i
+
+    async def fetch_changeset_diff(self, changeset_id: int) -> Tuple[OSMChange, ...]:
+        """
+        Fetch changes made in a changeset
+
+        :param changeset_id: The changeset ID
+        :return: A tuple containing every change, in the order they were made
+
+        :except xml.etree.ElementTree.ParseError: If the response is invalid or was truncated
+        """
+
+        return tuple([i async for i in self.iter_changeset_diff(changeset_id)])
+
+    async def fetch_changeset_diff_summary(self, changeset_id: int) -> OSMChangesetDiffSummary:
+        """
+        Fetch changes made in a changeset and summarize them, without keeping them in memory
+
+        :param changeset_id: The changeset ID
+        :return: The summary, counting changes per action and element type and tag keys of created or modified elements
+
+        :except xml.etree.ElementTree.ParseError: If the response is invalid or was truncated
+        """
+
+        summary = OSMChangesetDiffSummary(changeset_id)
+
+        async for i in self.iter_changeset_diff(changeset_id):
+            summary.add(i)
+
+        return summary
+
+    async def fetch_nodes(
+            self,
+            node_ids: Iterable[int | Tuple[int, int]],
+            chunk_size: Optional[int] = None,
+            max_concurrency: int = 4
+    ) -> Dict[_element_key, OSMElement | None]:
+        """
+        Fetch multiple nodes by their ID, in their latest version or in a given version
+        IDs are split in chunks fetched concurrently
+
+        :param node_ids: Every node to fetch: an ID for its latest version, or a tuple (ID, version)
+        :param chunk_size: Maximum number of nodes fetched per request. Default is computed to keep urls short enough
+        :param max_concurrency: Maximum number of requests performed at the same time
+        :return: A dict associating each ("node", ID, version or None if latest), in the same order as node_ids, to its
+        OSMElement or None if it doesn't exist or couldn't be fetched
+
+        :except ValueError: If chunk_size or max_concurrency is invalid
+        """
+
+        return await self._fetch_elements("node", node_ids, chunk_size, max_concurrency)
+
+    async def fetch_ways(
+            self,
+            way_ids: Iterable[int | Tuple[int, int]],
+            chunk_size: Optional[int] = None,
+            max_concurrency: int = 4
+    ) -> Dict[_element_key, OSMElement | None]:
+        """
+        Fetch multiple ways by their ID, in their latest version or in a given version
+        IDs are split in chunks fetched concurrently
+
+        :param way_ids: Every way to fetch: an ID for its latest version, or a tuple (ID, version)
+        :param chunk_size: Maximum number of ways fetched per request. Default is computed to keep urls short enough
+        :param max_concurrency: Maximum number of requests performed at the same time
+        :return: A dict associating each ("way", ID, version or None if latest), in the same order as way_ids, to its
+        OSMElement or None if it doesn't exist or couldn't be fetched
+
+        :except ValueError: If chunk_size or max_concurrency is invalid
+        """
+
+        return await self._fetch_elements("way", way_ids, chunk_size, max_concurrency)
+
+    async def fetch_relations(
+            self,
+            relation_ids: Iterable[int | Tuple[int, int]],
+            chunk_size: Optional[int] = None,
+            max_concurrency: int = 4
+    ) -> Dict[_element_key, OSMElement | None]:
+        """
+        Fetch multiple relations by their ID, in their latest version or in a given version
+        IDs are split in chunks fetched concurrently
+
+        :param relation_ids: Every relation to fetch: an ID for its latest version, or a tuple (ID, version)
+        :param chunk_size: Maximum number of relations fetched per request. Default is computed to keep urls short enough
+        :param max_concurrency: Maximum number of requests performed at the same time
+        :return: A dict associating each ("relation", ID, version or None if latest), in the same order as relation_ids,
+        to its OSMElement or None if it doesn't exist or couldn't be fetched
+
+        :except ValueError: If chunk_size or max_concurrency is invalid
+        """
+
+        return await self._fetch_elements("relation", relation_ids, chunk_size, max_concurrency)
+
+    async def _fetch_elements(
+            self,
+            element_type: str,
+            element_ids: Iterable[int | Tuple[int, int]],
+            chunk_size: Optional[int],
+            max_concurrency: int
+    ) -> Dict[_element_key, OSMElement | None]:
+        """
+        Fetch multiple elements of the same type using multi-fetch endpoints (e.g. /api/0.6/nodes?nodes=1,2v3)
+
+        :param element_type: "node", "way" or "relation"
+        :param element_ids: Every element to fetch: an ID for its latest version, or a tuple (ID, version)
+        :param chunk_size: Maximum number of elements fetched per request, or None to compute it from url length
+        :param max_concurrency: Maximum number of requests performed at the same time
+        :return: A dict associating each (type, ID, version or None) to its OSMElement or None
+
+        :except ValueError: If chunk_size or max_concurrency is invalid
+        """
+
+        elements: Dict[_element_key, OSMElement | None] = {
+            (element_type, i, None) if isinstance(i, int) else (element_type, i[0], i[1]): None for i in element_ids
+        }
+
+        if len(elements) == 0:
+            return elements
+
+        url = f"{self.api_url}/{element_type}s.json?{element_type}s="
+
+        def reference(key: _element_key) -> str:
+            return str(key[1]) if key[2] is None else f"{key[1]}v{key[2]}"
+
+        if chunk_size is None:
+            longest = max([len(reference(i)) for i in elements.keys()]) + 1
+            chunk_size = max(1, (_MAX_URL_LENGTH - len(url)) // longest)
+
+        if chunk_size <= 0:
+            raise ValueError("Invalid chunk_size: must be a positive integer")
+
+        if max_concurrency <= 0:
+            raise ValueError("Invalid max_concurrency: must be a positive integer")
+
+        async def fetch_chunk(chunk: Tuple[_element_key, ...]) -> Dict[_element_key, OSMElement | None] | None:
+            resp = await self.transport.get(url + ",".join([reference(i) for i in chunk]))
+
+            if resp.status == 200:
+                result: Dict[_element_key, OSMElement | None] = {i: None for i in chunk}
+
+                for i in resp.json()["elements"]:
+                    element = OSMElement(i)
+
+                    versioned = (element_type, element.id, element.version)
+                    latest = (element_type, element.id, None)
+
+                    if versioned in result.keys():
+                        result[versioned] = element
+
+                    # Responses can contain multiple versions of the same element if they were requested
+                    if latest in result.keys() and (result[latest] is None or
+                                                    result[latest].version < element.version):
+                        result[latest] = element
+
+                return result
+
+            elif resp.status in (404, 410) and len(chunk) > 1:
+                # Returned if any requested element doesn't exist: split the chunk to find which ones
+                # Halves are fetched one after the other, as this chunk already counts in max_concurrency
+                result = {}
+
+                for half in (chunk[:len(chunk) // 2], chunk[len(chunk) // 2:]):
+                    half_result = await fetch_chunk(half)
+
+                    if half_result is not None:
+                        result.update(half_result)
+
+                return result
+
+            elif resp.status in (404, 410):
+                return {chunk[0]: None}
+
+            else:
+                sys.stderr.write(f"WARNING: Couldn't fetch OSM {element_type}s: {resp.status} {resp.text()}\n")
+                return None
+
+        async for _, result in self._iter_chunks(elements.keys(), chunk_size, max_concurrency, fetch_chunk):
+            if result is not None:
+                elements.update(result)
+
+        return elements
+
+    async def fetch_map(self, bbox: OSMBoundingBox, max_concurrency: int = 4, max_depth: int = 4) -> OSMMapData:
+        """
+        Fetch every node, way and relation in a bounding box of any size, even crossing date line, into compact columns
+        The bounding box is split into tiles under self.capabilities.area, which are fetched concurrently and parsed as
+        they are received. Tiles refused by the API (e.g. containing too many nodes) are subdivided in 4 and fetched
+        again
+        For more information: https://wiki.openstreetmap.org/wiki/API_v0.6#Retrieving_map_data_by_bounding_box:_GET_/api/0.6/map
+
+        :param bbox: Coordinates for the area to retrieve the map data from
+        :param max_concurrency: Maximum number of tiles fetched at the same time
+        :param max_depth: Maximum number of times a tile can be subdivided
+        :return: The map data, without duplicates
+
+        :except ValueError: Raises this exception if the parameters are invalid
+        :except OSMIncompleteResultError: If some tiles couldn't be fetched or their response was truncated. Its result
+        contains the map data of every element received, and failed contains those tiles
+        """
+
+        await self.ensure_capabilities()
+
+        if max_concurrency <= 0:
+            raise ValueError("Invalid max_concurrency: must be a positive integer")
+
+        tiles = []
+        for i in bbox.split_date_line():
+            if not i.check_data():
+                raise ValueError("Bounding box invalid: for more information, check Documentation/OSMBoundingBox.md")
+
+            tiles.extend(i.split(self.capabilities.area))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        builder = OSMMapDataBuilder()
+
+        # Tiles which couldn't be fetched, or whose response was truncated
+        failed: List[OSMBoundingBox] = []
+
+        async def fetch_tile(tile: OSMBoundingBox, depth: int) -> None:
+            async with semaphore:
+                async with self.transport.stream(f"{self.api_url}/map.json?bbox={tile}") as resp:
+                    if resp.status == 200:
+                        try:
+                            async for element in iter_json_array(resp.iter_chunks(), "elements"):
+                                builder.add(element)
+
+                        except json.JSONDecodeError as e:
+                            sys.stderr.write(f"WARNING: Couldn't parse OSM map data of {tile}: {e}\n")
+                            failed.append(tile)
+
+                        return
+
+                    resp = await resp.read()
+
+            if resp.status == 400 and depth < max_depth:
+                await asyncio.gather(*[fetch_tile(i, depth + 1) for i in tile.subdivide()])
+
+            else:
+                sys.stderr.write(f"WARNING: Couldn't fetch OSM map data of {tile}: {resp.status} {resp.text()}\n")
+                failed.append(tile)
+
+        await asyncio.gather(*[fetch_tile(i, 0) for i in tiles])
+
+        if failed:
+            raise OSMIncompleteResultError(
+                f"{len(failed)} tiles couldn't be fetched completely, some elements are missing",
+                builder.build(),
+                tuple(failed)
+            )
+
+        return builder.build()
+
 
-                    if len(data['changeset']) == 0:
-                        sys.stderr.write(f"WARNING: Couldn't fetch OSM changesets: data invalid\n")
-                        return None
+async def py_osm_builder(prewarm: int = 0, lazy_capabilities: bool = False, **kwargs) -> PyOSM:
+    """
+    Build and initialize an instance of PyOSM
 
-                    return OSMChangeset(data['changeset'])
+    :param prewarm: Number of connections to open in advance
+    :param lazy_capabilities: If True and capabilities couldn't be loaded from capabilities_path, they're only fetched
+    when first needed instead of now
+    :param kwargs: Parameters passed to PyOSM (e.g. transport or connections_limit_per_host)
+    :return: The initialized PyOSM instance
+    """
 
-                else:
-                    sys.stderr.write(f"WARNING: Couldn't fetch OSM changesets: {resp.status} {await resp.text()}\n")
-                    return None
+    pyosm = PyOSM(**kwargs)
 
+    if not pyosm.capabilities.is_loaded():
+        if not lazy_capabilities:
+            await pyosm.update_capabilities()
 
+    elif pyosm.capabilities.is_stale(pyosm.capabilities_ttl):
+        pyosm.refresh_capabilities()
 
-async def py_osm_builder() -> PyOSM:
-    pyosm = PyOSM()
-    await pyosm.update_capabilities()
+    if prewarm > 0:
+        await pyosm.prewarm(prewarm)
 
     return pyosm
@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import asyncio
+import json
+import random
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from ..Network import OSMResponse
+from ..Network import OSMStreamResponse
+from ..Network import OSMTransport
+from ..PyOsm import PyOSM
+
+# Response of /api/0.6/capabilities.json, with small limits so tests don't need many objects
+CAPABILITIES = {
+    "api": {
+        "area": {"maximum": 0.25},
+        "timeout": {"seconds": 300},
+        "changesets": {"maximum_elements": 10000, "maximum_query_limit": 100, "default_query_limit": 100},
+        "note_area": {"maximum": 25},
+        "notes": {"maximum_query_limit": 10000, "default_query_limit": 100},
+        "status": {"database": "online", "api": "online", "gpx": "online"}
+    }
+}
+
+type _handler = Callable[[str, Dict[str, str]], OSMResponse | Awaitable[OSMResponse]]
+
+
+def json_response(url: str, data: object, status: int = 200) -> OSMResponse:
+    """
+    :param url: The requested url
+    :param data: The json body
+    :param status: The HTTP status code
+    :return: The response
+    """
+
+    return OSMResponse(url, status, {"Content-Type": "application/json"}, json.dumps(data).encode())
+
+
+def query(url: str) -> Dict[str, str]:
+    """
+    :param url: An url
+    :return: Its query parameters
+    """
+
+    return dict(parse_qsl(urlsplit(url).query))
+
+
+def split_randomly(body: bytes, rng: random.Random, max_size: int = 16) -> List[bytes]:
+    """
+    Split a body into chunks of random sizes, some of them being 1 byte long
+    :param body: The body
+    :param rng: Random generator, seeded by the test
+    :param max_size: Maximum size of a chunk
+    :return: The chunks
+    """
+
+    chunks = []
+    start = 0
+
+    while start < len(body):
+        size = rng.randint(1, max_size)
+        chunks.append(body[start:start + size])
+        start += size
+
+    return chunks
+
+
+async def iter_list(chunks: List[bytes]) -> AsyncIterator[bytes]:
+    """
+    :param chunks: Body chunks
+    :return: An asynchronous iterator over them, giving control back to the event loop between 2 chunks
+    """
+
+    for chunk in chunks:
+        await asyncio.sleep(0)
+        yield chunk
+
+
+class FakeTransport(OSMTransport):
+    """
+    Transport answering requests with a function instead of the network, and keeping every requested url
+    Streamed bodies are split into chunks of random sizes, so parsers see values cut anywhere
+    """
+
+    def __init__(self, handler: _handler, seed: int = 0) -> None:
+        """
+        :param handler: Function (or coroutine) taking the url and headers of a request, returning its response
+        :param seed: Seed of the random generator used to split streamed bodies
+        """
+
+        self.handler: _handler = handler
+        self.requests: List[str] = []
+
+        self._random: random.Random = random.Random(seed)
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> OSMResponse:
+        self.requests.append(url)
+
+        response = self.handler(url, {} if headers is None else headers)
+
+        if asyncio.iscoroutine(response):
+            response = await response
+
+        return response
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers: Optional[Dict[str, str]] = None) -> AsyncIterator[OSMStreamResponse]:
+        response = await self.get(url, headers)
+
+        yield OSMStreamResponse(
+            response.url,
+            response.status,
+            response.headers,
+            iter_list(split_randomly(response.body, self._random))
+        )
+
+
+def build_py_osm(handler: _handler, **kwargs) -> PyOSM:
+    """
+    Build a PyOSM using a FakeTransport, with capabilities already loaded
+    :param handler: Passed to FakeTransport
+    :param kwargs: Parameters passed to PyOSM
+    :return: The PyOSM instance, whose transport is the FakeTransport
+    """
+
+    py_osm = PyOSM(transport=FakeTransport(handler), **kwargs)
+    py_osm.capabilities.update_from_api(CAPABILITIES)
+
+    return py_osm
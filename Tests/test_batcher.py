@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import asyncio
+import unittest
+from typing import Dict, List, Tuple
+
+from .FakeTransport import build_py_osm
+from .test_users import FakeUsers
+from ..Network import OSMBatcher
+
+
+class FetchBatch:
+    """
+    Bulk lookup returning the double of even keys, keeping every batch it was called with
+    """
+
+    def __init__(self) -> None:
+        self.batches: List[Tuple[int, ...]] = []
+        self.error: Exception | None = None
+        self.failed: bool = False
+        self.release: asyncio.Event = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, keys: Tuple[int, ...]) -> Dict[int, int | None] | None:
+        self.batches.append(keys)
+        await self.release.wait()
+
+        if self.error is not None:
+            raise self.error
+
+        if self.failed:
+            return None
+
+        return {i: i * 2 for i in keys if i % 2 == 0}
+
+
+class TestBatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_lookups_within_delay_are_merged(self) -> None:
+        fetch = FetchBatch()
+        batcher = OSMBatcher(fetch, delay=0.01)
+
+        results = await asyncio.gather(*[batcher.load(i) for i in (2, 4, 3, 2)])
+
+        self.assertEqual(results, [4, 8, None, 4])
+        self.assertEqual(fetch.batches, [(2, 4, 3)])
+        self.assertEqual(len(batcher), 0)
+
+    async def test_later_lookups_get_another_batch(self) -> None:
+        fetch = FetchBatch()
+        batcher = OSMBatcher(fetch, delay=0.01)
+
+        self.assertEqual(await batcher.load(2), 4)
+        self.assertEqual(await batcher.load(4), 8)
+        self.assertEqual(fetch.batches, [(2,), (4,)])
+
+    async def test_full_batches_are_dispatched_at_once(self) -> None:
+        fetch = FetchBatch()
+        batcher = OSMBatcher(fetch, delay=60, max_batch_size=3)
+
+        results = await asyncio.wait_for(asyncio.gather(*[batcher.load(i) for i in range(6)]), 1)
+
+        self.assertEqual(results, [0, None, 4, None, 8, None])
+        self.assertEqual(fetch.batches, [(0, 1, 2), (3, 4, 5)])
+
+    async def test_dispatch(self) -> None:
+        fetch = FetchBatch()
+        batcher = OSMBatcher(fetch, delay=60)
+
+        task = asyncio.ensure_future(batcher.load(2))
+        await asyncio.sleep(0)
+
+        self.assertEqual(len(batcher), 1)
+
+        batcher.dispatch()
+
+        self.assertEqual(await asyncio.wait_for(task, 1), 4)
+
+    async def test_exceptions_are_given_to_every_caller(self) -> None:
+        fetch = FetchBatch()
+        fetch.error = ValueError("failed")
+        batcher = OSMBatcher(fetch, delay=0)
+
+        results = await asyncio.gather(batcher.load(1), batcher.load(2), return_exceptions=True)
+
+        self.assertEqual(results, [fetch.error, fetch.error])
+
+    async def test_failed_batch(self) -> None:
+        fetch = FetchBatch()
+        fetch.failed = True
+        batcher = OSMBatcher(fetch, delay=0)
+
+        self.assertEqual(await asyncio.gather(batcher.load(1), batcher.load(2)), [None, None])
+
+    async def test_cancelling_a_caller_doesnt_cancel_its_batch(self) -> None:
+        fetch = FetchBatch()
+        fetch.release.clear()
+        batcher = OSMBatcher(fetch, delay=0)
+
+        first = asyncio.ensure_future(batcher.load(2))
+        second = asyncio.ensure_future(batcher.load(4))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        fetch.release.set()
+
+        self.assertEqual(await second, 8)
+        self.assertTrue(first.cancelled())
+
+    def test_invalid_parameters(self) -> None:
+        with self.assertRaises(ValueError):
+            OSMBatcher(FetchBatch(), delay=-1)
+
+        with self.assertRaises(ValueError):
+            OSMBatcher(FetchBatch(), max_batch_size=0)
+
+
+class TestBatchedRequests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_user_requests(self) -> None:
+        api = FakeUsers()
+        py_osm = build_py_osm(api, batch_delay=0.01)
+
+        users = await asyncio.gather(*[py_osm.fetch_user_info(i) for i in range(1, 9)])
+
+        self.assertEqual([None if i is None else i.uid for i in users], [None, 2, None, 4, None, 6, None, 8])
+        self.assertEqual(api.chunks, [list(range(1, 9))])
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from typing import Dict, List
+
+from .FakeTransport import FakeTransport
+from ..Network import OSMCachedTransport
+from ..Network import OSMResponse
+from ..Network import OSMResponseCache
+
+URL = "https://api.openstreetmap.org/api/0.6/user/1.json?b=2&a=1"
+
+
+class Server:
+    """
+    Answer requests with a body and an ETag, or 304 if the client already has the current version
+    """
+
+    def __init__(self) -> None:
+        self.version: int = 1
+        self.headers: List[Dict[str, str]] = []
+
+    def __call__(self, url: str, headers: Dict[str, str]) -> OSMResponse:
+        self.headers.append(headers)
+        etag = f'"{self.version}"'
+
+        if headers.get("If-None-Match") == etag:
+            return OSMResponse(url, 304, {"ETag": etag}, b"")
+
+        return OSMResponse(url, 200, {"ETag": etag}, f"version {self.version}".encode())
+
+
+class TestCachedTransport(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.path = os.path.join(directory.name, "cache.sqlite")
+        self.cache = OSMResponseCache(self.path, busy_timeout=0.1)
+        self.addCleanup(self.cache.close)
+
+        self.server = Server()
+
+    async def test_revalidation(self) -> None:
+        transport = OSMCachedTransport(FakeTransport(self.server), self.cache)
+
+        first = await transport.get(URL)
+        second = await transport.get(URL)
+
+        self.assertEqual(first.body, b"version 1")
+        self.assertEqual(second.status, 200)
+        self.assertEqual(second.body, b"version 1")
+        self.assertNotIn("If-None-Match", self.server.headers[0])
+        self.assertEqual(self.server.headers[1]["If-None-Match"], '"1"')
+
+        self.server.version = 2
+        third = await transport.get(URL)
+
+        self.assertEqual(third.body, b"version 2")
+        self.assertEqual((await self.cache.get(URL))[0].body, b"version 2")
+
+    async def test_max_age(self) -> None:
+        transport = OSMCachedTransport(FakeTransport(self.server), self.cache, max_age=60)
+
+        await transport.get(URL)
+        self.server.version = 2
+        response = await transport.get(URL)
+
+        self.assertEqual(response.body, b"version 1")
+        self.assertEqual(len(self.server.headers), 1)
+
+    async def test_query_order_is_ignored(self) -> None:
+        transport = OSMCachedTransport(FakeTransport(self.server), self.cache, max_age=60)
+
+        await transport.get(URL)
+        await transport.get("https://api.openstreetmap.org/api/0.6/user/1.json?a=1&b=2")
+
+        self.assertEqual(len(self.server.headers), 1)
+
+    async def test_errors_arent_stored(self) -> None:
+        transport = OSMCachedTransport(FakeTransport(lambda url, headers: OSMResponse(url, 404, {}, b"")), self.cache)
+
+        await transport.get(URL)
+
+        self.assertIsNone(await self.cache.get(URL))
+
+    async def test_locked_database_is_a_miss(self) -> None:
+        other = sqlite3.connect(self.path, isolation_level=None)
+        self.addCleanup(other.close)
+        other.execute("BEGIN EXCLUSIVE")
+
+        transport = OSMCachedTransport(FakeTransport(self.server), self.cache)
+
+        with redirect_stderr(io.StringIO()) as stderr:
+            response = await transport.get(URL)
+
+        self.assertEqual(response.body, b"version 1")
+        self.assertIn("WARNING", stderr.getvalue())
+
+        other.execute("COMMIT")
+
+        self.assertIsNone(await self.cache.get(URL))
@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import asyncio
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stderr
+from typing import Dict
+
+from .FakeTransport import CAPABILITIES, FakeTransport, json_response
+from ..Capabilities import OSMCapabilities
+from ..Network import OSMResponse
+from ..PyOsm import PyOSM
+
+
+def capabilities_handler(url: str, headers: Dict[str, str]) -> OSMResponse:
+    return json_response(url, CAPABILITIES)
+
+
+class TestCapabilitiesFile(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.directory = directory.name
+        self.path = os.path.join(directory.name, "capabilities.json")
+
+    def write(self, data: object) -> None:
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def test_round_trip(self) -> None:
+        capabilities = OSMCapabilities()
+        capabilities.update_from_api(CAPABILITIES)
+        capabilities.save(self.path)
+
+        loaded = OSMCapabilities()
+
+        self.assertTrue(loaded.load(self.path))
+        self.assertEqual(loaded.to_dict(), capabilities.to_dict())
+        self.assertEqual(loaded.fetched_at, capabilities.fetched_at)
+
+        # No temporary file is left next to it
+        self.assertEqual(os.listdir(self.directory), ["capabilities.json"])
+
+    def test_invalid_files_are_rejected(self) -> None:
+        capabilities = OSMCapabilities()
+        capabilities.update_from_api(CAPABILITIES)
+        values = capabilities.to_dict()
+
+        del values["notes"]["area"]
+
+        invalid = [
+            {"capabilities": capabilities.to_dict()},
+            {"fetched_at": "yesterday", "capabilities": capabilities.to_dict()},
+            {"fetched_at": True, "capabilities": capabilities.to_dict()},
+            {"fetched_at": time.time(), "capabilities": values},
+            []
+        ]
+
+        for data in invalid:
+            with self.subTest(data=data):
+                self.write(data)
+                loaded = OSMCapabilities()
+
+                self.assertFalse(loaded.load(self.path))
+                self.assertFalse(loaded.is_loaded())
+                self.assertEqual(loaded.notes.maximum_query_limit, 0)
+
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('{"fetched_at": 1')
+
+        self.assertFalse(OSMCapabilities().load(self.path))
+        self.assertFalse(OSMCapabilities().load(os.path.join(self.directory, "missing.json")))
+
+
+class TestLazyCapabilities(unittest.IsolatedAsyncioTestCase):
+    async def test_fetched_once_on_first_use(self) -> None:
+        py_osm = PyOSM(transport=FakeTransport(capabilities_handler))
+
+        await asyncio.gather(*[py_osm.ensure_capabilities() for _ in range(5)])
+
+        self.assertTrue(py_osm.capabilities.is_loaded())
+        self.assertEqual(len(py_osm.transport.requests), 1)
+
+    async def test_stale_capabilities_are_refreshed_in_background(self) -> None:
+        py_osm = PyOSM(transport=FakeTransport(capabilities_handler), capabilities_ttl=60)
+        py_osm.capabilities.update_from_api(CAPABILITIES)
+        py_osm.capabilities.fetched_at -= 120
+
+        await py_osm.ensure_capabilities()
+
+        # The stale values are used while the refresh runs
+        self.assertEqual(py_osm.transport.requests, [])
+
+        await py_osm._capabilities_task
+
+        self.assertFalse(py_osm.capabilities.is_stale(60))
+        self.assertEqual(len(py_osm.transport.requests), 1)
+
+    async def test_failed_refresh_is_reported(self) -> None:
+        def handler(url: str, headers: Dict[str, str]) -> OSMResponse:
+            raise ConnectionError("unreachable")
+
+        py_osm = PyOSM(transport=FakeTransport(handler), capabilities_ttl=60)
+        py_osm.capabilities.update_from_api(CAPABILITIES)
+        py_osm.capabilities.fetched_at -= 120
+
+        with redirect_stderr(io.StringIO()) as stderr:
+            await py_osm.ensure_capabilities()
+            await asyncio.wait([py_osm._capabilities_task])
+            await asyncio.sleep(0)
+
+        self.assertIn("Couldn't refresh OSM API rates", stderr.getvalue())
+
+    async def test_close_cancels_refresh(self) -> None:
+        async def handler(url: str, headers: Dict[str, str]) -> OSMResponse:
+            await asyncio.sleep(60)
+            return capabilities_handler(url, headers)
+
+        py_osm = PyOSM(transport=FakeTransport(handler), capabilities_ttl=60)
+        py_osm.capabilities.update_from_api(CAPABILITIES)
+        py_osm.capabilities.fetched_at -= 120
+
+        await py_osm.ensure_capabilities()
+        await asyncio.sleep(0)
+        await py_osm.close()
+
+        self.assertTrue(py_osm._capabilities_task.cancelled())
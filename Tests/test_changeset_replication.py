@@ -0,0 +1,235 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import gzip
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+from xml.sax.saxutils import quoteattr
+
+from .FakeTransport import FakeTransport, iter_list, split_randomly
+from ..Feeds import OSMChangesetReplication
+from ..Network import OSMResponse
+from ..Network.ChangesetStream import iter_changesets_xml
+
+BASE_URL = "https://planet.example/replication/changesets"
+
+# Tag values containing escaped and multi-byte characters, to be cut anywhere
+VALUES = ["a", "<b>", "&", '"quoted"', "é", "日本", "😀"]
+
+
+def random_file(rng: random.Random, first_id: int) -> Tuple[bytes, List[Tuple[int, int, Dict[str, str], List[str]]]]:
+    """
+    :param rng: Random generator
+    :param first_id: ID of the first changeset of the file
+    :return: A random replication file, and (id, changes count, tags, comments) of its changesets
+    """
+
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n<osm version="0.6" generator="replicate_changesets">']
+    expected = []
+
+    for changeset_id in range(first_id, first_id + rng.randint(0, 8)):
+        changes_count = rng.randint(0, 1000)
+        tags = {f"k{i}": rng.choice(VALUES) for i in range(rng.randint(0, 3))}
+        comments = [rng.choice(VALUES) for _ in range(rng.randint(0, 2))]
+
+        parts.append(
+            f'\n <changeset id="{changeset_id}" created_at="2025-01-29T10:08:40Z" open="true" user="user" uid="3" '
+            f'min_lat="1.5" min_lon="2.5" max_lat="1.6" max_lon="2.6" comments_count="{len(comments)}" '
+            f'num_changes="{changes_count}">'
+        )
+        parts.extend([f"\n  <tag k={quoteattr(k)} v={quoteattr(v)}/>" for k, v in tags.items()])
+
+        if comments:
+            parts.append("\n  <discussion>")
+            parts.extend([
+                f'\n   <comment uid="4" user="other" date="2025-01-29T11:00:00Z"><text>{quoteattr(i)[1:-1]}</text>'
+                f'</comment>'
+                for i in comments
+            ])
+            parts.append("\n  </discussion>")
+
+        parts.append("\n </changeset>")
+        expected.append((changeset_id, changes_count, tags, comments))
+
+    parts.append("\n</osm>\n")
+
+    return "".join(parts).encode(), expected
+
+
+async def parse(chunks: List[bytes]) -> List[Tuple[int, int, Dict[str, str], List[str]]]:
+    return [
+        (i.id, i.changes_count, dict(i.tags.custom_tags), [j.text for j in i.comments])
+        async for i in iter_changesets_xml(iter_list(chunks))
+    ]
+
+
+class TestChangesetStream(unittest.IsolatedAsyncioTestCase):
+    async def test_chunk_boundaries(self) -> None:
+        rng = random.Random(22)
+
+        for i in range(100):
+            body, expected = random_file(rng, 1)
+
+            if i % 2:
+                body = gzip.compress(body)
+
+            # 1 byte chunks split the gzip magic number
+            chunks = split_randomly(body, rng, rng.choice([1, 7, 64, 4096]))
+
+            with self.subTest(file=i, gzipped=bool(i % 2)):
+                self.assertEqual(await parse(chunks), expected)
+
+    async def test_attributes(self) -> None:
+        body, _ = random_file(random.Random(1), 5)
+        changesets = [i async for i in iter_changesets_xml(iter_list([body]))]
+
+        self.assertGreater(len(changesets), 0)
+        self.assertTrue(changesets[0].is_open)
+        self.assertEqual(changesets[0].uid, 3)
+        self.assertEqual(changesets[0].created_at.year, 2025)
+        self.assertEqual(changesets[0].bounding_box.bottom, 1.5)
+
+    async def test_tiny_body(self) -> None:
+        self.assertEqual(await parse([b"<", b"osm/>"]), [])
+
+
+class FakeReplication:
+    """
+    Answer requests of a replication feed whose latest file is latest. Files listed in failing are answered with a 500
+    error, files listed in truncated are cut
+    """
+
+    def __init__(self, latest: int) -> None:
+        self.latest: int = latest
+        self.failing: List[int] = []
+        self.truncated: List[int] = []
+        self.files: Dict[int, List[int]] = {}
+        self.bodies: Dict[int, bytes] = {}
+
+        rng = random.Random(latest)
+
+        for sequence in range(1, latest + 1):
+            body, expected = random_file(rng, sequence * 100)
+
+            # Replication files never end without changesets, so consumed files can be told apart
+            if not expected:
+                body, expected = random_file(random.Random(sequence), sequence * 100)
+
+            self.files[sequence] = [i[0] for i in expected]
+            self.bodies[sequence] = gzip.compress(body)
+
+    def __call__(self, url: str, headers: Dict[str, str]) -> OSMResponse:
+        if url == f"{BASE_URL}/state.yaml":
+            body = f"---\nlast_run: 2025-01-29 10:08:40.123456789 +00:00\nsequence: {self.latest}\n"
+            return OSMResponse(url, 200, {}, body.encode())
+
+        digits = url[len(BASE_URL) + 1:-len(".osm.gz")].replace("/", "")
+        sequence = int(digits)
+
+        if sequence in self.failing or sequence not in self.files.keys():
+            return OSMResponse(url, 500, {}, b"Internal error")
+
+        body = self.bodies[sequence]
+
+        if sequence in self.truncated:
+            body = body[:len(body) // 2]
+
+        return OSMResponse(url, 200, {}, body)
+
+
+class TestChangesetReplication(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.path = os.path.join(directory.name, "state.json")
+        self.api = FakeReplication(20)
+
+    def build(self, sequence: int | None, max_concurrency: int = 4) -> OSMChangesetReplication:
+        return OSMChangesetReplication(FakeTransport(self.api), BASE_URL, sequence, self.path, max_concurrency)
+
+    def saved_sequence(self) -> int | None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)["sequence"]
+
+    def test_get_url(self) -> None:
+        replication = OSMChangesetReplication(FakeTransport(self.api), BASE_URL)
+
+        self.assertEqual(replication.get_url(5821234), f"{BASE_URL}/005/821/234.osm.gz")
+        self.assertEqual(replication.get_url(7), f"{BASE_URL}/000/000/007.osm.gz")
+
+    async def test_fetch_state(self) -> None:
+        state = await self.build(None).fetch_state()
+
+        self.assertEqual(state, (20, datetime(2025, 1, 29, 10, 8, 40, 123456, timezone.utc)))
+
+    async def test_files_are_consumed_in_order(self) -> None:
+        replication = self.build(12)
+
+        changesets = [i.id async for i in replication.iter_changesets()]
+
+        self.assertEqual(changesets, [i for sequence in range(13, 21) for i in self.api.files[sequence]])
+        self.assertEqual(replication.sequence, 20)
+        self.assertEqual(self.saved_sequence(), 20)
+
+        # Nothing new
+        self.assertEqual([i async for i in replication.iter_changesets()], [])
+
+    async def test_sequence_is_saved_after_each_file(self) -> None:
+        replication = self.build(12, max_concurrency=3)
+        replication.save(self.path)
+        saved = []
+
+        async for changeset in replication.iter_changesets():
+            saved.append((changeset.id // 100, self.saved_sequence()))
+
+        # Changesets of a file are yielded before it is marked as consumed
+        self.assertEqual(saved, [(i[0], i[0] - 1) for i in saved])
+
+    async def test_failed_file_stops_iteration(self) -> None:
+        for name, sequences in (("failing", self.api.failing), ("truncated", self.api.truncated)):
+            with self.subTest(name):
+                sequences.append(15)
+                replication = self.build(12)
+
+                with redirect_stderr(io.StringIO()) as stderr:
+                    changesets = [i.id async for i in replication.iter_changesets()]
+
+                self.assertEqual(changesets, self.api.files[13] + self.api.files[14])
+                self.assertEqual(self.saved_sequence(), 14)
+                self.assertIn("file 15", stderr.getvalue())
+
+                # The failed file is fetched again next time
+                sequences.clear()
+                changesets = [i.id async for i in self.build(None).iter_changesets()]
+
+                self.assertEqual(changesets, [i for sequence in range(15, 21) for i in self.api.files[sequence]])
+
+    async def test_first_iteration_starts_from_now(self) -> None:
+        replication = self.build(None)
+
+        self.assertEqual([i async for i in replication.iter_changesets()], [])
+        self.assertEqual(self.saved_sequence(), 20)
+
+    def test_load_rejects_invalid_files(self) -> None:
+        for content in ('{"sequence": "5"}', '{"sequence": true}', '{"other": 5}', "[5]", '{"sequence": 5'):
+            with self.subTest(content=content):
+                with open(self.path, "w", encoding="utf-8") as f:
+                    f.write(content)
+
+                replication = OSMChangesetReplication(FakeTransport(self.api), BASE_URL, state_path=self.path)
+
+                self.assertIsNone(replication.sequence)
+                self.assertFalse(replication.load(self.path))
+
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('{"sequence": 5}')
+
+        self.assertEqual(OSMChangesetReplication(FakeTransport(self.api), BASE_URL, state_path=self.path).sequence, 5)
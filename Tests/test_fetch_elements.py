@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import io
+import unittest
+from contextlib import redirect_stderr
+from typing import Dict, List
+
+from .FakeTransport import build_py_osm, json_response, query
+from ..Network import OSMResponse
+
+
+class FakeElements:
+    """
+    Answer /nodes.json like the API: every node with an even ID exists, in versions 1 to 3
+    The whole request fails with a 404 error if any requested node or version doesn't exist
+    """
+
+    def __init__(self) -> None:
+        self.chunks: List[List[str]] = []
+
+    def __call__(self, url: str, headers: Dict[str, str]) -> OSMResponse:
+        references = query(url)["nodes"].split(",")
+        self.chunks.append(references)
+
+        if len(references) > 1 and len(set(references)) != len(references):
+            return OSMResponse(url, 400, {}, b"Duplicate IDs")
+
+        elements = []
+
+        for reference in references:
+            node_id, _, version = reference.partition("v")
+            version = int(version) if version else 3
+
+            if int(node_id) % 2 or not 1 <= version <= 3:
+                return OSMResponse(url, 404, {}, b"Not found")
+
+            elements.append({"type": "node", "id": int(node_id), "version": version, "lat": 1.0, "lon": 2.0})
+
+        return json_response(url, {"version": "0.6", "elements": elements})
+
+
+class TestFetchElements(unittest.IsolatedAsyncioTestCase):
+    async def test_existing_elements(self) -> None:
+        api = FakeElements()
+        py_osm = build_py_osm(api)
+
+        result = await py_osm.fetch_nodes([2, 4, (6, 1)], chunk_size=10)
+
+        self.assertEqual(list(result.keys()), [("node", 2, None), ("node", 4, None), ("node", 6, 1)])
+        self.assertEqual([i.version for i in result.values()], [3, 3, 1])
+        self.assertEqual(len(api.chunks), 1)
+
+    async def test_missing_elements_are_found_by_splitting(self) -> None:
+        api = FakeElements()
+        py_osm = build_py_osm(api)
+
+        ids = list(range(2, 258, 2))
+        result = await py_osm.fetch_nodes(ids[:10] + [7] + ids[10:] + [(8, 9)], chunk_size=200, max_concurrency=1)
+
+        self.assertIsNone(result[("node", 7, None)])
+        self.assertIsNone(result[("node", 8, 9)])
+
+        for i in ids:
+            self.assertEqual(result[("node", i, None)].id, i)
+
+        # Only chunks containing a missing node are split, so far fewer requests than nodes are needed
+        self.assertLess(len(api.chunks), len(ids) // 2)
+        self.assertEqual(len(api.chunks[0]), len(ids) + 2)
+
+    async def test_latest_and_versioned_in_same_request(self) -> None:
+        api = FakeElements()
+        py_osm = build_py_osm(api)
+
+        result = await py_osm.fetch_nodes([(2, 1), 2, (2, 2)], chunk_size=10)
+
+        self.assertEqual(result[("node", 2, 1)].version, 1)
+        self.assertEqual(result[("node", 2, 2)].version, 2)
+        self.assertEqual(result[("node", 2, None)].version, 3)
+
+    async def test_chunks(self) -> None:
+        api = FakeElements()
+        py_osm = build_py_osm(api)
+
+        ids = list(range(2, 202, 2))
+        result = await py_osm.fetch_nodes(ids, chunk_size=30)
+
+        self.assertEqual(len(result), 100)
+        self.assertTrue(all([i is not None for i in result.values()]))
+        self.assertEqual(sorted([len(i) for i in api.chunks]), [10, 30, 30, 30])
+
+    async def test_failed_chunks(self) -> None:
+        def handler(url: str, headers: Dict[str, str]) -> OSMResponse:
+            return OSMResponse(url, 500, {}, b"Internal error")
+
+        py_osm = build_py_osm(handler)
+
+        with redirect_stderr(io.StringIO()) as stderr:
+            result = await py_osm.fetch_ways([1, 2, 3])
+
+        self.assertEqual(result, {("way", 1, None): None, ("way", 2, None): None, ("way", 3, None): None})
+        self.assertIn("Couldn't fetch OSM ways", stderr.getvalue())
+        self.assertEqual(len(py_osm.transport.requests), 1)
+
+    async def test_invalid_parameters(self) -> None:
+        py_osm = build_py_osm(FakeElements())
+
+        with self.assertRaises(ValueError):
+            await py_osm.fetch_nodes([2], chunk_size=0)
+
+        with self.assertRaises(ValueError):
+            await py_osm.fetch_nodes([2], max_concurrency=0)
+
+        self.assertEqual(await py_osm.fetch_nodes([]), {})
@@ -0,0 +1,204 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import io
+import random
+import unittest
+from contextlib import redirect_stderr
+from typing import Callable, Dict, List, Tuple
+
+from .FakeTransport import build_py_osm, json_response, query
+from ..Errors import OSMIncompleteResultError
+from ..Frames import Columns
+from ..Frames import OSMMapData
+from ..Frames import OSMMapDataBuilder
+from ..Network import OSMResponse
+from ..Objects import OSMBoundingBox
+
+
+class FakeMap:
+    """
+    Answer /map.json like the API: nodes in the bounding box, ways using them with all their nodes, and relations
+    having them as members. Bounding boxes containing more than max_nodes nodes are refused with a 400 error
+    Requests of bounding boxes matching failing are answered with a 500 error, those matching truncated are cut
+    """
+
+    def __init__(
+            self,
+            seed: int,
+            max_nodes: int = 40,
+            failing: Callable[[Tuple[float, ...]], bool] = lambda bbox: False,
+            truncated: Callable[[Tuple[float, ...]], bool] = lambda bbox: False
+    ) -> None:
+        rng = random.Random(seed)
+
+        self.nodes: Dict[int, Dict[str, object]] = {
+            i: {"type": "node", "id": i, "lat": rng.uniform(0, 1), "lon": rng.uniform(0, 1), "tags": {}}
+            for i in range(1, 201)
+        }
+
+        for i in rng.sample(sorted(self.nodes.keys()), 20):
+            self.nodes[i]["tags"] = {"amenity": rng.choice(["bench", "cafe"])}
+
+        self.ways: Dict[int, Dict[str, object]] = {
+            i: {"type": "way", "id": i, "nodes": rng.sample(sorted(self.nodes.keys()), 3), "tags": {"highway": "path"}}
+            for i in range(1, 31)
+        }
+
+        self.relations: Dict[int, Dict[str, object]] = {
+            i: {
+                "type": "relation", "id": i, "tags": {"type": "route"},
+                "members": [{"type": "node", "ref": rng.choice(sorted(self.nodes.keys())), "role": "stop"}]
+            }
+            for i in range(1, 6)
+        }
+
+        self.max_nodes = max_nodes
+        self.failing = failing
+        self.truncated = truncated
+        self.bboxes: List[Tuple[float, ...]] = []
+
+    def __call__(self, url: str, headers: Dict[str, str]) -> OSMResponse:
+        bbox = tuple([float(i) for i in query(url)["bbox"].split(",")])
+        left, bottom, right, top = bbox
+
+        inside = {
+            key for key, value in self.nodes.items() if left <= value["lon"] <= right and bottom <= value["lat"] <= top
+        }
+
+        if len(inside) > self.max_nodes:
+            return OSMResponse(url, 400, {}, b"You requested too many nodes")
+
+        if self.failing(bbox):
+            return OSMResponse(url, 500, {}, b"Internal error")
+
+        self.bboxes.append(bbox)
+
+        ways = [i for i in self.ways.values() if inside.intersection(i["nodes"])]
+        relations = [i for i in self.relations.values() if i["members"][0]["ref"] in inside]
+
+        node_ids = inside.union(*[i["nodes"] for i in ways])
+        elements = [self.nodes[i] for i in sorted(node_ids)] + ways + relations
+
+        response = json_response(url, {"version": "0.6", "elements": elements})
+
+        if self.truncated(bbox):
+            return OSMResponse(url, 200, {}, response.body[:len(response.body) // 2])
+
+        return response
+
+    def check(self, test: unittest.TestCase, map_data: OSMMapData) -> None:
+        """
+        Check map data contains every element exactly once, with its values
+        """
+
+        node_ids = Columns.to_tuple(map_data.nodes.column("id"))
+
+        test.assertEqual(sorted(node_ids), sorted(self.nodes.keys()))
+        test.assertEqual(sorted(Columns.to_tuple(map_data.ways.column("id"))), sorted(self.ways.keys()))
+        test.assertEqual(sorted(Columns.to_tuple(map_data.relations.column("id"))), sorted(self.relations.keys()))
+
+        for node_id, node in self.nodes.items():
+            index = map_data.nodes.index_of(node_id)
+
+            test.assertEqual(map_data.nodes.get_tags(index), node["tags"])
+            test.assertAlmostEqual(float(map_data.nodes.column("lat")[index]), node["lat"], places=5)
+
+        for way_id, way in self.ways.items():
+            index = map_data.ways.index_of(way_id)
+
+            test.assertEqual(map_data.ways.get_nodes(index), tuple(way["nodes"]))
+            test.assertNotIn(None, map_data.get_way_coordinates(index))
+
+        for relation_id, relation in self.relations.items():
+            test.assertEqual(
+                map_data.relations.get_members(map_data.relations.index_of(relation_id)),
+                (("node", relation["members"][0]["ref"], "stop"),)
+            )
+
+
+class TestFetchMap(unittest.IsolatedAsyncioTestCase):
+    async def test_tiles_are_merged_without_duplicates(self) -> None:
+        api = FakeMap(1, max_nodes=1000)
+        py_osm = build_py_osm(api)
+
+        map_data = await py_osm.fetch_map(OSMBoundingBox(0, 0, 1, 1))
+
+        api.check(self, map_data)
+
+        # Split under capabilities area
+        self.assertEqual(len(api.bboxes), 4)
+
+    async def test_refused_tiles_are_subdivided(self) -> None:
+        api = FakeMap(2)
+        py_osm = build_py_osm(api)
+
+        map_data = await py_osm.fetch_map(OSMBoundingBox(0, 0, 1, 1), max_depth=6)
+
+        api.check(self, map_data)
+        self.assertGreater(len(api.bboxes), 4)
+
+    async def test_too_deep_tiles_are_reported(self) -> None:
+        py_osm = build_py_osm(FakeMap(3, max_nodes=2))
+
+        with redirect_stderr(io.StringIO()), self.assertRaises(OSMIncompleteResultError) as context:
+            await py_osm.fetch_map(OSMBoundingBox(0, 0, 1, 1), max_depth=1)
+
+        self.assertGreater(len(context.exception.failed), 0)
+        self.assertIsInstance(context.exception.result, OSMMapData)
+
+    async def test_failed_tiles_are_reported(self) -> None:
+        api = FakeMap(4, max_nodes=1000, failing=lambda bbox: bbox[0] >= 0.5 and bbox[1] >= 0.5)
+        py_osm = build_py_osm(api)
+
+        with redirect_stderr(io.StringIO()), self.assertRaises(OSMIncompleteResultError) as context:
+            await py_osm.fetch_map(OSMBoundingBox(0, 0, 1, 1))
+
+        self.assertEqual([str(i) for i in context.exception.failed], ["0.5,0.5,1.0,1.0"])
+
+        # Elements of other tiles are kept
+        result = context.exception.result
+        self.assertGreater(len(result.nodes), 0)
+        self.assertLess(len(result.nodes), len(api.nodes))
+
+    async def test_truncated_tiles_are_reported(self) -> None:
+        api = FakeMap(5, max_nodes=1000, truncated=lambda bbox: bbox[0] == 0 and bbox[1] == 0)
+        py_osm = build_py_osm(api)
+
+        with redirect_stderr(io.StringIO()), self.assertRaises(OSMIncompleteResultError) as context:
+            await py_osm.fetch_map(OSMBoundingBox(0, 0, 1, 1))
+
+        self.assertEqual([str(i) for i in context.exception.failed], ["0.0,0.0,0.5,0.5"])
+
+    async def test_invalid_bbox(self) -> None:
+        py_osm = build_py_osm(FakeMap(6))
+
+        with self.assertRaises(ValueError):
+            await py_osm.fetch_map(OSMBoundingBox(0, 0, 1, 100))
+
+
+class TestMapDataBuilder(unittest.TestCase):
+    def test_incomplete_element_isnt_added(self) -> None:
+        builder = OSMMapDataBuilder()
+
+        self.assertTrue(builder.add({"type": "node", "id": 1, "lat": 1.0, "lon": 2.0, "tags": {"a": "b"}}))
+        self.assertFalse(builder.add({"type": "node", "id": 1, "lat": 1.0, "lon": 2.0}))
+
+        # The last member misses its role
+        with self.assertRaises(KeyError):
+            builder.add({
+                "type": "relation", "id": 1, "tags": {"c": "d"},
+                "members": [{"type": "node", "ref": 1, "role": ""}, {"type": "node", "ref": 2}]
+            })
+
+        self.assertTrue(builder.add({
+            "type": "relation", "id": 1, "tags": {"e": "f"}, "members": [{"type": "node", "ref": 1, "role": "x"}]
+        }))
+
+        map_data = builder.build()
+
+        self.assertEqual(len(map_data.nodes), 1)
+        self.assertEqual(len(map_data.relations), 1)
+        self.assertEqual(map_data.nodes.get_tags(0), {"a": "b"})
+        self.assertEqual(map_data.relations.get_tags(0), {"e": "f"})
+        self.assertEqual(map_data.relations.get_members(0), (("node", 1, "x"),))
@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from .FakeTransport import build_py_osm, json_response, query
+from ..Network import OSMResponse
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def changeset(changeset_id: int, created_at: datetime) -> Dict[str, object]:
+    return {
+        "type": "changeset", "id": changeset_id, "created_at": created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "open": False, "comments_count": 0, "changes_count": 1, "closed_at": created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "uid": 1, "user": "user"
+    }
+
+
+class FakeChangesetSearch:
+    """
+    Answer /changesets.json like the API: changesets created in [from, to), newest first, at most limit of them
+    """
+
+    def __init__(self, changesets: List[Dict[str, object]]) -> None:
+        self.changesets = changesets
+
+    def __call__(self, url: str, headers: Dict[str, str]) -> OSMResponse:
+        parameters = query(url)
+
+        after = datetime.fromisoformat(parameters["from"])
+        before = datetime.fromisoformat(parameters["to"]) if "to" in parameters.keys() else None
+
+        matching = [
+            i for i in self.changesets
+            if after <= datetime.fromisoformat(i["created_at"]) and (before is None or
+                                                                    datetime.fromisoformat(i["created_at"]) < before)
+        ]
+        matching.sort(key=lambda i: (i["created_at"], i["id"]), reverse=True)
+
+        return json_response(url, {"changesets": matching[:int(parameters["limit"])]})
+
+
+class TestIterChangesets(unittest.IsolatedAsyncioTestCase):
+    async def collect(self, changesets: List[Dict[str, object]], **kwargs) -> List[int]:
+        py_osm = build_py_osm(FakeChangesetSearch(changesets))
+        self.requests = py_osm.transport.requests
+
+        return [i.id async for i in py_osm.iter_changesets(**kwargs)]
+
+    async def test_pages_return_every_changeset_once_newest_first(self) -> None:
+        changesets = [changeset(i, START + timedelta(seconds=i)) for i in range(250)]
+
+        self.assertEqual(await self.collect(changesets, page_size=100), list(reversed(range(250))))
+        self.assertEqual(len(self.requests), 3)
+
+    async def test_changesets_sharing_a_second_at_page_boundaries(self) -> None:
+        # 7 changesets per second, so every page ends in the middle of a second
+        changesets = [changeset(i, START + timedelta(seconds=i // 7)) for i in range(200)]
+
+        result = await self.collect(changesets, page_size=20)
+
+        self.assertEqual(len(result), len(set(result)))
+        self.assertEqual(set(result), set(range(200)))
+
+    async def test_max_results(self) -> None:
+        changesets = [changeset(i, START + timedelta(seconds=i)) for i in range(250)]
+
+        self.assertEqual(await self.collect(changesets, page_size=100, max_results=130), list(range(249, 119, -1)))
+
+    async def test_single_page(self) -> None:
+        changesets = [changeset(i, START + timedelta(seconds=i)) for i in range(5)]
+
+        self.assertEqual(await self.collect(changesets, page_size=100), [4, 3, 2, 1, 0])
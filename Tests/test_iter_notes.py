@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from .FakeTransport import build_py_osm, json_response, query
+from ..Enums import OSMOrder
+from ..Enums import OSMSort
+from ..Network import OSMResponse
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def api_date(date: datetime) -> str:
+    return date.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+def note(note_id: int, created_at: datetime, updated_at: datetime) -> Dict[str, object]:
+    comments = [{"date": api_date(created_at), "action": "opened", "text": "", "html": ""}]
+
+    if updated_at != created_at:
+        comments.append({"date": api_date(updated_at), "action": "commented", "text": "", "html": ""})
+
+    return {
+        "type": "Feature", "geometry": {"type": "Point", "coordinates": [0, 0]},
+        "properties": {
+            "id": note_id, "url": "", "date_created": api_date(created_at), "status": "open", "comments": comments
+        }
+    }
+
+
+def note_date(value: Dict[str, object], sort: str) -> datetime:
+    properties = value["properties"]
+    date = properties["date_created"] if sort == "created_at" else properties["comments"][-1]["date"]
+
+    return datetime.strptime(date, "%Y-%m-%d %H:%M:%S UTC").replace(tzinfo=timezone.utc)
+
+
+class FakeNoteSearch:
+    """
+    Answer /notes/search.json like the API: notes whose sort datetime is in [from, to), sorted as requested
+    """
+
+    def __init__(self, notes: List[Dict[str, object]]) -> None:
+        self.notes = notes
+
+    def __call__(self, url: str, headers: Dict[str, str]) -> OSMResponse:
+        parameters = query(url)
+        sort = parameters.get("sort", "updated_at")
+
+        after = datetime.fromisoformat(parameters["from"])
+        before = datetime.fromisoformat(parameters["to"]) if "to" in parameters.keys() else None
+
+        matching = [
+            i for i in self.notes
+            if after <= note_date(i, sort) and (before is None or note_date(i, sort) < before)
+        ]
+        matching.sort(
+            key=lambda i: (note_date(i, sort), i["properties"]["id"]),
+            reverse=parameters.get("order", "newest") == "newest"
+        )
+
+        return json_response(url, {"type": "FeatureCollection", "features": matching[:int(parameters["limit"])]})
+
+
+class TestIterNotes(unittest.IsolatedAsyncioTestCase):
+    async def collect(self, notes: List[Dict[str, object]], **kwargs) -> List[int]:
+        py_osm = build_py_osm(FakeNoteSearch(notes))
+        self.requests = py_osm.transport.requests
+
+        return [i.id async for i in py_osm.iter_notes(closed=-1, **kwargs)]
+
+    async def test_newest_first(self) -> None:
+        notes = [note(i, START + timedelta(seconds=i), START + timedelta(seconds=i)) for i in range(120)]
+
+        self.assertEqual(await self.collect(notes, page_size=50), list(reversed(range(120))))
+        self.assertEqual(len(self.requests), 3)
+
+    async def test_oldest_first(self) -> None:
+        notes = [note(i, START + timedelta(seconds=i), START + timedelta(seconds=i)) for i in range(120)]
+
+        self.assertEqual(await self.collect(notes, page_size=50, order=OSMOrder.OLDEST), list(range(120)))
+
+    async def test_sorted_on_last_update(self) -> None:
+        # Created in one order, updated in the opposite one
+        notes = [note(i, START + timedelta(seconds=i), START + timedelta(days=1, seconds=-i)) for i in range(60)]
+
+        result = await self.collect(notes, page_size=25, sort=OSMSort.UPDATED_AT, order=OSMOrder.OLDEST)
+
+        self.assertEqual(result, list(reversed(range(60))))
+
+    async def test_notes_sharing_a_second_at_page_boundaries(self) -> None:
+        notes = [note(i, START + timedelta(seconds=i // 4), START + timedelta(seconds=i // 4)) for i in range(90)]
+
+        for order in (OSMOrder.NEWEST, OSMOrder.OLDEST):
+            result = await self.collect(notes, page_size=10, order=order)
+
+            self.assertEqual(len(result), len(set(result)))
+            self.assertEqual(set(result), set(range(90)))
+
+    async def test_max_results(self) -> None:
+        notes = [note(i, START + timedelta(seconds=i), START + timedelta(seconds=i)) for i in range(120)]
+
+        self.assertEqual(len(await self.collect(notes, page_size=50, max_results=70)), 70)
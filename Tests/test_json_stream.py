@@ -0,0 +1,165 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import json
+import random
+import unittest
+from typing import Dict, List
+
+from .FakeTransport import build_py_osm, iter_list, split_randomly
+from ..Network import OSMResponse
+from ..Network.JsonStream import iter_json_array
+from ..Objects import OSMBoundingBox
+
+# Strings containing json structure characters, escapes and multi-byte characters, to be cut anywhere
+STRINGS = ['features', ']}', '{"features": [', '\\', '"', 'a,b:c', 'é', '日本', '😀', '\n', '']
+
+
+def random_value(rng: random.Random, depth: int = 0) -> object:
+    """
+    :param rng: Random generator
+    :param depth: Current nesting level
+    :return: A random json value
+    """
+
+    kind = rng.randrange(7 if depth < 3 else 5)
+
+    if kind == 0:
+        return rng.choice([rng.randint(-10 ** 12, 10 ** 12), rng.randint(0, 9)])
+
+    if kind == 1:
+        return rng.uniform(-1000, 1000)
+
+    if kind == 2:
+        return "".join(rng.choices(STRINGS, k=rng.randint(0, 4)))
+
+    if kind == 3:
+        return rng.choice([True, False, None])
+
+    if kind == 4:
+        return rng.randint(0, 10 ** 6)
+
+    if kind == 5:
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+
+    return {rng.choice(STRINGS): random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))}
+
+
+def random_document(rng: random.Random, key: str) -> Dict[str, object]:
+    """
+    :param rng: Random generator
+    :param key: Key of the wanted array
+    :return: A random top level object containing an array under key, and other keys around it which may contain key
+    """
+
+    document: Dict[str, object] = {}
+
+    for _ in range(rng.randint(0, 3)):
+        document[rng.choice(["type", "other", "nested"])] = {key: [1, 2], "list": [key, random_value(rng)]}
+
+    document[key] = [random_value(rng) for _ in range(rng.randint(0, 20))]
+
+    for _ in range(rng.randint(0, 3)):
+        document[rng.choice(["after", "meta", "x"])] = random_value(rng)
+
+    return document
+
+
+def dump(document: object, rng: random.Random) -> bytes:
+    """
+    :param document: A json document
+    :param rng: Random generator
+    :return: The document encoded with random formatting
+    """
+
+    indent = rng.choice([None, 0, 2])
+    separators = rng.choice([(",", ":"), (", ", ": ")])
+
+    return json.dumps(document, ensure_ascii=rng.random() < 0.5, indent=indent, separators=separators).encode()
+
+
+async def collect(chunks: List[bytes], key: str) -> List[object]:
+    return [i async for i in iter_json_array(iter_list(chunks), key)]
+
+
+class TestJsonStream(unittest.IsolatedAsyncioTestCase):
+    async def test_chunk_boundaries(self) -> None:
+        rng = random.Random(18)
+
+        for i in range(300):
+            document = random_document(rng, "features")
+            body = dump(document, rng)
+
+            with self.subTest(document=i):
+                self.assertEqual(
+                    await collect(split_randomly(body, rng, rng.choice([1, 3, 16, 4096])), "features"),
+                    document["features"]
+                )
+
+    async def test_single_chunk(self) -> None:
+        body = b'{"type": "FeatureCollection", "features": [1, 22, -3.5e2, "]", {"features": [4]}]}'
+
+        self.assertEqual(await collect([body], "features"), [1, 22, -350.0, "]", {"features": [4]}])
+
+    async def test_key_as_a_value_is_skipped(self) -> None:
+        body = b'{"type": "features", "x": ["features", {"features": [0]}], "features": [1]}'
+
+        self.assertEqual(await collect(split_randomly(body, random.Random(0), 2), "features"), [1])
+
+    async def test_truncated_document(self) -> None:
+        rng = random.Random(180)
+
+        for i in range(100):
+            document = random_document(rng, "features")
+            body = dump(document, rng)
+
+            chunks = split_randomly(body[:rng.randint(1, len(body) - 1)], rng)
+            elements = []
+
+            with self.subTest(document=i):
+                try:
+                    async for element in iter_json_array(iter_list(chunks), "features"):
+                        elements.append(element)
+
+                except json.JSONDecodeError:
+                    # Every element received before the cut is still yielded, in order
+                    self.assertEqual(elements, document["features"][:len(elements)])
+
+                else:
+                    # Only possible if the cut is after the end of the array
+                    self.assertEqual(elements, document["features"])
+
+    async def test_missing_key(self) -> None:
+        self.assertEqual(await collect([b'{"type": "FeatureCollection"}'], "features"), [])
+
+        with self.assertRaises(json.JSONDecodeError):
+            await collect([b'{"type": "FeatureCollection", "feat'], "features")
+
+
+class TestStreamedNotes(unittest.IsolatedAsyncioTestCase):
+    async def test_truncated_response(self) -> None:
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [1.0, 2.0]},
+                "properties": {
+                    "id": i, "url": "", "comment_url": "", "close_url": "", "date_created": "2025-01-01 00:00:00 UTC",
+                    "status": "open", "comments": []
+                }
+            }
+            for i in range(10)
+        ]
+        body = json.dumps({"type": "FeatureCollection", "features": features}).encode()
+
+        def handler(url: str, headers: Dict[str, str]) -> OSMResponse:
+            return OSMResponse(url, 200, {}, body[:len(body) // 2])
+
+        py_osm = build_py_osm(handler)
+        notes = []
+
+        with self.assertRaises(json.JSONDecodeError):
+            async for note in py_osm.stream_notes_by_bbox(OSMBoundingBox(0, 0, 1, 1)):
+                notes.append(note.id)
+
+        self.assertGreater(len(notes), 0)
+        self.assertEqual(notes, list(range(len(notes))))
@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import sys
+import unittest
+from typing import Dict
+from unittest import mock
+
+from .FakeTransport import build_py_osm, json_response
+from .test_users import user
+from ..Cache import OSMMemoryCache
+from ..Network import OSMResponse
+from ..Objects import OSMChangeset
+from ..Objects import OSMUser
+
+
+def changeset(is_open: bool) -> OSMChangeset:
+    return OSMChangeset({
+        "type": "changeset", "id": 1, "created_at": "2025-01-29T10:08:40Z", "open": is_open, "comments_count": 0,
+        "changes_count": 1, "uid": 1, "user": "user"
+    })
+
+
+class Clock:
+    """
+    Replace time.monotonic in the cache module
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.patch = mock.patch.object(sys.modules[OSMMemoryCache.__module__].time, "monotonic", lambda: self.now)
+
+
+class TestMemoryCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = Clock()
+        self.clock.patch.start()
+        self.addCleanup(self.clock.patch.stop)
+
+    def test_least_recently_used_are_evicted(self) -> None:
+        cache = OSMMemoryCache(max_size=2)
+
+        cache.put("a", OSMUser(user(1)))
+        cache.put("b", OSMUser(user(2)))
+        cache.get("a")
+        cache.put("c", OSMUser(user(3)))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_time_to_live(self) -> None:
+        cache = OSMMemoryCache(user_ttl=10, open_changeset_ttl=5, discussion_ttl=20)
+
+        cache.put("user", OSMUser(user(1)))
+        cache.put("open", changeset(True))
+        cache.put("closed", changeset(False))
+        cache.put("discussion", changeset(False), include_discussion=True)
+
+        self.clock.now += 6
+        self.assertIsNone(cache.get("open"))
+        self.assertIsNotNone(cache.get("user"))
+
+        self.clock.now += 5
+        self.assertIsNone(cache.get("user"))
+        self.assertIsNotNone(cache.get("discussion"))
+
+        self.clock.now += 10
+        self.assertIsNone(cache.get("discussion"))
+
+        # Closed changesets without discussion never change
+        self.clock.now += 10 ** 6
+        self.assertIsNotNone(cache.get("closed"))
+
+    def test_zero_ttl_isnt_stored(self) -> None:
+        cache = OSMMemoryCache(user_ttl=0)
+        cache.put("user", OSMUser(user(1)))
+
+        self.assertEqual(len(cache), 0)
+
+
+class TestCachedRequests(unittest.IsolatedAsyncioTestCase):
+    async def test_user_fetched_once(self) -> None:
+        def handler(url: str, headers: Dict[str, str]) -> OSMResponse:
+            return json_response(url, {"user": user(int(url.split("/")[-1].split(".")[0]))})
+
+        py_osm = build_py_osm(handler, cache=OSMMemoryCache())
+
+        first = await py_osm.fetch_user_info(5)
+        second = await py_osm.fetch_user_info(5)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(py_osm.transport.requests), 1)
+        self.assertEqual((py_osm.cache.hits, py_osm.cache.misses), (1, 1))
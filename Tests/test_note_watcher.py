@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import io
+import unittest
+from contextlib import redirect_stderr
+from datetime import timedelta
+from typing import Dict, List
+
+from .FakeTransport import build_py_osm, query
+from .test_iter_notes import FakeNoteSearch, START, api_date, note
+from ..Feeds import OSMNoteWatcher
+from ..Objects import OSMNoteEventType
+
+
+def close(value: Dict[str, object], seconds: int) -> None:
+    """
+    Close a note built by test_iter_notes.note
+    """
+
+    value["properties"]["status"] = "closed"
+    value["properties"]["comments"].append(
+        {"date": api_date(START + timedelta(seconds=seconds)), "action": "closed", "text": "", "html": ""}
+    )
+
+
+class TestNoteWatcher(unittest.IsolatedAsyncioTestCase):
+    def build(self, notes: List[Dict[str, object]], **kwargs) -> OSMNoteWatcher:
+        self.py_osm = build_py_osm(FakeNoteSearch(notes))
+        self.requests = self.py_osm.transport.requests
+
+        return OSMNoteWatcher(self.py_osm, **kwargs)
+
+    def limits(self) -> List[int]:
+        return [int(query(i)["limit"]) for i in self.requests]
+
+    async def test_first_check_starts_from_now(self) -> None:
+        watcher = self.build([note(1, START, START)])
+        watcher.add_region("all")
+
+        self.assertEqual(await watcher.poll(), ())
+        self.assertEqual(self.requests, [])
+        self.assertIsNotNone(watcher.get_mark("all"))
+
+    async def test_events_are_given_once(self) -> None:
+        notes = [note(i, START + timedelta(seconds=i), START + timedelta(seconds=i + 100)) for i in range(5)]
+        watcher = self.build(notes)
+        watcher.add_region("all", since=START)
+
+        events = await watcher.poll()
+
+        self.assertEqual([(i.type, i.note.id) for i in events[:5]], [(OSMNoteEventType.OPENED, i) for i in range(5)])
+        self.assertEqual([(i.type, i.note.id) for i in events[5:]], [(OSMNoteEventType.COMMENTED, i) for i in range(5)])
+        self.assertEqual(watcher.get_mark("all"), START + timedelta(seconds=104))
+
+        # The last note is returned again, as the API rounds dates to the second
+        self.assertEqual(await watcher.poll(), ())
+
+        close(notes[2], 200)
+        events = await watcher.poll()
+
+        self.assertEqual([(i.type, i.note.id) for i in events], [(OSMNoteEventType.CLOSED, 2)])
+
+    async def test_pages(self) -> None:
+        notes = [note(i, START + timedelta(seconds=i), START + timedelta(seconds=i)) for i in range(35)]
+        watcher = self.build(notes, page_size=10)
+        watcher.add_region("all", since=START)
+
+        events = await watcher.poll()
+
+        self.assertEqual([i.note.id for i in events], list(range(35)))
+        self.assertEqual(set(self.limits()), {10})
+
+    async def test_max_notes(self) -> None:
+        notes = [note(i, START + timedelta(seconds=i), START + timedelta(seconds=i)) for i in range(35)]
+        watcher = self.build(notes, page_size=10, max_notes=20)
+        watcher.add_region("all", since=START)
+
+        first = await watcher.poll()
+        second = await watcher.poll()
+
+        self.assertEqual([i.note.id for i in first], list(range(20)))
+        self.assertEqual([i.note.id for i in second], list(range(20, 35)))
+
+    async def test_saturated_second_increases_page_size(self) -> None:
+        notes = [note(i, START, START) for i in range(30)]
+        watcher = self.build(notes, page_size=10)
+        watcher.add_region("all", since=START)
+
+        events = await watcher.poll()
+
+        self.assertEqual(sorted([i.note.id for i in events]), list(range(30)))
+        self.assertEqual(self.limits(), [10, 20, 40])
+
+    async def test_saturated_second_at_maximum_limit(self) -> None:
+        notes = [note(i, START, START) for i in range(30)]
+        notes.append(note(30, START + timedelta(seconds=1), START + timedelta(seconds=1)))
+
+        watcher = self.build(notes, page_size=10)
+        self.py_osm.capabilities.notes.maximum_query_limit = 20
+        watcher.add_region("all", since=START)
+
+        with redirect_stderr(io.StringIO()) as stderr:
+            events = await watcher.poll()
+
+        self.assertIn("More than 20 notes updated", stderr.getvalue())
+        self.assertEqual(len(events), 20)
+        self.assertEqual(self.limits(), [10, 20])
+
+        # The mark isn't moved past this second, so the note updated after it isn't skipped forever
+        self.assertEqual(watcher.get_mark("all"), START)
+
+    def test_invalid_parameters(self) -> None:
+        py_osm = build_py_osm(FakeNoteSearch([]))
+
+        for kwargs in ({"max_concurrency": 0}, {"max_notes": 0}, {"page_size": 0}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                OSMNoteWatcher(py_osm, **kwargs)
+
+        watcher = OSMNoteWatcher(py_osm)
+        watcher.add_region("all")
+
+        with self.assertRaises(ValueError):
+            watcher.add_region("all")
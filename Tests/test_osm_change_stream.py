@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import random
+import unittest
+from typing import Dict, List, Tuple
+from xml.etree.ElementTree import ParseError
+from xml.sax.saxutils import quoteattr
+
+from .FakeTransport import build_py_osm, iter_list, split_randomly
+from ..Network import OSMResponse
+from ..Network.OsmChangeStream import iter_osm_change
+from ..Objects import OSMChange
+from ..Objects import OSMChangeAction
+
+# Tag values containing escaped and multi-byte characters, to be cut anywhere
+VALUES = ["a", "<b>", "&amp;", '"quoted"', "é", "日本", "😀", "x y"]
+
+def random_element(rng: random.Random, element_type: str, deleted: bool) -> Tuple[str, Dict[str, object]]:
+    """
+    :param rng: Random generator
+    :param element_type: "node", "way" or "relation"
+    :param deleted: If the element is deleted, nodes then have no coordinates
+    :return: The XML element, and its expected values
+    """
+
+    expected = {
+        "type": element_type, "id": rng.randint(1, 10 ** 10), "version": rng.randint(1, 50),
+        "tags": {f"k{i}": rng.choice(VALUES) for i in range(rng.randint(0, 3))}, "lat": None, "nodes": (),
+        "members": ()
+    }
+
+    attributes = (f' id="{expected["id"]}" version="{expected["version"]}" changeset="7" uid="3" user="us&amp;er" '
+                  f'timestamp="2025-01-29T10:08:40Z" visible="{"false" if deleted else "true"}"')
+    children = [f"<tag k={quoteattr(k)} v={quoteattr(v)}/>" for k, v in expected["tags"].items()]
+
+    if element_type == "node" and not deleted:
+        expected["lat"] = round(rng.uniform(-90, 90), 7)
+        attributes += f' lat="{expected["lat"]}" lon="1.5"'
+
+    elif element_type == "way":
+        expected["nodes"] = tuple([rng.randint(1, 10 ** 10) for _ in range(rng.randint(0, 5))])
+        children.extend([f'<nd ref="{i}"/>' for i in expected["nodes"]])
+
+    elif element_type == "relation":
+        expected["members"] = tuple([("node", rng.randint(1, 100), rng.choice(["", "stop"])) for _ in range(3)])
+        children.extend([f'<member type="{i[0]}" ref="{i[1]}" role="{i[2]}"/>' for i in expected["members"]])
+
+    return f"<{element_type}{attributes}>{''.join(children)}</{element_type}>", expected
+
+
+def random_document(rng: random.Random) -> Tuple[bytes, List[Tuple[OSMChangeAction, Dict[str, object]]]]:
+    """
+    :param rng: Random generator
+    :return: A random osmChange document and its expected changes
+    """
+
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n<osmChange version="0.6" generator="test">']
+    expected = []
+
+    for _ in range(rng.randint(0, 6)):
+        action = rng.choice(list(OSMChangeAction))
+        parts.append(f"\n  <{action.value}>")
+
+        for _ in range(rng.randint(1, 5)):
+            xml, values = random_element(rng, rng.choice(["node", "way", "relation"]), action == OSMChangeAction.DELETE)
+            parts.append(f"\n    {xml}")
+            expected.append((action, values))
+
+        parts.append(f"\n  </{action.value}>")
+
+    parts.append("\n</osmChange>\n")
+
+    return "".join(parts).encode(), expected
+
+
+def values(change: OSMChange) -> Tuple[OSMChangeAction, Dict[str, object]]:
+    element = change.element
+
+    return change.action, {
+        "type": element.type, "id": element.id, "version": element.version, "tags": dict(element.tags),
+        "lat": element.lat, "nodes": element.nodes, "members": element.members
+    }
+
+
+class TestOsmChangeStream(unittest.IsolatedAsyncioTestCase):
+    async def test_chunk_boundaries(self) -> None:
+        rng = random.Random(19)
+
+        for i in range(100):
+            body, expected = random_document(rng)
+            chunks = split_randomly(body, rng, rng.choice([3, 7, 64, 4096]))
+
+            with self.subTest(document=i):
+                self.assertEqual([values(i) async for i in iter_osm_change(iter_list(chunks))], expected)
+
+    async def test_attributes(self) -> None:
+        body = (b'<osmChange version="0.6"><delete><node id="1" version="2" changeset="7" uid="3" user="us&amp;er" '
+                b'visible="false" timestamp="2025-01-29T10:08:40Z"/></delete></osmChange>')
+
+        changes = [i async for i in iter_osm_change(iter_list([body]))]
+
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0].action, OSMChangeAction.DELETE)
+        self.assertEqual(changes[0].element.user, "us&er")
+        self.assertFalse(changes[0].element.visible)
+        self.assertIsNone(changes[0].element.lat)
+        self.assertEqual(changes[0].element.timestamp.year, 2025)
+
+    async def test_truncated_document(self) -> None:
+        rng = random.Random(190)
+
+        for i in range(50):
+            body, expected = random_document(rng)
+            cut = rng.randint(1, body.rindex(b"</osmChange>"))
+            changes = []
+
+            with self.subTest(document=i):
+                with self.assertRaises(ParseError):
+                    async for change in iter_osm_change(iter_list(split_randomly(body[:cut], rng, 64))):
+                        changes.append(values(change))
+
+                # Every change received before the cut is still yielded, in order
+                self.assertEqual(changes, expected[:len(changes)])
+
+
+class TestChangesetDiff(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.body, self.expected = random_document(random.Random(3))
+
+    def handler(self, url: str, headers: Dict[str, str]) -> OSMResponse:
+        if url.endswith("/changeset/1/download"):
+            return OSMResponse(url, 200, {}, self.body)
+
+        if url.endswith("/changeset/2/download"):
+            return OSMResponse(url, 200, {}, self.body[:len(self.body) // 2])
+
+        return OSMResponse(url, 404, {}, b"Not found")
+
+    async def test_fetch(self) -> None:
+        py_osm = build_py_osm(self.handler)
+
+        changes = await py_osm.fetch_changeset_diff(1)
+        summary = await py_osm.fetch_changeset_diff_summary(1)
+
+        self.assertEqual([values(i) for i in changes], self.expected)
+        self.assertEqual(summary.changes_count, len(self.expected))
+
+    async def test_truncated_response(self) -> None:
+        py_osm = build_py_osm(self.handler)
+
+        with self.assertRaises(ParseError):
+            await py_osm.fetch_changeset_diff(2)
+
+        with self.assertRaises(ParseError):
+            await py_osm.fetch_changeset_diff_summary(2)
+
+    async def test_missing_changeset(self) -> None:
+        py_osm = build_py_osm(self.handler)
+
+        self.assertEqual(await py_osm.fetch_changeset_diff(3), ())
@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Dict, List
+
+import aiohttp
+
+from .FakeTransport import FakeTransport
+from ..Network import OSMRateLimitedTransport
+from ..Network import OSMResponse
+from ..Network import OSMTokenBucket
+
+
+class Responses:
+    """
+    Answer requests with a list of statuses, one per request, the last one being repeated
+    """
+
+    def __init__(self, statuses: List[int | Exception], headers: Dict[str, str] | None = None) -> None:
+        self.statuses = statuses
+        self.headers = {} if headers is None else headers
+        self.times: List[float] = []
+
+    def __call__(self, url: str, headers: Dict[str, str]) -> OSMResponse:
+        status = self.statuses[min(len(self.times), len(self.statuses) - 1)]
+        self.times.append(time.monotonic())
+
+        if isinstance(status, Exception):
+            raise status
+
+        return OSMResponse(url, status, self.headers if status != 200 else {}, b"{}")
+
+
+class TestTokenBucket(unittest.IsolatedAsyncioTestCase):
+    async def test_rate(self) -> None:
+        bucket = OSMTokenBucket(rate=100, capacity=1)
+        start = time.monotonic()
+
+        for _ in range(11):
+            await bucket.acquire()
+
+        # The first token is available at once, the 10 others take 1 / rate seconds each
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    async def test_burst_up_to_capacity(self) -> None:
+        bucket = OSMTokenBucket(rate=1, capacity=5)
+        start = time.monotonic()
+
+        for _ in range(5):
+            await bucket.acquire()
+
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    async def test_pause(self) -> None:
+        bucket = OSMTokenBucket(rate=1000, capacity=10)
+        bucket.pause(0.1)
+        start = time.monotonic()
+
+        await bucket.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+class TestRateLimitedTransport(unittest.IsolatedAsyncioTestCase):
+    def build(self, responses: Responses, **kwargs) -> OSMRateLimitedTransport:
+        return OSMRateLimitedTransport(
+            FakeTransport(responses), requests_per_second=1000, backoff_base=0.001, **kwargs
+        )
+
+    async def test_retry_after_seconds_is_honoured(self) -> None:
+        responses = Responses([429, 200], {"Retry-After": "0.1"})
+
+        response = await self.build(responses).get("https://api.example/a")
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(len(responses.times), 2)
+        self.assertGreaterEqual(responses.times[1] - responses.times[0], 0.09)
+
+    async def test_retry_after_pauses_the_whole_host(self) -> None:
+        responses = Responses([429, 200], {"Retry-After": "0.1"})
+        transport = self.build(responses)
+
+        await transport.get("https://api.example/a")
+        start = time.monotonic()
+        await transport.get("https://api.example/b")
+
+        # The host rate was halved, but tokens are earned again
+        self.assertLess(time.monotonic() - start, 0.05)
+        self.assertEqual(transport.get_rate("https://api.example/c"), 500 + 1000 / 20 * 2)
+
+    def test_retry_after_http_date(self) -> None:
+        transport = self.build(Responses([200]), backoff_max=60)
+        date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+
+        self.assertAlmostEqual(transport._retry_after(OSMResponse("", 429, {"retry-after": date}, b"")), 30, delta=2)
+
+        # Capped by backoff_max, and never negative
+        date = format_datetime(datetime.now(timezone.utc) + timedelta(hours=1), usegmt=True)
+        self.assertEqual(transport._retry_after(OSMResponse("", 429, {"Retry-After": date}, b"")), 60)
+
+        date = format_datetime(datetime.now(timezone.utc) - timedelta(hours=1), usegmt=True)
+        self.assertEqual(transport._retry_after(OSMResponse("", 429, {"Retry-After": date}, b"")), 0)
+
+        self.assertIsNone(transport._retry_after(OSMResponse("", 429, {"Retry-After": "soon"}, b"")))
+        self.assertIsNone(transport._retry_after(OSMResponse("", 429, {}, b"")))
+
+    async def test_max_retries(self) -> None:
+        responses = Responses([503])
+
+        response = await self.build(responses, max_retries=2).get("https://api.example/a")
+
+        self.assertEqual(response.status, 503)
+        self.assertEqual(len(responses.times), 3)
+
+    async def test_client_statuses_are_not_retried(self) -> None:
+        responses = Responses([404, 200])
+
+        self.assertEqual((await self.build(responses).get("https://api.example/a")).status, 404)
+        self.assertEqual(len(responses.times), 1)
+
+    async def test_connection_errors_are_retried(self) -> None:
+        responses = Responses([aiohttp.ClientConnectionError(), 200])
+
+        self.assertEqual((await self.build(responses).get("https://api.example/a")).status, 200)
+
+        responses = Responses([aiohttp.ClientConnectionError()])
+
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            await self.build(responses, max_retries=1).get("https://api.example/a")
+
+        self.assertEqual(len(responses.times), 2)
+
+    async def test_throttling_halves_rate_down_to_minimum(self) -> None:
+        transport = self.build(Responses([429]), max_retries=0, min_requests_per_second=300)
+
+        for _ in range(3):
+            await transport.get("https://api.example/a")
+
+        self.assertEqual(transport.get_rate("https://api.example/a"), 300)
+
+        # Other hosts keep their own rate
+        self.assertEqual(transport.get_rate("https://other.example/a"), 1000)
+
+    async def test_stream_is_retried(self) -> None:
+        responses = Responses([502, 200], {"Retry-After": "0"})
+
+        async with self.build(responses).stream("https://api.example/a") as response:
+            self.assertEqual(response.status, 200)
+            self.assertEqual(b"".join([i async for i in response.iter_chunks()]), b"{}")
+
+        self.assertEqual(len(responses.times), 2)
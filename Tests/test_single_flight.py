@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import asyncio
+import unittest
+from typing import Dict
+
+from .FakeTransport import build_py_osm, json_response
+from .test_users import user
+from ..Network import OSMResponse
+from ..Network import OSMSingleFlight
+
+
+class Call:
+    """
+    Call waiting for release to be set, counting how many times it was started and cancelled
+    """
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.started = 0
+        self.cancelled = 0
+        self.error: Exception | None = None
+
+    async def __call__(self) -> str:
+        self.started += 1
+
+        try:
+            await self.release.wait()
+
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+        if self.error is not None:
+            raise self.error
+
+        return f"result {self.started}"
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_are_shared(self) -> None:
+        flight = OSMSingleFlight()
+        call = Call()
+
+        tasks = [asyncio.ensure_future(flight.run("key", call)) for _ in range(5)]
+        await asyncio.sleep(0)
+
+        self.assertEqual(len(flight), 1)
+
+        call.release.set()
+
+        self.assertEqual(await asyncio.gather(*tasks), ["result 1"] * 5)
+        self.assertEqual(call.started, 1)
+        self.assertEqual(len(flight), 0)
+
+        # Finished calls aren't given to later callers
+        self.assertEqual(await flight.run("key", call), "result 2")
+
+    async def test_different_keys_arent_shared(self) -> None:
+        flight = OSMSingleFlight()
+        call = Call()
+        call.release.set()
+
+        await asyncio.gather(flight.run("a", call), flight.run("b", call))
+
+        self.assertEqual(call.started, 2)
+
+    async def test_exceptions_are_shared(self) -> None:
+        flight = OSMSingleFlight()
+        call = Call()
+        call.error = ValueError("failed")
+
+        tasks = [asyncio.ensure_future(flight.run("key", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        call.release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.assertTrue(all([i is call.error for i in results]))
+        self.assertEqual(len(flight), 0)
+
+    async def test_cancelling_one_caller(self) -> None:
+        flight = OSMSingleFlight()
+        call = Call()
+
+        first = asyncio.ensure_future(flight.run("key", call))
+        second = asyncio.ensure_future(flight.run("key", call))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        call.release.set()
+
+        self.assertEqual(await second, "result 1")
+        self.assertTrue(first.cancelled())
+        self.assertEqual(call.cancelled, 0)
+
+    async def test_cancelling_every_caller(self) -> None:
+        flight = OSMSingleFlight()
+        call = Call()
+
+        tasks = [asyncio.ensure_future(flight.run("key", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        self.assertEqual(call.cancelled, 1)
+        self.assertEqual(len(flight), 0)
+
+        # A new caller starts a new call instead of getting the cancelled one
+        call.release.set()
+        self.assertEqual(await flight.run("key", call), "result 2")
+
+
+class TestCoalescedRequests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_user_requests(self) -> None:
+        async def handler(url: str, headers: Dict[str, str]) -> OSMResponse:
+            await asyncio.sleep(0.01)
+            return json_response(url, {"user": user(int(url.split("/")[-1].split(".")[0]))})
+
+        py_osm = build_py_osm(handler, coalesce_requests=True)
+
+        users = await asyncio.gather(*[py_osm.fetch_user_info(i % 2 + 1) for i in range(6)])
+
+        self.assertEqual([i.uid for i in users], [1, 2] * 3)
+        self.assertEqual(len(py_osm.transport.requests), 2)
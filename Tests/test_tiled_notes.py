@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import random
+import unittest
+from typing import Callable, Dict, List, Tuple
+
+from .FakeTransport import build_py_osm, json_response, query
+from ..Errors import OSMIncompleteResultError
+from ..Network import OSMResponse
+from ..Objects import OSMBoundingBox
+
+
+def note(note_id: int, lon: float, lat: float) -> Dict[str, object]:
+    return {
+        "type": "Feature", "geometry": {"type": "Point", "coordinates": [lon, lat]},
+        "properties": {
+            "id": note_id, "url": "", "date_created": "2024-01-01 00:00:00 UTC", "status": "open", "comments": []
+        }
+    }
+
+
+class FakeNotesByBbox:
+    """
+    Answer /notes.json like the API: at most limit notes located in the bounding box
+    Requests of bounding boxes matching failing are answered with a 500 error
+    """
+
+    def __init__(
+            self,
+            notes: List[Dict[str, object]],
+            failing: Callable[[Tuple[float, ...]], bool] = lambda bbox: False
+    ) -> None:
+        self.notes = notes
+        self.failing = failing
+        self.bboxes: List[Tuple[float, ...]] = []
+
+    def __call__(self, url: str, headers: Dict[str, str]) -> OSMResponse:
+        left, bottom, right, top = [float(i) for i in query(url)["bbox"].split(",")]
+
+        if self.failing((left, bottom, right, top)):
+            return OSMResponse(url, 500, {}, b"Internal error")
+
+        self.bboxes.append((left, bottom, right, top))
+
+        matching = [
+            i for i in self.notes
+            if left <= i["geometry"]["coordinates"][0] <= right and bottom <= i["geometry"]["coordinates"][1] <= top
+        ]
+
+        return json_response(url, {"type": "FeatureCollection", "features": matching[:int(query(url)["limit"])]})
+
+
+class TestTiledNotes(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        rng = random.Random(1)
+        self.notes = [note(i, rng.uniform(-20, 20), rng.uniform(-10, 10)) for i in range(300)]
+
+    async def test_large_bbox_is_split_under_notes_area(self) -> None:
+        api = FakeNotesByBbox(self.notes)
+        py_osm = build_py_osm(api)
+
+        result = await py_osm.fetch_notes_by_tiled_bbox(OSMBoundingBox(-20, -10, 20, 10), closed=-1, limit=10000)
+
+        self.assertEqual(sorted([i.id for i in result]), list(range(300)))
+        self.assertGreater(len(api.bboxes), 1)
+
+        for left, bottom, right, top in api.bboxes:
+            self.assertLessEqual((right - left) * (top - bottom), 25 + 1e-9)
+
+    async def test_saturated_tiles_are_subdivided(self) -> None:
+        py_osm = build_py_osm(FakeNotesByBbox(self.notes))
+
+        result = await py_osm.fetch_notes_by_tiled_bbox(OSMBoundingBox(-20, -10, 20, 10), limit=5, max_depth=10)
+
+        # Notes on tiles borders are returned by several tiles, but only once
+        self.assertEqual(sorted([i.id for i in result]), list(range(300)))
+
+    async def test_bbox_crossing_date_line(self) -> None:
+        notes = [note(1, 179.5, 0), note(2, -179.5, 0), note(3, 0, 0)]
+        py_osm = build_py_osm(FakeNotesByBbox(notes))
+
+        result = await py_osm.fetch_notes_by_tiled_bbox(OSMBoundingBox(179, -1, -179, 1), limit=100)
+
+        self.assertEqual(sorted([i.id for i in result]), [1, 2])
+
+    async def test_failed_tile_raises_with_partial_result(self) -> None:
+        # Tiles west of the meridian fail
+        py_osm = build_py_osm(FakeNotesByBbox(self.notes, lambda bbox: bbox[2] <= 0))
+
+        with self.assertRaises(OSMIncompleteResultError) as context:
+            await py_osm.fetch_notes_by_tiled_bbox(OSMBoundingBox(-20, -10, 20, 10), limit=10000)
+
+        self.assertGreater(len(context.exception.failed), 0)
+        self.assertTrue(all([i.right <= 0 for i in context.exception.failed]))
+
+        expected = [i["properties"]["id"] for i in self.notes if i["geometry"]["coordinates"][0] > 0]
+        self.assertEqual(sorted([i.id for i in context.exception.result]), sorted(expected))
+
+    async def test_tiles_saturated_after_max_depth_raise(self) -> None:
+        # Every note at the same place, so subdividing never helps
+        notes = [note(i, 1.5, 1.5) for i in range(20)]
+        py_osm = build_py_osm(FakeNotesByBbox(notes))
+
+        with self.assertRaises(OSMIncompleteResultError) as context:
+            await py_osm.fetch_notes_by_tiled_bbox(OSMBoundingBox(0, 0, 4, 4), limit=5, max_depth=2)
+
+        self.assertEqual(len(context.exception.result), 5)
+        self.assertGreater(len(context.exception.failed), 0)
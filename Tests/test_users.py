@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import asyncio
+import unittest
+from typing import Dict, List
+
+from .FakeTransport import build_py_osm, json_response, query
+from ..Network import OSMResponse
+
+
+def user(uid: int) -> Dict[str, object]:
+    return {
+        "id": uid, "display_name": f"user {uid}", "account_created": "2021-09-14T20:01:00Z", "description": "",
+        "contributor_terms": {"agreed": True}, "roles": [], "changesets": {"count": 0}, "traces": {"count": 0},
+        "blocks": {"received": {"count": 0, "active": 0}}
+    }
+
+
+class FakeUsers:
+    """
+    Answer /users.json like the API, for users whose UID is even, keeping the number of requests in flight
+    """
+
+    def __init__(self) -> None:
+        self.chunks: List[List[int]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, url: str, headers: Dict[str, str]) -> OSMResponse:
+        uid = [int(i) for i in query(url)["users"].split(",")]
+        self.chunks.append(uid)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        await asyncio.sleep(0.001)
+
+        self.in_flight -= 1
+
+        existing = [i for i in uid if i % 2 == 0]
+
+        if not existing:
+            return OSMResponse(url, 404, {}, b"")
+
+        return json_response(url, {"users": [{"user": user(i)} for i in existing]})
+
+
+class TestUsers(unittest.IsolatedAsyncioTestCase):
+    async def test_chunks_and_concurrency(self) -> None:
+        api = FakeUsers()
+        py_osm = build_py_osm(api)
+
+        result = await py_osm.fetch_users_info_map(list(range(100, 0, -1)) + [2, 4], chunk_size=7, max_concurrency=3)
+
+        self.assertEqual(list(result.keys()), list(range(100, 0, -1)))
+        self.assertEqual([i for i, value in result.items() if value is not None], list(range(100, 0, -2)))
+        self.assertTrue(all([value.uid == i for i, value in result.items() if value is not None]))
+
+        # Duplicated UIDs are only requested once
+        self.assertEqual(sorted(sum(api.chunks, [])), list(range(1, 101)))
+        self.assertTrue(all([len(i) <= 7 for i in api.chunks]))
+        self.assertLessEqual(api.max_in_flight, 3)
+
+    async def test_fetch_users_info_keeps_order(self) -> None:
+        py_osm = build_py_osm(FakeUsers())
+
+        result = await py_osm.fetch_users_info([8, 3, 2, 6], chunk_size=2)
+
+        self.assertEqual([i.uid for i in result], [8, 2, 6])
+
+    async def test_chunk_without_existing_users(self) -> None:
+        py_osm = build_py_osm(FakeUsers())
+
+        self.assertEqual(await py_osm.fetch_users_info_map([1, 3], chunk_size=2), {1: None, 3: None})
+
+    async def test_iter_users_info(self) -> None:
+        py_osm = build_py_osm(FakeUsers())
+
+        result = [i.uid async for i in py_osm.iter_users_info(range(1, 21), chunk_size=4)]
+
+        self.assertEqual(sorted(result), list(range(2, 21, 2)))
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MIT
 # Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
 
+from .Cache import OSMMemoryCache
 from .Capabilities import ChangesetCapabilities
 from .Capabilities import NoteCapabilities
 from .Capabilities import OSMCapabilities
@@ -8,12 +9,42 @@ from .Capabilities import StatusCapabilities
 from .Enums import OSMOrder
 from .Enums import OSMSort
 from .Enums import OSMStatus
+from .Errors import OSMIncompleteResultError
+from .Feeds import OSMChangesetReplication
+from .Feeds import OSMNoteWatcher
+from .Frames import OSMBoundingBoxArray
+from .Frames import OSMChangesetFrame
+from .Frames import OSMElementTable
+from .Frames import OSMMapData
+from .Frames import OSMMapDataBuilder
+from .Index import OSMSpatialIndex
+from .Network import OSMBatcher
+from .Network import OSMCachedTransport
+from .Network import OSMCassette
+from .Network import OSMHTTPTransport
+from .Network import OSMRateLimitedTransport
+from .Network import OSMRecordTransport
+from .Network import OSMReplayTransport
+from .Network import OSMResponse
+from .Network import OSMResponseCache
+from .Network import OSMSingleFlight
+from .Network import OSMStreamResponse
+from .Network import OSMTokenBucket
+from .Network import OSMTransport
+from .Network import get_json_decoder_name
+from .Network import set_json_decoder
 from .Objects import OSMBoundingBox
+from .Objects import OSMChange
+from .Objects import OSMChangeAction
 from .Objects import OSMChangeset
 from .Objects import OSMChangesetComment
+from .Objects import OSMChangesetDiffSummary
 from .Objects import OSMChangesetTags
+from .Objects import OSMElement
 from .Objects import OSMNote
 from .Objects import OSMNoteComment
+from .Objects import OSMNoteEvent
+from .Objects import OSMNoteEventType
 from .Objects import OSMTimeDelta
 from .Objects import OSMUser
 from .PyOsm import PyOSM
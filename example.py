@@ -151,5 +151,7 @@ async def main():
         # <OSMChangeset object: id=161713430, user=Chepycou, created_at=2025-01-24 13:53:31+00:00, tags=<OSMChangesetTags: {"comment": "Survey if places still exist", "created_by": "StreetComplete_ee 60.0", "source": "survey", "locale": "fr", "custom_tags": {"StreetComplete:quest_type": "CheckShopExistence"}}>>
         # <OSMChangeset object: id=161514672, user=Chepycou, created_at=2025-01-19 07:38:34+00:00, tags=<OSMChangesetTags: {"comment": "Edit element", "created_by": "StreetComplete_ee 60.0", "source": "survey", "locale": "fr", "custom_tags": {"StreetComplete:quest_type": "TagEdit"}}>>
 
+    await py_osm.close()  # Closes the connections kept open by PyOSM
+
 
 asyncio.run(main())
\ No newline at end of file
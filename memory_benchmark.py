@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2024 picasso2005 <clementduran0@gmail.com> - All Rights Reserved
+
+import json
+import sys
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, Mapping, Tuple
+
+from Objects import OSMBoundingBox
+from Objects import OSMChangeset
+from Objects import OSMNote
+from Objects import OSMUser
+
+# This script measures the memory kept by each object built from a typical API response, and compares it to the
+# baseline representation, where every object has a __dict__, strings aren't interned and attributes are built eagerly
+# Run it from this folder: python memory_benchmark.py
+# It exits with code 1 if any object doesn't use at least MINIMUM_REDUCTION less memory than its baseline
+
+COUNT = 20000
+
+# Minimum part of the baseline memory each compact object must save
+MINIMUM_REDUCTION = 0.1
+
+CHANGESET = {
+    "type": "changeset", "id": 161890648, "created_at": "2025-01-29T10:08:40Z", "open": False, "comments_count": 0,
+    "changes_count": 3, "closed_at": "2025-01-29T10:08:41Z", "min_lat": 43.5814462, "min_lon": 1.5089116,
+    "max_lat": 43.5815462, "max_lon": 1.5090116, "uid": 14112053, "user": "Chepycou",
+    "tags": {
+        "comment": "Updated a kindergarten", "created_by": "Organic Maps android 2024.11.27-12-FDroid", "locale": "fr",
+        "source": "survey"
+    }
+}
+
+NOTE = {
+    "type": "Feature", "geometry": {"type": "Point", "coordinates": [1.5089116, 43.5814462]},
+    "properties": {
+        "id": 4482167, "url": "https://api.openstreetmap.org/api/0.6/notes/4482167.json", "date_created":
+            "2024-10-17 08:22:50 UTC", "status": "open", "comments": [
+            {
+                "date": "2024-10-17 08:22:50 UTC", "uid": 14112053, "user": "Chepycou",
+                "user_url": "https://api.openstreetmap.org/user/Chepycou", "action": "opened",
+                "text": "Missing a building here", "html": "<p>Missing a building here</p>"
+            }
+        ]
+    }
+}
+
+USER = {
+    "id": 14112053, "display_name": "Chepycou", "account_created": "2021-09-14T20:01:00Z", "description": "",
+    "contributor_terms": {"agreed": True}, "roles": [], "changesets": {"count": 3297}, "traces": {"count": 0},
+    "blocks": {"received": {"count": 0, "active": 0}}
+}
+
+
+class _Baseline:
+    """
+    Baseline representation of an object: the same attributes, stored in a per-instance __dict__
+    """
+
+
+def baseline(value: object) -> object:
+    """
+    Copy an object into its baseline representation. Nested objects are copied too, strings are copied so they're
+    neither interned nor shared, and lazy attributes are built
+    :param value: An object, or one of its attributes
+    :return: The copy
+    """
+
+    if isinstance(value, str):
+        return value.encode().decode()
+
+    if isinstance(value, datetime):
+        return value.replace()
+
+    if isinstance(value, (list, tuple)):
+        return type(value)([baseline(i) for i in value])
+
+    if isinstance(value, Mapping):
+        return {key: baseline(item) for key, item in value.items()}
+
+    if hasattr(type(value), "__slots__"):
+        copy = _Baseline()
+
+        # Slots of lazy attributes are named after their property, e.g. _created_at for created_at
+        for name in [i.lstrip("_") for i in type(value).__slots__]:
+            if hasattr(value, name):
+                setattr(copy, name, baseline(getattr(value, name)))
+
+        return copy
+
+    return value
+
+
+def measure(build: Callable[[dict], object], sample: dict) -> float:
+    """
+    Measure the memory kept per object when building COUNT objects
+    Json responses are decoded while measuring, so parts of them kept alive by objects (e.g. the whole response for
+    lazy ones) are counted
+
+    :param build: Function building an object from a json response
+    :param sample: The json response
+    :return: Number of bytes per object
+    """
+
+    encoded = json.dumps(sample)
+
+    tracemalloc.start()
+    objects = [build(json.loads(encoded)) for _ in range(COUNT)]
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del objects
+
+    return allocated / COUNT
+
+
+def main() -> int:
+    # Name: (build, json response, whether it must be smaller than its baseline)
+    benchmarks: Dict[str, Tuple[Callable[[dict], object], dict, bool]] = {
+        "OSMBoundingBox": (
+            lambda i: OSMBoundingBox(i["min_lon"], i["min_lat"], i["max_lon"], i["max_lat"]), CHANGESET, True
+        ),
+        "OSMUser": (OSMUser, USER, True),
+        "OSMNote": (OSMNote, NOTE, True),
+        "OSMChangeset": (OSMChangeset, CHANGESET, True),
+        # Lazy objects keep their json response until built, they save time rather than memory
+        "OSMChangeset (lazy)": (lambda i: OSMChangeset(i, lazy=True), CHANGESET, False),
+    }
+
+    failed = False
+
+    for name, (build, sample, checked) in benchmarks.items():
+        allocated = measure(build, sample)
+        reference = measure(lambda i: baseline(build(i)), sample)
+        reduction = 1 - allocated / reference
+
+        if not checked:
+            status = "not checked"
+
+        elif reduction >= MINIMUM_REDUCTION:
+            status = "OK"
+
+        else:
+            status = "NOT ENOUGH"
+            failed = True
+
+        print(f"{name:<22} {allocated:>8.1f} bytes / {reference:>8.1f} bytes baseline  {reduction:>6.1%}  {status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())